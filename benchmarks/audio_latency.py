@@ -0,0 +1,140 @@
+#!/usr/bin/python
+"""
+audio_latency.py
+
+DESCRIPTION:
+  Benchmark measuring, for each mixer profile in config.py, the time from
+  a KEYDOWN event being posted to the buzz sound's Sound.play call
+  returning, through the same event handling and AudioPlayer.play path
+  the game uses. Keys are posted from another thread at random intervals
+  while the loop is paced as the game paces it, both idle (waiting on
+  events, as while players may buzz in) and active (ticking at FPS_LIMIT).
+
+  The mixer's queue depth, the audio already queued ahead of any new
+  sound, is reported alongside as the profile's buffer in samples and
+  milliseconds. The estimated time from key to sound is the sum of the
+  two.
+
+  SDL's dummy audio and video drivers are used, so no sound is heard
+  and no window opens.
+
+USAGE:
+  From the JeoparPy root directory:
+    python benchmarks/audio_latency.py [-n PRESSES]
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+###############################################################################
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure key press to buzz sound latency per profile.')
+    parser.add_argument('-n', '--presses', type=int, default=50,
+                        help='key presses per profile and mode (default 50)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_profile(args.child, args.presses)
+        return
+
+    from jeoparpy.config import MIXER_PROFILES
+
+    print ('{0:<11} {1:<7} {2:>15} {3:>15} {4:>17} {5:>13}'.format(
+        'profile', 'mode', 'key->play med', 'key->play p95',
+        'queue depth', 'est. total'))
+
+    for name in sorted(MIXER_PROFILES):
+        cmd = [sys.executable, os.path.abspath(__file__), '--child', name,
+               '-n', str(args.presses)]
+        sys.stdout.write(subprocess.check_output(cmd, cwd=ROOT))
+
+def run_profile(name, presses):
+    """Print one line of results per pacing mode for profile 'name.'"""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    import pygame
+    from pygame.locals import KEYDOWN
+
+    from jeoparpy.config import FPS_LIMIT, MIXER_PROFILES
+    from jeoparpy.framepacer import FramePacer
+    from jeoparpy.ui.audioplayer import AudioPlayer
+    from jeoparpy.ui.resmaps import SOUNDS
+
+    profile = MIXER_PROFILES[name]
+    pygame.mixer.pre_init(profile['frequency'], -16, 2, profile['buffer'])
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.set_allowed(None)
+    pygame.event.set_allowed([KEYDOWN])
+
+    player = AudioPlayer({'buzz' : SOUNDS['buzz']},
+                         dedicated=profile['reserved'])
+    player.sounds.warm(['buzz'])
+    freq, size, channels = pygame.mixer.get_init()
+    depthMS = 1000.0 * profile['buffer'] / freq
+
+    for mode in ('idle', 'active'):
+        pacer = FramePacer(FPS_LIMIT)
+        latencies = []
+        poster = threading.Thread(target=_post_keys, args=(presses, ))
+        poster.start()
+
+        while True:
+            for event in pygame.event.get():
+                if event.type == KEYDOWN:
+                    # As Controller does on BUZZ_IN
+                    player.stop_all()
+                    player.play('buzz')
+                    latencies.append(time.time() - event.sent)
+
+            if len(latencies) >= presses:
+                break
+            elif mode == 'idle':
+                pacer.wait()
+            else:
+                pacer.tick()
+
+        poster.join()
+        latencies = sorted(1000 * x for x in latencies)
+        median = latencies[len(latencies) / 2]
+
+        print ('{0:<11} {1:<7} {2:>12.2f} ms {3:>12.2f} ms '
+               '{4:>5} ({5:>5.1f} ms) {6:>10.2f} ms'.format(
+                   name, mode, median,
+                   latencies[int(.95 * (len(latencies) - 1))],
+                   profile['buffer'], depthMS, median + depthMS))
+
+    pygame.quit()
+
+def _post_keys(presses):
+    """Post 'presses' KEYDOWN events, each stamped with when it was sent."""
+    import pygame
+    from pygame.locals import KEYDOWN, K_1
+
+    for _ in xrange(presses):
+        time.sleep(random.uniform(.02, .08))
+        pygame.event.post(pygame.event.Event(KEYDOWN, key=K_1, mod=0,
+                                             sent=time.time()))
+
+###############################################################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+"""
+cluebank.py
+
+DESCRIPTION:
+  Benchmark of building boards from a large clue bank (see
+  jeoparpy/game/cluebank.py). Fills a new bank with the requested number
+  of clues, then reports the time taken to fill it and to build a board
+  from it, each build choosing the least recently used clues, and the
+  number of random boards generated from it per second.
+
+USAGE:
+  From the JeoparPy root directory:
+    python benchmarks/cluebank.py [-c CLUES] [-b BUILDS] [-g GENERATES]
+                                  [-s SESSIONS]
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from jeoparpy.game.cluebank import ClueBank
+
+# Board shape: categories per board, and clues (rows) per category
+CATEGORIES = 5
+ROWS = 5
+
+###############################################################################
+def main():
+    parser = argparse.ArgumentParser(description='Time clue bank boards.')
+    parser.add_argument('-c', '--clues', type=int, default=1000000,
+                        help='number of clues in the bank (default 1000000)')
+    parser.add_argument('-b', '--builds', type=int, default=100,
+                        help='boards to build (default 100)')
+    parser.add_argument('-g', '--generates', type=int, default=1000,
+                        help='boards to generate (default 1000)')
+    parser.add_argument('-s', '--sessions', type=int, default=10,
+                        help='sessions whose clues are not generated '
+                             'again (default 10)')
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    try:
+        bank = ClueBank(path)
+
+        start = time.time()
+        bank.add_clues(generate_clues(args.clues))
+        print 'fill {0} clues: {1:8.2f} s ({2:.1f} MB)'.format(
+            args.clues, time.time() - start, os.path.getsize(path) / 1048576.0)
+
+        bank.add_board('bench', ['CATEGORY %d' % c for c in
+                                 xrange(CATEGORIES)],
+                       [200 * (r + 1) for r in xrange(ROWS)])
+
+        times = []
+        for _ in xrange(args.builds):
+            start = time.time()
+            bank.build_board('bench')
+            times.append(time.time() - start)
+
+        times.sort()
+        print 'build board: {0:8.2f} ms median, {1:.2f} ms max'.format(
+            1000 * times[len(times) // 2], 1000 * times[-1])
+
+        amounts = [200 * (r + 1) for r in xrange(ROWS)]
+        start = time.time()
+        for seed in xrange(args.generates):
+            bank.generate_board(CATEGORIES, amounts, seed, args.sessions)
+        elapsed = time.time() - start
+        print 'generate board: {0:8.0f} boards/s ({1:.2f} ms each)'.format(
+            args.generates / elapsed, 1000 * elapsed / args.generates)
+
+        bank.close()
+    finally:
+        os.remove(path)
+
+def generate_clues(numClues):
+    """
+    Yield 'numClues' clues spread over categories of 'ROWS' difficulties,
+    each category holding 25 clues (5 per difficulty).
+    """
+    for i in xrange(numClues):
+        yield ('CATEGORY %d' % (i // (5 * ROWS)), i % ROWS + 1,
+               ('THIS IS CLUE NUMBER %d, WHOSE TEXT IS ABOUT AS LONG AS A '
+                'TYPICAL CLUE ON THE BOARD.' % i, ))
+
+###############################################################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+"""
+cluefile.py
+
+DESCRIPTION:
+  Benchmark of indexing a large clue bank with ClueFile (see
+  jeoparpy/game/cluefile.py). Writes a clues file of the requested size,
+  then reports the time taken to index it and read clues at random, and
+  how much the process's peak memory grew while doing so.
+
+USAGE:
+  From the JeoparPy root directory:
+    python benchmarks/cluefile.py [-c CLUES] [-r READS]
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from jeoparpy.game.cluefile import ClueFile
+
+###############################################################################
+def main():
+    parser = argparse.ArgumentParser(description='Time clue bank indexing.')
+    parser.add_argument('-c', '--clues', type=int, default=500000,
+                        help='number of clues in the bank (default 500000)')
+    parser.add_argument('-r', '--reads', type=int, default=10000,
+                        help='clues to read at random (default 10000)')
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write_bank(f, args.clues)
+        print 'bank: {0} clues, {1:.1f} MB'.format(
+            args.clues, os.path.getsize(path) / 1048576.0)
+
+        peak = get_peak_kb()
+        start = time.time()
+        clues = ClueFile(path)
+        print 'index:       {0:8.2f} s'.format(time.time() - start)
+
+        start = time.time()
+        for _ in xrange(args.reads):
+            clues[random.randrange(len(clues))]
+        print 'read {0}: {1:8.2f} ms per clue'.format(
+            args.reads, 1000 * (time.time() - start) / args.reads)
+
+        print 'peak memory growth: {0:.1f} MB'.format(
+            (get_peak_kb() - peak) / 1024.0)
+    finally:
+        os.remove(path)
+
+def get_peak_kb():
+    """Return peak resident memory of this process so far, in KB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def write_bank(f, numClues):
+    for i in xrange(numClues):
+        f.write('THIS IS CLUE NUMBER %d, WHOSE TEXT IS ABOUT AS LONG AS A '
+                'TYPICAL CLUE ON THE BOARD.\n' % i)
+        if i % 3 == 0:
+            f.write('IT HAS A SECOND LINE.\n')
+        f.write('\n')
+
+###############################################################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python
+"""
+first_frame.py
+
+DESCRIPTION:
+  Benchmark measuring cold startup: the time from launching
+  `python start.py -s' in a new process until the game board's first
+  frame is drawn, and how much of that is spent importing jeoparpy.main.
+
+USAGE:
+  From the JeoparPy root directory:
+    python benchmarks/first_frame.py [-n RUNS] [--headless]
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prints time taken to import main, with the flags start.py would set
+_IMPORT_MAIN = ('import time; t = time.time(); import jeoparpy.main; '
+                'print time.time() - t')
+
+###############################################################################
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time cold startup until the first board frame.')
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                        help='number of runs (default 5)')
+    parser.add_argument('--headless', action='store_true',
+                        help='use SDL dummy video and audio drivers')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.headless:
+        env['SDL_VIDEODRIVER'] = 'dummy'
+        env['SDL_AUDIODRIVER'] = 'dummy'
+
+    results = (
+        ('import main', [time_import(env) for _ in xrange(args.runs)]),
+        ('first frame', [time_first_frame(env) for _ in xrange(args.runs)]),
+    )
+
+    for label, times in results:
+        times.sort()
+        print '{0:<12} min {1:.3f} s  median {2:.3f} s'.format(
+            label, times[0], times[len(times) / 2])
+
+def time_first_frame(env):
+    """
+    Return seconds from launching `start.py -s -t' until it reports the
+    first board frame.
+    """
+    cmd = [sys.executable, '-u', 'start.py', '-s', '-t', '-w']
+    start = time.time()
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.PIPE)
+
+    for line in iter(proc.stdout.readline, ''):
+        if line.startswith('first board frame'):
+            elapsed = time.time() - start
+            break
+    else:
+        raise RuntimeError('start.py exited before drawing the board')
+
+    proc.wait()
+
+    return elapsed
+
+def time_import(env):
+    """Return seconds taken to import jeoparpy.main in a new process."""
+    out = subprocess.check_output([sys.executable, '-c', _IMPORT_MAIN],
+                                  cwd=ROOT, env=env)
+
+    return float(out.split()[-1])
+
+###############################################################################
+if __name__ == '__main__':
+    main()
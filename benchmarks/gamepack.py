@@ -0,0 +1,97 @@
+#!/usr/bin/python
+"""
+gamepack.py
+
+DESCRIPTION:
+  Benchmark of game pack loading (see jeoparpy/game/gamepack.py). Builds
+  a pack for a board with one media file per clue, then times opening it
+  and reading the game data, and extracting its media the first time and
+  on later runs.
+
+USAGE:
+  From the JeoparPy root directory:
+    python benchmarks/gamepack.py [-m MEDIA] [--media-bytes BYTES]
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from jeoparpy.game.gamedata import GameData
+from jeoparpy.game.gamepack import compile_pack, MEDIA_KINDS
+
+###############################################################################
+def main():
+    parser = argparse.ArgumentParser(description='Time game pack loading.')
+    parser.add_argument('-m', '--media', type=int, default=1000,
+                        help='number of clues, each with a media file '
+                             '(default 1000)')
+    parser.add_argument('--media-bytes', type=int, default=64 * 1024,
+                        help='size of each media file (default 65536)')
+    args = parser.parse_args()
+
+    workDir = tempfile.mkdtemp()
+    try:
+        packPath = build_pack(workDir, args.media, args.media_bytes)
+        print 'pack: {0} clues, {1:.1f} MB'.format(
+            args.media, os.path.getsize(packPath) / 1048576.0)
+
+        start = time.time()
+        gameData = GameData(packPath)
+        timed('open + read game data', start)
+
+        extractDir = os.path.join(workDir, 'extracted')
+        start = time.time()
+        gameData.pack.extract_media(extractDir)
+        timed('extract media (first run)', start)
+
+        start = time.time()
+        gameData.pack.extract_media(extractDir)
+        timed('extract media (later runs)', start)
+
+        gameData.pack.close()
+    finally:
+        shutil.rmtree(workDir)
+
+def build_pack(directory, numClues, mediaBytes):
+    """
+    Compile a pack in 'directory' with 'numClues' clues in 5 rows, each
+    with a distinct media file of 'mediaBytes' bytes. Return its path.
+    """
+    numCols = max(numClues / 5, 1)
+    media = dict((kind, {}) for kind in MEDIA_KINDS)
+
+    for i in xrange(numClues):
+        path = os.path.join(directory, 'clue%d.png' % i)
+        with open(path, 'wb') as f:
+            f.write(os.urandom(mediaBytes))
+        media['IMAGES'][i / 5, i % 5] = path
+
+    clues = [[('Clue %d, %d' % (c, r), 'Answer') for r in xrange(5)]
+             for c in xrange(numCols)]
+    packPath = os.path.join(directory, 'bench.jpk')
+    compile_pack(packPath, ['Category %d' % c for c in xrange(numCols)],
+                 clues, (200, 400, 600, 800, 1000), ('A', 'B', 'C'), media)
+
+    return packPath
+
+def timed(label, start):
+    print '{0:<28} {1:8.2f} ms'.format(label, 1000 * (time.time() - start))
+
+###############################################################################
+if __name__ == '__main__':
+    main()
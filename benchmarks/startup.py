@@ -0,0 +1,105 @@
+#!/usr/bin/python
+"""
+startup.py
+
+DESCRIPTION:
+  Benchmark comparing the time taken to load every image and sound in
+  resmaps one file at a time against loading them with the threaded
+  asset loader, and against loading them with sounds read from the PCM
+  cache (see jeoparpy/ui/pcmcache.py). Each run happens in a fresh
+  process, so nothing in memory is reused between runs (though the
+  operating system may still cache the files).
+
+USAGE:
+  From the JeoparPy root directory:
+    python benchmarks/startup.py [-n RUNS] [-t THREADS] [--headless]
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+###############################################################################
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare serial and threaded asset loading times.')
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                        help='runs of each mode (default 5)')
+    parser.add_argument('-t', '--threads', type=int, default=4,
+                        help='threads for the parallel mode (default 4)')
+    parser.add_argument('--headless', action='store_true',
+                        help='use SDL dummy video and audio drivers')
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--cached', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    if args.child is not None:
+        print time_load(args.child, args.cached)
+        return
+
+    # The first cached run fills the cache; it is not counted
+    run_child(args.threads, args.headless, True)
+    modes = (('serial', 1, False), ('parallel', args.threads, False),
+             ('cached', args.threads, True))
+
+    for label, threads, cached in modes:
+        times = sorted(run_child(threads, args.headless, cached)
+                       for _ in xrange(args.runs))
+        print '{0:<8} ({1} thread{2}): min {3:.3f} s  median {4:.3f} s'.format(
+            label, threads, '' if threads == 1 else 's',
+            times[0], times[len(times) / 2])
+
+def run_child(threads, headless, cached):
+    """Return load time, in seconds, measured in a new process."""
+    cmd = [sys.executable, os.path.abspath(__file__), '--child', str(threads)]
+    if headless:
+        cmd.append('--headless')
+    if cached:
+        cmd.append('--cached')
+
+    return float(subprocess.check_output(cmd, cwd=ROOT).split()[-1])
+
+def time_load(threads, cached):
+    """
+    Initialize pygame, then return time taken to load all assets.
+    Sounds are decoded unless 'cached' is set.
+    """
+    import time
+
+    sys.path.insert(0, ROOT)
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((640, 360))
+
+    from jeoparpy.ui.assetloader import load_assets
+    from jeoparpy.ui.pcmcache import pcm
+    from jeoparpy.ui.resmaps import CLUE_READS, IMAGES, SOUNDS
+
+    if not cached:
+        pcm.directory = None
+
+    start = time.time()
+    load_assets(IMAGES.values(), SOUNDS.values() + CLUE_READS.values(),
+                threads)
+
+    return time.time() - start
+
+###############################################################################
+if __name__ == '__main__':
+    main()
@@ -44,10 +44,69 @@ FULLSCREEN = 0
 # problems running the game at this speed.
 FPS_LIMIT = 100
 
+# When True, the game sleeps while nothing on screen is moving (e.g. while
+# waiting for a clue to be chosen), and only runs at FPS_LIMIT while
+# something is animating. Set to False to always run at FPS_LIMIT.
+IDLE_FRAME_PACING = True
+
+###############################################################################
+# AUDIO SETTINGS
+#===============
+#
+# Each mixer profile below sets:
+#   'frequency' : Sample rate of the mixer, in Hz. Game audio must be at
+#                 22050 Hz (see ui/resmaps.py), so this should not change.
+#   'buffer'    : Number of samples mixed at a time. Up to this much audio
+#                 is queued ahead of any sound that starts playing, so a
+#                 smaller buffer means less delay between a buzz-in and
+#                 its sound (4096 samples at 22050 Hz is about 186 ms;
+#                 512 is about 23 ms). If audio crackles or stutters,
+#                 use a profile with a larger buffer.
+#   'reserved'  : Names of sounds that each get a mixer channel of their
+#                 own, so they start at once even if every other channel
+#                 is in use.
+MIXER_PROFILES = {
+    'lowlatency' : {'frequency' : 22050, 'buffer' : 512,
+                    'reserved'  : ('buzz', 'wrong', 'outoftime')},
+    'balanced'   : {'frequency' : 22050, 'buffer' : 1024,
+                    'reserved'  : ('buzz', 'wrong', 'outoftime')},
+    'compatible' : {'frequency' : 22050, 'buffer' : 4096,
+                    'reserved'  : ()},
+}
+
+# This is the name of the mixer profile above that the game uses.
+MIXER_PROFILE = 'lowlatency'
+
 ###############################################################################
 # GAME SETTINGS
 #==============
 
+# This is the path of a game pack (see game/gamepack.py) to play, relative
+# to the JeoparPy root directory. If None, the game is read from the files
+# in res/text and the clue media listed in ui/resmaps.py.
+#
+# Passing a game pack's path to start.py will override this setting.
+GAME_PACK = None
+
+# To play a board from a clue bank (see game/cluebank.py) instead, set
+# CLUE_BANK to the path of its database, relative to the JeoparPy root
+# directory, and CLUE_BANK_BOARD to the name of the board. Player names
+# are still read from res/text/players.txt. GAME_PACK, if set, is used
+# instead.
+CLUE_BANK = None
+CLUE_BANK_BOARD = None
+
+# If CLUE_BANK is set and CLUE_BANK_BOARD is None, a board is generated
+# from the bank, with this many categories drawn at random and the
+# amounts in res/text/amounts.txt. No clue used in the last
+# CLUE_BANK_SESSIONS games played from the bank is drawn again.
+#
+# The same CLUE_BANK_SEED (any integer) generates the same board, given
+# the same bank and games played. If None, the board differs every game.
+CLUE_BANK_CATEGORIES = 5
+CLUE_BANK_SESSIONS = 10
+CLUE_BANK_SEED = None
+
 # This is the time in miliseconds after which a clue will timeout
 # if no player has buzzed in. This field should be an integer.
 # The default value is 20 seconds.
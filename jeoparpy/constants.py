@@ -23,6 +23,7 @@ ROOT_PATH = path.abspath(path.join(path.dirname(__file__), pardir))
 ANIMATIONEND = USEREVENT
 ANSWER_TIMEOUT = USEREVENT + 1
 AUDIOEND = USEREVENT + 2
+WAKEUP = USEREVENT + 3
 
 # Flags corresponding to args that can be provided to start.py
 # These must have distinct values
@@ -30,3 +31,5 @@ FULLSCREEN_FLAG = 0
 WINDOWED_FLAG = 1
 DEBUG_FLAG = 2
 SKIP_INTRO_FLAG = 3
+TIME_STARTUP_FLAG = 4
+REBUILD_CACHE_FLAG = 5
@@ -0,0 +1,126 @@
+"""
+framepacer.py
+
+DESCRIPTION:
+  Contains the FramePacer class, described below.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import os
+import time
+
+import pygame
+from pygame.locals import NOEVENT
+
+from constants import WAKEUP
+
+###############################################################################
+class FramePacer(object):
+    """
+    Paces the primary game loop. While anything is moving on screen, the
+    loop should call tick() once per frame to run at up to 'fps' frames
+    per second. While the game is idle, it should call wait() instead,
+    which sleeps until the next event arrives or a given deadline passes.
+
+    The number of frames, wall-clock time, and CPU time spent in each mode
+    are recorded; report() summarizes them.
+
+    ATTRIBUTES:
+      * clock
+      * fps
+
+    METHODS:
+      * report
+      * tick
+      * wait
+    """
+    ACTIVE = 'active'
+    IDLE = 'idle'
+
+    def __init__(self, fps, clock=None):
+        """
+        'clock' is the pygame.time.Clock to tick; one is created if it is
+        not provided.
+        """
+        self.fps = fps
+        self.clock = clock if clock else pygame.time.Clock()
+
+        # mode -> [frames, wall secs, cpu secs, longest frame secs]
+        self._stats = {self.ACTIVE: [0, 0.0, 0.0, 0.0],
+                       self.IDLE: [0, 0.0, 0.0, 0.0]}
+        self._lastWall = time.time()
+        self._lastCPU = _get_cpu_time()
+
+    def report(self):
+        """Return multi-line string summarizing time spent in each mode."""
+        lines = ['Frame pacing:']
+
+        for mode in (self.ACTIVE, self.IDLE):
+            frames, wall, cpu, longest = self._stats[mode]
+            lines.append(
+                '  {0:<6} {1:>7} frames {2:>9.1f} s wall {3:>7.1f}% cpu '
+                '{4:>7.2f} ms/frame avg {5:>8.2f} ms max'.format(
+                    mode, frames, wall, 100 * cpu / wall if wall else 0.0,
+                    1000 * wall / frames if frames else 0.0,
+                    1000 * longest))
+
+        return '\n'.join(lines)
+
+    def tick(self):
+        """End an active frame, limiting the frame rate to 'fps.'"""
+        self.clock.tick_busy_loop(self.fps)
+        self._record(self.ACTIVE)
+
+    def wait(self, deadline=None):
+        """
+        End an idle frame by sleeping until an event arrives, or until
+        pygame.time.get_ticks() reaches 'deadline' if provided.
+        The event that ends the wait is left on the queue to be handled.
+        """
+        if deadline is not None:
+            ms = deadline - pygame.time.get_ticks()
+
+            if ms <= 0:
+                self.tick()
+                return
+
+            pygame.time.set_timer(WAKEUP, ms)
+
+        event = pygame.event.wait()
+
+        if deadline is not None:
+            pygame.time.set_timer(WAKEUP, 0)
+
+        if event.type not in (WAKEUP, NOEVENT):
+            pygame.event.post(event)
+
+        # Keep the clock's frame timing current for the next active frame
+        self.clock.tick()
+        self._record(self.IDLE)
+
+    def _record(self, mode):
+        wall = time.time()
+        cpu = _get_cpu_time()
+        stats = self._stats[mode]
+
+        stats[0] += 1
+        stats[1] += wall - self._lastWall
+        stats[2] += cpu - self._lastCPU
+        stats[3] = max(stats[3], wall - self._lastWall)
+
+        self._lastWall = wall
+        self._lastCPU = cpu
+
+###############################################################################
+def _get_cpu_time():
+    """Return user + system CPU time used by this process, in seconds."""
+    t = os.times()
+
+    return t[0] + t[1]
@@ -0,0 +1,434 @@
+"""
+cluebank.py
+
+DESCRIPTION:
+  Contains the ClueBank class, described below, which keeps categories,
+  clues, and boards in a SQLite database, and ClueBankError.
+
+  A clue bank holds any number of clues, each with a category, a
+  difficulty (1 for the top row of the board, 2 for the next, etc.), its
+  text, and optionally the paths of an image, audio clue, and audio
+  reading. Relative paths are relative to the database's folder.
+
+  A board names the categories to play and the dollar amount of each row.
+  Each time a board is built, the least recently used clue of each
+  category and difficulty is chosen, and the chosen clues are recorded
+  as used, so replaying a board from a large bank brings new clues.
+
+  Boards can also be generated: categories are drawn at random, and a
+  clue of each row's difficulty is drawn at random from each, skipping
+  clues used in the last few sessions (boards built or generated).
+
+USAGE:
+  Pass the database's path and a board name to GameData to play it:
+    GameData(bankPath='clues.db', board='Week 1')
+
+  Omit the board name to play a generated board instead:
+    GameData(bankPath='clues.db', seed=42)
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import os
+import random
+import sqlite3
+import time
+
+from gamepack import MEDIA_KINDS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS clues (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER NOT NULL REFERENCES categories (id),
+    difficulty INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    image TEXT,
+    sound TEXT,
+    clue_read TEXT,
+    last_used REAL
+);
+CREATE TABLE IF NOT EXISTS clue_usage (
+    clue_id INTEGER NOT NULL REFERENCES clues (id),
+    used_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    amounts TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS board_categories (
+    board_id INTEGER NOT NULL REFERENCES boards (id),
+    position INTEGER NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories (id),
+    PRIMARY KEY (board_id, position)
+);
+-- Progress of each file imported (see clueimport.py)
+CREATE TABLE IF NOT EXISTS imports (
+    source TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    offset INTEGER NOT NULL
+);
+
+-- A clue is stored once, however many times it is added or imported
+CREATE UNIQUE INDEX IF NOT EXISTS unique_clues
+    ON clues (category_id, difficulty, text);
+
+-- Choosing a board's clues: least recently used by category and difficulty
+CREATE INDEX IF NOT EXISTS clues_by_category
+    ON clues (category_id, difficulty, last_used);
+CREATE INDEX IF NOT EXISTS clues_by_difficulty
+    ON clues (difficulty, last_used);
+CREATE INDEX IF NOT EXISTS usage_by_clue ON clue_usage (clue_id, used_at);
+CREATE INDEX IF NOT EXISTS usage_by_time ON clue_usage (used_at);
+"""
+
+# Columns of each media kind, in the order of MEDIA_KINDS
+_MEDIA_COLUMNS = ('image', 'sound', 'clue_read')
+
+_SELECT_BOARD = 'SELECT id, amounts FROM boards WHERE name = ?'
+
+_SELECT_BOARD_CATEGORIES = """
+SELECT c.id, c.name FROM board_categories AS b
+JOIN categories AS c ON c.id = b.category_id
+WHERE b.board_id = ? ORDER BY b.position
+"""
+
+_SELECT_CLUE = """
+SELECT id, text, {0} FROM clues
+WHERE category_id = ? AND difficulty = ?
+ORDER BY last_used, id LIMIT 1
+""".format(', '.join(_MEDIA_COLUMNS))
+
+_SELECT_CLUE_BY_ID = 'SELECT id, text, {0} FROM clues WHERE id = ?'.format(
+    ', '.join(_MEDIA_COLUMNS))
+
+# Ids of a category's clues of a difficulty not used since a given time
+_SELECT_ELIGIBLE = """
+SELECT id FROM clues
+WHERE category_id = ? AND difficulty = ?
+AND (last_used IS NULL OR last_used < ?)
+ORDER BY id
+"""
+
+# Start time of the Nth most recent session (OFFSET N - 1)
+_SELECT_SESSION = """
+SELECT DISTINCT used_at FROM clue_usage
+ORDER BY used_at DESC LIMIT 1 OFFSET ?
+"""
+
+###############################################################################
+class ClueBank(object):
+    """
+    A clue bank in the SQLite database at 'path,' which is created if it
+    does not exist.
+
+    ATTRIBUTES:
+      * path
+
+    METHODS:
+      * add_board
+      * add_clues
+      * build_board
+      * close
+      * generate_board
+      * get_import_offset
+      * mark_used
+    """
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        # Text is returned as encoded in the database (UTF-8), as it is
+        # when read from the game's text files.
+        self._conn.text_factory = str
+        self._conn.executescript(_SCHEMA)
+        self._categoryIds = {}
+
+    def add_board(self, name, categories, amounts):
+        """
+        Add or replace board 'name,' which plays the categories named in
+        'categories' with row dollar amounts 'amounts.' The categories
+        must already be in the bank.
+        """
+        ids = [self._get_category_id(c, False) for c in categories]
+
+        with self._conn:
+            self._conn.execute('DELETE FROM board_categories WHERE board_id '
+                               'IN (SELECT id FROM boards WHERE name = ?)',
+                               (name, ))
+            self._conn.execute('DELETE FROM boards WHERE name = ?', (name, ))
+            boardId = self._conn.execute(
+                'INSERT INTO boards (name, amounts) VALUES (?, ?)',
+                (name, ' '.join(str(a) for a in amounts))).lastrowid
+            self._conn.executemany(
+                'INSERT INTO board_categories (board_id, position, '
+                'category_id) VALUES (?, ?, ?)',
+                ((boardId, i, c) for i, c in enumerate(ids)))
+
+    def add_clues(self, clues, imported=None):
+        """
+        Add each clue in iterable 'clues' in one transaction, adding new
+        categories as needed, and return the number added. Each clue is a
+        tuple:
+          (category, difficulty, lines[, image[, sound[, clueRead]]])
+        where 'lines' is a sequence of the clue's lines of text, and the
+        media are paths (or None). Clues whose category, difficulty, and
+        text are already in the bank are not added again.
+
+        If the clues were read from a file, 'imported' may be 3-tuple
+        (source, size, offset): the file's path and size, and the offset
+        up to which it has been read. It is saved in the same transaction,
+        for get_import_offset.
+        """
+        def rows():
+            for clue in clues:
+                category, difficulty, lines = clue[:3]
+                media = tuple(clue[3:]) + (None, )*(6 - len(clue))
+                yield ((self._get_category_id(category), difficulty,
+                        '\n'.join(lines)) + media)
+
+        try:
+            with self._conn:
+                # rowcount is -1 if 'clues' is empty
+                numAdded = max(0, self._conn.executemany(
+                    'INSERT OR IGNORE INTO clues (category_id, difficulty, '
+                    'text, {0}) VALUES (?, ?, ?, ?, ?, ?)'.format(
+                        ', '.join(_MEDIA_COLUMNS)),
+                    rows()).rowcount)
+
+                if imported is not None:
+                    self._conn.execute('INSERT OR REPLACE INTO imports '
+                                       '(source, size, offset) VALUES '
+                                       '(?, ?, ?)', imported)
+        except:
+            # Categories added in the transaction were rolled back with it
+            self._categoryIds.clear()
+            raise
+
+        return numAdded
+
+    def build_board(self, name, markUsed=True):
+        """
+        Return 4-tuple (categories, clues, amounts, media) for board
+        'name,' where 'clues' is 2D as in GameData.clues and 'media' maps
+        each kind in MEDIA_KINDS to a dict of (column, row) -> path.
+
+        The least recently used clue of each category and difficulty is
+        chosen. If 'markUsed' is set, the chosen clues are recorded as used.
+        """
+        board = self._conn.execute(_SELECT_BOARD, (name, )).fetchone()
+        if board is None:
+            raise ClueBankError('No board named %r.' % name, self.path)
+
+        boardId, amounts = board
+        amounts = tuple(int(a) for a in amounts.split())
+        categories = []
+        clueIds = []
+
+        for categoryId, categoryName in self._conn.execute(
+                _SELECT_BOARD_CATEGORIES, (boardId, )).fetchall():
+            categories.append(categoryName)
+
+            for r in xrange(len(amounts)):
+                row = self._conn.execute(_SELECT_CLUE,
+                                         (categoryId, r + 1)).fetchone()
+                if row is None:
+                    raise ClueBankError(
+                        'No clue of difficulty %d in category %r.' %
+                        (r + 1, categoryName), self.path)
+
+                clueIds.append(row[0])
+
+        return self._fill_board(categories, clueIds, amounts, markUsed)
+
+    def close(self):
+        self._conn.close()
+
+    def generate_board(self, numCategories, amounts, seed=None,
+                       sessions=0, markUsed=True):
+        """
+        Return 4-tuple as in build_board for a board of 'numCategories'
+        different categories, drawn at random, with row dollar amounts
+        'amounts.' Row N holds a clue of difficulty N + 1, drawn at random
+        from those not used in the last 'sessions' sessions, where a
+        session is a board built or generated with 'markUsed' set.
+
+        The same 'seed' gives the same board from the same bank and usage
+        history. Only the clues of categories drawn are read, via the
+        clues_by_category index, so time taken does not grow with the size
+        of the bank.
+
+        Raise ClueBankError if too few categories have an unused clue of
+        every difficulty.
+        """
+        rng = random.Random(seed)
+        since = self._get_session_start(sessions)
+        maxId = self._conn.execute('SELECT max(id) FROM categories'
+                                   ).fetchone()[0] or 0
+
+        categories = []
+        clueIds = []
+        tried = set()
+
+        while len(categories) < numCategories:
+            if len(tried) == maxId:
+                raise ClueBankError(
+                    'Only {0} categories have a clue of each of the {1} '
+                    'difficulties not used in the last {2} sessions; {3} '
+                    'are needed.'.format(len(categories), len(amounts),
+                                         sessions, numCategories),
+                    self.path)
+
+            categoryId = rng.randint(1, maxId)
+            if categoryId in tried:
+                continue
+            tried.add(categoryId)
+
+            column = self._pick_clues(categoryId, len(amounts), since, rng)
+            if column is not None:
+                categories.append(self._get_category_name(categoryId))
+                clueIds.extend(column)
+
+        return self._fill_board(categories, clueIds, amounts, markUsed)
+
+    def get_import_offset(self, source, size):
+        """
+        Return offset up to which the file at 'source' has been imported
+        (see add_clues), or 0 if it has not been, or its size was not
+        'size' (so is a different file).
+        """
+        row = self._conn.execute('SELECT size, offset FROM imports WHERE '
+                                 'source = ?', (source, )).fetchone()
+
+        return row[1] if row and row[0] == size else 0
+
+    def mark_used(self, clueIds, when=None):
+        """
+        Record clues with ids 'clueIds' as used at time 'when' (seconds
+        since the epoch), or now if not provided.
+        """
+        when = time.time() if when is None else when
+
+        with self._conn:
+            self._conn.executemany(
+                'UPDATE clues SET last_used = ? WHERE id = ?',
+                ((when, i) for i in clueIds))
+            self._conn.executemany(
+                'INSERT INTO clue_usage (clue_id, used_at) VALUES (?, ?)',
+                ((i, when) for i in clueIds))
+
+    def _fill_board(self, categories, clueIds, amounts, markUsed):
+        """
+        Return 4-tuple as in build_board for category names 'categories,'
+        the ids of their clues 'clueIds' in column order, and row dollar
+        amounts 'amounts.'
+        """
+        clues = []
+        media = dict((kind, {}) for kind in MEDIA_KINDS)
+        baseDir = os.path.dirname(os.path.abspath(self.path))
+        numRows = len(amounts)
+
+        for c in xrange(len(categories)):
+            column = []
+
+            for r in xrange(numRows):
+                row = self._conn.execute(_SELECT_CLUE_BY_ID,
+                                         (clueIds[c*numRows + r], )
+                                         ).fetchone()
+                column.append(tuple(row[1].split('\n')))
+
+                for kind, path in zip(MEDIA_KINDS, row[2:]):
+                    if path:
+                        media[kind][c, r] = os.path.join(baseDir, path)
+
+            clues.append(tuple(column))
+
+        if markUsed:
+            self.mark_used(clueIds)
+
+        return tuple(categories), tuple(clues), amounts, media
+
+    def _get_category_id(self, name, create=True):
+        """
+        Return id of category 'name,' adding it if it does not exist and
+        'create' is set.
+        """
+        try:
+            return self._categoryIds[name]
+        except KeyError:
+            pass
+
+        row = self._conn.execute('SELECT id FROM categories WHERE name = ?',
+                                 (name, )).fetchone()
+        if row is not None:
+            categoryId = row[0]
+        elif create:
+            categoryId = self._conn.execute(
+                'INSERT INTO categories (name) VALUES (?)', (name, )).lastrowid
+        else:
+            raise ClueBankError('No category named %r.' % name, self.path)
+
+        self._categoryIds[name] = categoryId
+
+        return categoryId
+
+    def _get_category_name(self, categoryId):
+        return self._conn.execute('SELECT name FROM categories WHERE id = ?',
+                                  (categoryId, )).fetchone()[0]
+
+    def _get_session_start(self, sessions):
+        """
+        Return time at which the 'sessions'th most recent session started,
+        before which clues are eligible to be played again.
+        """
+        if sessions < 1:
+            return float('inf')
+
+        row = self._conn.execute(_SELECT_SESSION, (sessions - 1, )).fetchone()
+
+        # Fewer sessions than 'sessions' so far: no used clue is eligible
+        return row[0] if row else float('-inf')
+
+    def _pick_clues(self, categoryId, numRows, since, rng):
+        """
+        Return list of ids of a clue of each difficulty from 1 to
+        'numRows' of category 'categoryId,' each drawn with 'rng' from
+        those last used before 'since,' or None if there is none for some
+        difficulty.
+        """
+        clueIds = []
+
+        for difficulty in xrange(1, numRows + 1):
+            eligible = self._conn.execute(
+                _SELECT_ELIGIBLE, (categoryId, difficulty, since)).fetchall()
+            if not eligible:
+                return None
+
+            clueIds.append(rng.choice(eligible)[0])
+
+        return clueIds
+
+###############################################################################
+class ClueBankError(Exception):
+    """
+    Exception raised when a board cannot be built from a clue bank.
+    """
+    def __init__(self, msg='', path=None):
+        self.msg = msg if msg else "Problem with clue bank."
+        self.path = path
+
+    def __str__(self):
+        addendum = ''
+        if self.path is not None:
+            addendum = ' Bad file: %s' % self.path
+
+        return self.msg + addendum
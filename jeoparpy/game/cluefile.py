@@ -0,0 +1,157 @@
+"""
+cluefile.py
+
+DESCRIPTION:
+  Contains the ClueFile class, described below, and ClueFileError.
+
+  Clue files hold one clue per group of consecutive non-blank lines, with
+  groups separated by one or more blank lines (see INSTRUCTIONS.txt).
+
+USAGE:
+  ClueFile(path) indexes the file in a single pass. Clues are then read
+  from the file by number (ClueFile[i]) or, via get_board, by category
+  and row, only when they are accessed.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+from array import array
+import os
+
+###############################################################################
+class ClueFile(object):
+    """
+    A read-only sequence of the clues in a clue file, each a tuple of its
+    lines with surrounding whitespace stripped.
+
+    On creation, the file is read through once, line by line, recording
+    only the byte offset at which each clue starts (4 bytes per clue for
+    files under 4 GB). A clue's text, which runs to the start of the next
+    clue, is read from the file each time it is accessed, so memory use
+    does not depend on how much text the file holds.
+
+    ATTRIBUTES:
+      * path
+
+    METHODS:
+      * get_board
+    """
+    def __init__(self, path):
+        self.path = path
+        self._size = os.path.getsize(path)
+        self._starts = array('I' if self._size < 2**32 else 'L')
+
+        offset = 0
+        inClue = False
+
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    if not inClue:
+                        self._starts.append(offset)
+                        inClue = True
+                else:
+                    inClue = False
+
+                offset += len(line)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('clue index out of range')
+
+        start = self._starts[i]
+        end = self._starts[i + 1] if i + 1 < len(self) else self._size
+
+        with open(self.path, 'rb') as f:
+            f.seek(start)
+            text = f.read(end - start)
+
+        return tuple(line.strip() for line in text.rstrip().split('\n'))
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self._starts)
+
+    def get_board(self, numCategories):
+        """
+        Return tuple of 'numCategories' sequences, one per category, of
+        that category's clues, which can be treated as a 2D array (see
+        GameData.clues). Clues are in category order, as in the file.
+
+        Raise ClueFileError if the clues cannot be split evenly among
+        the categories.
+        """
+        numClues = len(self)
+
+        if numCategories < 1 or numClues < numCategories:
+            raise ClueFileError(
+                'Found {0} clues for {1} categories. Every category must '
+                'have at least one clue.'.format(numClues, numCategories),
+                self.path)
+
+        if numClues % numCategories:
+            fewer = numClues - numClues % numCategories
+            raise ClueFileError(
+                'Found {0} clues for {1} categories. Every category must '
+                'have the same number of clues, so there must be a multiple '
+                'of {1} (e.g. {2} or {3}).'.format(
+                    numClues, numCategories, fewer, fewer + numCategories),
+                self.path)
+
+        numPerCat = numClues / numCategories
+
+        return tuple(_Category(self, c*numPerCat, numPerCat)
+                     for c in xrange(numCategories))
+
+###############################################################################
+class ClueFileError(Exception):
+    """
+    Exception raised when a clue file's clues do not fit the game board.
+    """
+    def __init__(self, msg='', path=None):
+        self.msg = msg if msg else "Problem with clues file."
+        self.path = path
+
+    def __str__(self):
+        addendum = ''
+        if self.path is not None:
+            addendum = ' Bad file: %s' % self.path
+
+        return self.msg + addendum
+
+###############################################################################
+class _Category(object):
+    """
+    A read-only sequence of 'length' clues of 'clueFile,' starting with
+    clue number 'start.'
+    """
+    def __init__(self, clueFile, start, length):
+        self._clueFile = clueFile
+        self._start = start
+        self._len = length
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError('clue index out of range')
+
+        return self._clueFile[self._start + i]
+
+    def __iter__(self):
+        for i in xrange(self._len):
+            yield self[i]
+
+    def __len__(self):
+        return self._len
@@ -0,0 +1,360 @@
+"""
+clueimport.py
+
+DESCRIPTION:
+  Contains import_clues, which adds the clues in a CSV or TSV dump of
+  past games to a clue bank (see cluebank.py), and ClueImportError.
+
+  Each record of a dump holds a clue's round, category, value, text,
+  answer, and air date. Either the first line names these columns (in
+  any order; see COLUMNS), or they appear in that order. Each clue is
+  added with its category and a difficulty of 1 to ROWS_PER_ROUND, found
+  from its value, round, and air date: e.g. a $400 clue of a
+  "Double Jeopardy!" round in 2010 has difficulty 1. Final rounds,
+  tiebreakers, and clues whose value is not a row's (such as wagers on
+  daily doubles) are skipped. Answers are not stored, as the game shows
+  only clues.
+
+  Dumps are read in batches of records, each parsed by a pool of worker
+  processes and added to the bank in one transaction. Only a few batches
+  are held in memory at a time, so dumps of any size can be imported.
+  How far a dump has been imported is saved with each batch, so an
+  import that is interrupted continues where it stopped when run again.
+  A dump that has changed since it was imported is read again from the
+  start, but only clues not already in the bank are added.
+
+USAGE:
+  From the JeoparPy root directory:
+    python -m jeoparpy.game.clueimport [-j JOBS] [-b BATCH] DUMP BANK
+
+  Then play from the bank by setting CLUE_BANK in config.py.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+from collections import deque
+from cStringIO import StringIO
+import csv
+import multiprocessing
+import os
+import signal
+
+# Columns of a dump, in the order used when it has no header. Header
+# names are matched ignoring case, spaces, and underscores.
+COLUMNS = ('round', 'category', 'value', 'clue', 'answer', 'airdate')
+
+# Other header names accepted for columns
+_COLUMN_ALIASES = {'cluevalue' : 'value', 'date' : 'airdate'}
+
+# Columns a dump must have; 'airdate' is optional
+_REQUIRED_COLUMNS = ('round', 'category', 'value', 'clue')
+
+# Number of rows on the board in each round
+ROWS_PER_ROUND = 5
+
+# Most bytes of records read into one batch, whatever its size in records
+_MAX_BATCH_BYTES = 16 * 1024 * 1024
+
+# Clue values were doubled from this air date (YYYY-MM-DD). Clues without
+# an air date are valued as if aired after it.
+VALUES_DOUBLED = '2001-11-26'
+
+###############################################################################
+class ClueImportError(Exception):
+    """
+    Exception raised when a dump's columns cannot be found.
+    """
+    def __init__(self, msg='', path=None):
+        self.msg = msg if msg else "Problem with clue dump."
+        self.path = path
+
+    def __str__(self):
+        addendum = ''
+        if self.path is not None:
+            addendum = ' Bad file: %s' % self.path
+
+        return self.msg + addendum
+
+###############################################################################
+def import_clues(path, bank, jobs=None, batchSize=10000, progress=None):
+    """
+    Add the clues in the CSV or TSV dump at 'path' to ClueBank 'bank,'
+    continuing from where any earlier import of it stopped. Return 2-tuple
+    (clues added, records skipped) by this call, where records skipped
+    include clues already in the bank.
+
+    Records are parsed in batches of 'batchSize' by 'jobs' processes (by
+    default, one per CPU; if 1, no processes are started). After each
+    batch is added, 'progress,' if provided, is called with the offset up
+    to which the dump has been read, the dump's size, and the totals so
+    far that would be returned.
+    """
+    source = os.path.abspath(path)
+    size = os.path.getsize(path)
+    jobs = jobs or multiprocessing.cpu_count()
+    added = skipped = 0
+
+    with open(path, 'rb') as f:
+        delimiter, columns, headerEnd = _read_header(f, path)
+        f.seek(max(bank.get_import_offset(source, size), headerEnd))
+        chunks = _read_chunks(f, batchSize, delimiter)
+
+        if jobs == 1:
+            pool = None
+            results = ((_parse_chunk((data, delimiter, columns)), end)
+                       for data, end in chunks)
+        else:
+            pool = multiprocessing.Pool(jobs, _ignore_interrupt)
+            results = _parse_in_pool(pool, chunks, delimiter, columns,
+                                     2 * jobs)
+
+        try:
+            for (clues, numSkipped), end in results:
+                numAdded = bank.add_clues(clues, (source, size, end))
+                added += numAdded
+                skipped += numSkipped + len(clues) - numAdded
+
+                if progress is not None:
+                    progress(end, size, added, skipped)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+    return added, skipped
+
+###############################################################################
+def _get_difficulty(round_, value, airDate):
+    """
+    Return difficulty of a clue from the text of its round, value, and
+    air date, or None if it is not in a board's rows.
+    """
+    round_ = _normalize_name(round_)
+
+    if round_.startswith('double') or round_ in ('2', 'dj'):
+        unit = 200
+    elif round_.startswith('jeopardy') or round_ in ('1', 'j'):
+        unit = 100
+    else:
+        return None
+
+    if not airDate or airDate.strip() >= VALUES_DOUBLED:
+        unit *= 2
+
+    try:
+        value = int(value.translate(None, '$,'))
+    except ValueError:
+        return None
+
+    if value % unit or not 1 <= value / unit <= ROWS_PER_ROUND:
+        return None
+
+    return value / unit
+
+def _get_quoting(delimiter):
+    """CSV fields may be quoted; TSV fields are taken as written."""
+    return csv.QUOTE_MINIMAL if delimiter == ',' else csv.QUOTE_NONE
+
+def _ignore_interrupt():
+    # Worker processes leave Ctrl+C to the importing process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _normalize_name(name):
+    return name.lower().translate(None, ' \t_')
+
+def _parse_chunk(args):
+    """
+    Return 2-tuple (clues, number of records skipped) for the records in
+    'data,' where 'args' is 3-tuple (data, delimiter, columns) and
+    'columns' maps each column name to its index in a record. Clues are
+    tuples as taken by ClueBank.add_clues.
+    """
+    data, delimiter, columns = args
+    clues = []
+    skipped = 0
+    i = [columns[name] for name in _REQUIRED_COLUMNS]
+    airDateI = columns.get('airdate')
+
+    reader = csv.reader(StringIO(data), delimiter=delimiter,
+                        quoting=_get_quoting(delimiter))
+    while True:
+        try:
+            record = reader.next()
+        except StopIteration:
+            break
+        except csv.Error:
+            # E.g. a NUL byte or overlong field. The reader continues with
+            # the next line, so only this record is lost.
+            skipped += 1
+            continue
+
+        try:
+            round_, category, value, text = [record[j] for j in i]
+            airDate = record[airDateI] if airDateI is not None else None
+        except IndexError:
+            skipped += 1
+            continue
+
+        difficulty = _get_difficulty(round_, value, airDate)
+        category = ' '.join(category.split())
+        text = ' '.join(text.split())
+
+        if difficulty is None or not category or not text:
+            skipped += 1
+        else:
+            clues.append((category, difficulty, (text, )))
+
+    return clues, skipped
+
+def _parse_in_pool(pool, chunks, delimiter, columns, maxPending):
+    """
+    Yield 2-tuples as in import_clues, in order, of each chunk of 'chunks'
+    parsed by 'pool,' with no more than 'maxPending' chunks read ahead.
+    """
+    pending = deque()
+
+    for data, end in chunks:
+        pending.append((pool.apply_async(_parse_chunk,
+                                         ((data, delimiter, columns), )),
+                        end))
+
+        if len(pending) >= maxPending:
+            result, end = pending.popleft()
+            # A timeout lets Ctrl+C interrupt the wait (Python 2)
+            yield result.get(1e9), end
+
+    while pending:
+        result, end = pending.popleft()
+        yield result.get(1e9), end
+
+def _read_chunks(f, numRecords, delimiter, maxBytes=_MAX_BATCH_BYTES):
+    """
+    Yield 2-tuple (data, end offset) of each run of 'numRecords' records,
+    or fewer if they reach 'maxBytes,' read from file 'f' from its current
+    offset.
+
+    Where records end is found by the csv module, as in _parse_chunk, so
+    a quoted field may span lines, and a stray quote in an unquoted field
+    does not. The csv reader takes lines from the file only as it needs
+    them, so the lines it has taken when it returns a record are exactly
+    those up to the end of that record.
+    """
+    offset = f.tell()
+    lines = []
+    numBytes = [0]
+
+    def read_lines():
+        # Offsets are counted, as tell() is not exact while iterating a file
+        for line in f:
+            lines.append(line)
+            numBytes[0] += len(line)
+            yield line
+
+    records = csv.reader(read_lines(), delimiter=delimiter,
+                         quoting=_get_quoting(delimiter))
+    count = 0
+
+    while True:
+        try:
+            records.next()
+        except StopIteration:
+            break
+        except csv.Error:
+            # The record is counted as skipped when its chunk is parsed
+            pass
+
+        count += 1
+        if count == numRecords or numBytes[0] >= maxBytes:
+            offset += numBytes[0]
+            yield ''.join(lines), offset
+            del lines[:]
+            numBytes[0] = 0
+            count = 0
+
+    if lines:
+        yield ''.join(lines), offset + numBytes[0]
+
+def _read_header(f, path):
+    """
+    Return 3-tuple (delimiter, columns, header length) of dump 'f,' where
+    'columns' maps each column name in COLUMNS to its index in a record,
+    and 'header length' is 0 if the dump has no header.
+    """
+    firstLine = f.readline()
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext in ('.tsv', '.tab') or (ext != '.csv' and '\t' in firstLine):
+        delimiter = '\t'
+    else:
+        delimiter = ','
+
+    names = next(csv.reader([firstLine], delimiter=delimiter,
+                            quoting=_get_quoting(delimiter)), [])
+    names = [_normalize_name(n) for n in names]
+    names = [_COLUMN_ALIASES.get(n, n) for n in names]
+
+    if 'category' not in names:
+        return delimiter, dict((n, i) for i, n in enumerate(COLUMNS)), 0
+
+    columns = dict((n, i) for i, n in reversed(list(enumerate(names)))
+                   if n in COLUMNS)
+    missing = [n for n in _REQUIRED_COLUMNS if n not in columns]
+    if missing:
+        raise ClueImportError('Missing column(s): %s.' % ', '.join(missing),
+                              path)
+
+    return delimiter, columns, len(firstLine)
+
+###############################################################################
+if __name__ == '__main__':
+    # Import a dump from the command line, reporting progress
+    import argparse
+    import sys
+    import time
+
+    from cluebank import ClueBank
+
+    parser = argparse.ArgumentParser(
+        prog='python -m jeoparpy.game.clueimport',
+        description='Add the clues in a CSV or TSV dump to a clue bank.')
+    parser.add_argument('dump', help='CSV or TSV file of clues')
+    parser.add_argument('bank', help='clue bank database (created if new)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='parsing processes (default one per CPU)')
+    parser.add_argument('-b', '--batch', type=int, default=10000,
+                        help='records per batch (default 10000)')
+    args = parser.parse_args()
+
+    bank = ClueBank(args.bank)
+    startOffset = bank.get_import_offset(os.path.abspath(args.dump),
+                                         os.path.getsize(args.dump))
+    start = time.time()
+
+    def report(offset, size, added, skipped):
+        elapsed = max(time.time() - start, 1e-6)
+        sys.stderr.write(
+            '\r{0:5.1f}%  {1} clues added, {2} skipped  '
+            '{3:.0f} clues/s  {4:.1f} MB/s '.format(
+                100.0 * offset / (size or 1), added, skipped,
+                added / elapsed,
+                (offset - startOffset) / elapsed / 1048576.0))
+
+    try:
+        added, skipped = import_clues(args.dump, bank, args.jobs,
+                                      args.batch, report)
+    except KeyboardInterrupt:
+        sys.exit('\nInterrupted. Run again to continue the import.')
+    except ClueImportError as e:
+        sys.exit(str(e))
+    finally:
+        bank.close()
+
+    sys.stderr.write('\n')
+    print 'Added {0} clues ({1} records skipped) in {2:.1f} s'.format(
+        added, skipped, time.time() - start)
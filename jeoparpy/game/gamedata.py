@@ -12,11 +12,16 @@ viewable at http://opensource.org/licenses/GPL-3.0
 This copyright notice must be retained with any use
 of source code from this file.
 """
+import os
 from sys import stderr
 
+from cluebank import ClueBank, ClueBankError
+from cluefile import ClueFile
 from constants import AMOUNTS_PATH, CATEGORIES_PATH, CLUES_PATH, PLAYERS_PATH
+from gamepack import GamePack
 from jeopplayer import JeopPlayer
-from ..config import SUBTRACT_ON_INCORRECT
+from ..config import (CLUE_BANK_CATEGORIES, CLUE_BANK_SESSIONS,
+                      SUBTRACT_ON_INCORRECT)
 from ..util import get_stripped_nonempty_file_lines, to_numeric
 
 ###############################################################################
@@ -34,17 +39,44 @@ class GameData(object):
       * amounts
       * categories
       * clues
+      * media
+      * pack
       * players
       * winners (read-only)
 
     METHODS:
       * update
     """
-    def __init__(self):
+    def __init__(self, packPath=None, bankPath=None, board=None, seed=None):
         """
         Set categories, clues, amounts, and players by reading from
-        files, whose paths are defined in constants module.
+        the game pack at 'packPath' (see gamepack.py) if provided, from
+        board 'board' of the clue bank at 'bankPath' (see cluebank.py) if
+        provided, or otherwise from files whose paths are defined in
+        constants module.
+
+        If a clue bank is used without 'board,' a board is generated from
+        it with 'seed' (see cluebank.ClueBank.generate_board), using the
+        amounts file and CLUE_BANK_CATEGORIES and CLUE_BANK_SESSIONS in
+        config.
+
+        If a pack is used, it is kept open as 'pack' so its clue media
+        can be extracted; otherwise 'pack' is None. If a clue bank is used,
+        'media' maps kinds of clue media to dicts of (column, row) -> path
+        (see cluebank.ClueBank.build_board); otherwise it is None.
+        Raise ClueBankError if there is no clue bank at 'bankPath.'
         """
+        self.pack = None
+        self.media = None
+
+        if packPath:
+            self._init_from_pack(packPath)
+            return
+
+        if bankPath:
+            self._init_from_bank(bankPath, board, seed)
+            return
+
         self.categories = get_stripped_nonempty_file_lines(CATEGORIES_PATH)
         
         self.clues = self._build_clues_from_file(CLUES_PATH,
@@ -87,38 +119,25 @@ class GameData(object):
                             
     def _build_clues_from_file(self, path, numCategories):
         """
-        Return a tuple containing tuples of each categories clues,
-        which can be treated as a 2D array.
+        Return a tuple containing sequences of each categories clues,
+        which can be treated as a 2D array. Clue text is read from the
+        file only when accessed (see cluefile.py).
         
         'Path' is the path (including name) to the file containing the clues.
         Ex: returnedClues[2][4] would return the 5th clue in the 3rd category.
         """
-        clues = []
-        clue = []
-
-        #Read all clues from file into clues
-        with open(path, 'r') as f:
-            for line in f:
-                stripped = line.strip()
-                if stripped:
-                    clue.append(stripped)
-                elif clue:
-                    clues.append(tuple(clue))
-                    clue = []
-
-        #Last clue could be leftover beacuse EOF reached
-        if clue:
-            clues.append(tuple(clue))
-
-        return self._map_clues(clues, numCategories)
+        return ClueFile(path).get_board(numCategories)
 
     def _build_players_from_file(self, path):
-        playerNames = get_stripped_nonempty_file_lines(path)
+        return self._build_players_from_names(
+            get_stripped_nonempty_file_lines(path), path)
+
+    def _build_players_from_names(self, playerNames, source):
         if len(playerNames) > 3:
             playerNames = playerNames[:3]
             print >>stderr, ("WARNING: Too many players provided. " +
                              "Extraneous player names ignored. " +
-                             "Bad file: %s" % path)
+                             "Bad file: %s" % source)
         elif len(playerNames) < 3:
             missing = 3 - len(playerNames)
             playerNames += tuple('Player ' + str(i + 2)
@@ -131,18 +150,35 @@ class GameData(object):
         for p in self.players:
             p.hasAnswered = False
 
-    def _map_clues(self, clues, numCategories):
-        """
-        Map clues from format (clue 0, clue 1, clue 2, ...) to format
-        ((Category 1 clues), (Category 2 clues), ...))
-        """
-        mapped = []
-        numPerCat = len(clues) / numCategories
-        for c in xrange(numCategories):
-            start = c*numPerCat
-            mapped.append(tuple(clues[start:start + numPerCat]))
+    def _init_from_bank(self, path, board, seed):
+        # Opening a clue bank creates it if new, so a mistyped path would
+        # otherwise give an empty bank.
+        if not os.path.isfile(path):
+            raise ClueBankError('No clue bank at %s.' % path)
+
+        bank = ClueBank(path)
+        try:
+            if board is None:
+                (self.categories, self.clues, self.amounts,
+                 self.media) = bank.generate_board(
+                     CLUE_BANK_CATEGORIES,
+                     self._build_amounts_from_file(AMOUNTS_PATH),
+                     seed, CLUE_BANK_SESSIONS)
+            else:
+                (self.categories, self.clues, self.amounts,
+                 self.media) = bank.build_board(board)
+        finally:
+            bank.close()
+
+        self.players = self._build_players_from_file(PLAYERS_PATH)
 
-        return tuple(mapped)
+    def _init_from_pack(self, path):
+        self.pack = GamePack(path)
+        self.categories = self.pack.categories
+        self.clues = self.pack.clues
+        self.amounts = self.pack.amounts
+        self.players = self._build_players_from_names(self.pack.players,
+                                                      path)
 
     @property
     def allPlayersAnswered(self):
@@ -0,0 +1,346 @@
+"""
+gamepack.py
+
+DESCRIPTION:
+  Contains the GamePack class, described below, and compile_pack, which
+  bundles a game's text and clue media into a single game pack file.
+
+  A pack file holds, in order:
+    * A fixed header: PACK_MAGIC, format version, and index length.
+    * An index (JSON) giving the board's shape and the offset and length
+      of the categories, amounts, players, each clue's text, and each
+      clue's media (with its kind, coordinates, extension, and SHA-1).
+    * The data those offsets point into, relative to its start.
+
+USAGE:
+  To compile the game currently in res/text, along with the clue media
+  listed in resmaps.py, run this from the JeoparPy root directory:
+    python -m jeoparpy.game.gamepack mygame.jpk
+
+  Then either set GAME_PACK in config.py or pass the pack to start.py:
+    python start.py mygame.jpk
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+
+PACK_EXTENSION = '.jpk'
+PACK_MAGIC = 'JEOPPACK'
+PACK_VERSION = 1
+
+# Kinds of clue media, named as in resmaps.py
+MEDIA_KINDS = ('IMAGES', 'SOUNDS', 'CLUE_READS')
+
+_header = struct.Struct('<8sHI')  # magic, version, index length
+
+# Media files are extracted under names made of these, so they must not
+# be able to name any other path
+_MEDIA_SHA1 = re.compile(r'[0-9a-f]{40}\Z')
+_MEDIA_EXT = re.compile(r'\.[A-Za-z0-9]{1,8}\Z')
+
+###############################################################################
+class GamePack(object):
+    """
+    Reads a game pack file (see compile_pack) by memory-mapping it.
+    Only the header and index are read when the pack is opened. Each
+    section of text is read when first accessed, and media only when
+    extracted.
+
+    ATTRIBUTES:
+      * amounts (read-only)
+      * categories (read-only)
+      * clues (read-only)
+      * path
+      * players (read-only)
+
+    METHODS:
+      * close
+      * extract_media
+      * get_media
+      * get_media_coords
+    """
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._index, self._dataStart = _read_index(self._map, path)
+        except:
+            self._map.close()
+            raise
+
+        self._media = {}  # (kind, coords) -> media index entry
+        for entry in self._index['media']:
+            self._media[entry['kind'], tuple(entry['coords'])] = entry
+
+    def close(self):
+        self._map.close()
+
+    def extract_media(self, directory):
+        """
+        Return dict mapping each media kind in MEDIA_KINDS to a dict of
+        (column, row) -> path of that clue's media file in 'directory.'
+
+        Files are named by their SHA-1, so each is written only the first
+        time it is extracted on a machine, and identical files are shared
+        between clues and packs. Raise ValueError if a file's contents do
+        not match its SHA-1, rather than write it.
+        """
+        media = dict((kind, {}) for kind in MEDIA_KINDS)
+
+        if self._media and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        for (kind, coords), entry in self._media.iteritems():
+            name = str(entry['sha1'] + entry['ext'])
+            path = os.path.join(directory, name)
+
+            if not _has_size(path, entry['span'][1]):
+                blob = self._read(entry['span'])
+                if hashlib.sha1(blob).hexdigest() != entry['sha1']:
+                    raise ValueError('Game pack media does not match its '
+                                     'SHA-1. Bad file: %s' % self.path)
+                _write_atomic(path, blob, directory)
+
+            media[kind][coords] = path
+
+        return media
+
+    def get_media(self, kind, coords):
+        """
+        Return contents of the media file of 'kind' for the clue at
+        'coords,' or None if it has none.
+        """
+        entry = self._media.get((kind, coords))
+
+        return self._read(entry['span']) if entry else None
+
+    def get_media_coords(self, kind):
+        """Return list of (column, row) of clues with media of 'kind.'"""
+        return [c for k, c in self._media if k == kind]
+
+    def _read(self, span):
+        start = self._dataStart + span[0]
+
+        return self._map[start:start + span[1]]
+
+    def _read_lines(self, span):
+        text = self._read(span)
+
+        return tuple(text.split('\n')) if text else ()
+
+    @property
+    def amounts(self):
+        return tuple(int(a) for a in
+                     self._read_lines(self._index['amounts']))
+
+    @property
+    def categories(self):
+        return self._read_lines(self._index['categories'])
+
+    @property
+    def clues(self):
+        """Tuple of each category's clues, as in GameData.clues."""
+        numRows = self._index['shape'][1]
+        spans = self._index['clues']
+
+        return tuple(
+            tuple(self._read_lines(s) for s in spans[i:i + numRows])
+            for i in xrange(0, len(spans), numRows))
+
+    @property
+    def players(self):
+        return self._read_lines(self._index['players'])
+
+###############################################################################
+def compile_pack(path, categories, clues, amounts, players, media=None):
+    """
+    Write a game pack to 'path.'
+
+    'clues' is a 2D sequence as in GameData.clues, each clue a sequence
+    of lines. 'media,' if provided, maps kinds in MEDIA_KINDS to dicts of
+    (column, row) -> path of that clue's media file. Files used by several
+    clues are stored once.
+    """
+    data = []
+    offset = [0]
+
+    def add(blob):
+        span = [offset[0], len(blob)]
+        data.append(blob)
+        offset[0] += len(blob)
+        return span
+
+    index = {
+        'shape': [len(clues), len(clues[0]) if clues else 0],
+        'categories': add('\n'.join(categories)),
+        'amounts': add('\n'.join(str(a) for a in amounts)),
+        'players': add('\n'.join(players)),
+        'clues': [add('\n'.join(clue)) for column in clues
+                  for clue in column],
+        'media': [],
+    }
+
+    blobSpans = {}  # SHA-1 -> span; identical files are stored once
+
+    for kind, paths in sorted((media or {}).iteritems()):
+        if kind not in MEDIA_KINDS:
+            raise ValueError('Unknown media kind: %r' % kind)
+
+        for coords, mediaPath in sorted(paths.iteritems()):
+            ext = os.path.splitext(mediaPath)[1]
+            if not _MEDIA_EXT.match(ext):
+                raise ValueError('Media file must have an extension of 1 '
+                                 'to 8 letters or digits: %s' % mediaPath)
+
+            with open(mediaPath, 'rb') as f:
+                blob = f.read()
+
+            sha1 = hashlib.sha1(blob).hexdigest()
+            if sha1 not in blobSpans:
+                blobSpans[sha1] = add(blob)
+
+            index['media'].append({
+                'kind': kind,
+                'coords': list(coords),
+                'ext': ext,
+                'sha1': sha1,
+                'span': blobSpans[sha1],
+            })
+
+    indexText = json.dumps(index, separators=(',', ':'))
+
+    with open(path, 'wb') as f:
+        f.write(_header.pack(PACK_MAGIC, PACK_VERSION, len(indexText)))
+        f.write(indexText)
+        for blob in data:
+            f.write(blob)
+
+###############################################################################
+def _check_index(index, dataLen, path):
+    """
+    Raise ValueError unless the board's shape matches its clues, every
+    span in pack index 'index' lies within the 'dataLen' bytes of data,
+    and every media entry's kind, coordinates, SHA-1, and extension are
+    valid. A pack's index is not trusted, as packs are copied between
+    machines.
+    """
+    def check_pair(pair):
+        if (not isinstance(pair, list) or len(pair) != 2 or
+                not all(type(n) in (int, long) and n >= 0 for n in pair)):
+            raise ValueError
+
+    def check_span(span):
+        check_pair(span)
+        if span[0] + span[1] > dataLen:
+            raise ValueError
+
+    try:
+        check_pair(index['shape'])
+        numCols, numRows = index['shape']
+        if len(index['clues']) != numCols * numRows or (numCols and
+                                                       not numRows):
+            raise ValueError
+
+        for key in ('categories', 'amounts', 'players'):
+            check_span(index[key])
+        for span in index['clues']:
+            check_span(span)
+
+        for entry in index['media']:
+            check_span(entry['span'])
+            check_pair(entry['coords'])
+            if (entry['kind'] not in MEDIA_KINDS or
+                    not isinstance(entry['sha1'], basestring) or
+                    not _MEDIA_SHA1.match(entry['sha1']) or
+                    not isinstance(entry['ext'], basestring) or
+                    not _MEDIA_EXT.match(entry['ext'])):
+                raise ValueError
+    except (KeyError, TypeError, ValueError):
+        raise ValueError('Corrupt game pack index. Bad file: %s' % path)
+
+def _has_size(path, size):
+    try:
+        return os.path.getsize(path) == size
+    except OSError:
+        return False
+
+def _read_index(map_, path):
+    """
+    Return 2-tuple of the pack's index and the offset at which its data
+    starts, from mmap 'map_' of the pack file at 'path.'
+    """
+    try:
+        magic, version, indexLen = _header.unpack_from(map_, 0)
+    except struct.error:
+        magic = None
+
+    if magic != PACK_MAGIC:
+        raise ValueError('Not a JeoparPy game pack. Bad file: %s' % path)
+    if version != PACK_VERSION:
+        raise ValueError('Unsupported game pack version %d. Bad file: %s' %
+                         (version, path))
+
+    start = _header.size
+    dataStart = start + indexLen
+
+    try:
+        index = json.loads(map_[start:dataStart])
+    except ValueError:
+        index = None
+
+    _check_index(index, len(map_) - dataStart, path)
+
+    return index, dataStart
+
+def _write_atomic(path, data, directory):
+    """
+    Write 'data' to 'path' via a temporary file in 'directory,' so other
+    processes never see a partly written file.
+    """
+    fd, tmpPath = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.chmod(tmpPath, 0644)
+
+    try:
+        os.rename(tmpPath, path)
+    except OSError:
+        # On Windows, another process may have written it first
+        os.remove(tmpPath)
+
+###############################################################################
+if __name__ == '__main__':
+    # Compile the game in res/text and the clue media in resmaps
+    import sys
+
+    from gamedata import GameData
+    from ..ui import resmaps
+
+    if len(sys.argv) != 2:
+        sys.exit('usage: python -m jeoparpy.game.gamepack PACKFILE')
+
+    gameData = GameData()
+    media = dict((kind, dict((k, v) for k, v in
+                             getattr(resmaps, kind).iteritems()
+                             if isinstance(k, tuple)))
+                 for kind in MEDIA_KINDS)
+
+    compile_pack(sys.argv[1], gameData.categories, gameData.clues,
+                 gameData.amounts, [p.name for p in gameData.players], media)
+    print 'Wrote %s' % sys.argv[1]
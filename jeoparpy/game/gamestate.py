@@ -180,6 +180,8 @@ class JeopGameState(GameState):
             'ANSWER_INCORRECT',
             'ANSWER_TIMEOUT',
             'ANSWER_NONE',
+            'WAIT_CLUE_CLOSE',
+            'CLOSE_CLUE',
             'DELAY',
             'GAME_END',
             'QUIT')
@@ -225,7 +227,10 @@ class JeopGameState(GameState):
         elif s.state == s.ANSWER_CORRECT:
             s.state = s.DELAY
 
-        elif s.state in (s.ANSWER_NONE, s.ANSWER_TIMEOUT, s.DELAY):
+        elif s.state in (s.ANSWER_NONE, s.ANSWER_TIMEOUT):
+            s.state = s.WAIT_CLUE_CLOSE
+
+        elif s.state in (s.CLOSE_CLUE, s.DELAY):
             s.state = s.WAIT_CHOOSE_CLUE
 
 ##############################################################################
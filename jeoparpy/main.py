@@ -23,32 +23,51 @@ from pygame.locals import *
 import os
 import sys
 
-from config import FPS_LIMIT, FULLSCREEN, SUBTRACT_ON_INCORRECT, SCREEN_SIZE
-from constants import ANIMATIONEND, ANSWER_TIMEOUT, AUDIOEND, SKIP_INTRO_FLAG
+from config import (CLUE_BANK, CLUE_BANK_BOARD, CLUE_BANK_SEED, DEBUG,
+                    FPS_LIMIT, FULLSCREEN, GAME_PACK, IDLE_FRAME_PACING,
+                    MIXER_PROFILE, MIXER_PROFILES, SUBTRACT_ON_INCORRECT,
+                    SCREEN_SIZE)
+from constants import (ANIMATIONEND, ANSWER_TIMEOUT, AUDIOEND,
+                       REBUILD_CACHE_FLAG, ROOT_PATH, SKIP_INTRO_FLAG,
+                       TIME_STARTUP_FLAG, WAKEUP)
+from framepacer import FramePacer
 from game import GameData, JeopGameState
-from ui import Controller, do_congrats, do_credits, do_intro, do_scroll
+from ui import (Controller, do_congrats, do_credits, do_intro, do_scroll,
+                renders)
 
 EVENTS_ALLOWED = (ANIMATIONEND, ANSWER_TIMEOUT,
-                  AUDIOEND, KEYDOWN, MOUSEBUTTONDOWN, QUIT)
+                  AUDIOEND, KEYDOWN, MOUSEBUTTONDOWN, QUIT, WAKEUP)
 
 ###############################################################################
 def main(*flags):
     """Main game loop and event handling."""
     
     # Initialization
+    profile = MIXER_PROFILES[MIXER_PROFILE]
+    pygame.mixer.pre_init(profile['frequency'], -16, 2, profile['buffer'])
     pygame.init()
     #Put window in center of screen
     os.environ ['SDL_VIDEO_WINDOW_POS'] = 'center'
     
+    # The dummy driver (headless runs) defaults to an 8-bit palette, which
+    # the board's drawing does not support
+    depth = 32 if os.environ.get('SDL_VIDEODRIVER') == 'dummy' else 0
     screen = pygame.display.set_mode(SCREEN_SIZE,
-                                     pygame.FULLSCREEN if FULLSCREEN else 0)
+                                     pygame.FULLSCREEN if FULLSCREEN else 0,
+                                     depth)
     pygame.display.set_caption('JeoparPy!')
 
+    if REBUILD_CACHE_FLAG in flags:
+        renders.clear()
+
     # Declarations
-    gameData = GameData()
+    gameData = GameData(GAME_PACK and os.path.join(ROOT_PATH, GAME_PACK),
+                        CLUE_BANK and os.path.join(ROOT_PATH, CLUE_BANK),
+                        CLUE_BANK_BOARD, CLUE_BANK_SEED)
     gs = JeopGameState()
-    uicontroller = Controller(screen, gameData, FPS_LIMIT)
+    uicontroller = Controller(screen, gameData)
     clock = pygame.time.Clock()
+    pacer = FramePacer(FPS_LIMIT, clock)
 
     # Intro sequence (control passed completely to functions)
     if SKIP_INTRO_FLAG not in flags:
@@ -62,11 +81,21 @@ def main(*flags):
     pygame.event.set_allowed(EVENTS_ALLOWED)
     uicontroller.draw(screen)
 
+    # Startup timing: report first board frame and exit (see
+    # benchmarks/first_frame.py)
+    if TIME_STARTUP_FLAG in flags:
+        print 'first board frame'
+        sys.stdout.flush()
+        pygame.quit()
+        return
+
     # Primary loop
     while not gs.state == gs.GAME_END:
         # Events
         handle_events(gs, gameData, uicontroller)
         if gs.state == gs.QUIT:
+            if DEBUG:
+                print pacer.report()
             print 'exiting...'
             pygame.quit()
             sys.exit()
@@ -82,11 +111,17 @@ def main(*flags):
 
         # Cleanup
         pygame.event.pump()
-        clock.tick_busy_loop(FPS_LIMIT)
+        if IDLE_FRAME_PACING and uicontroller.is_idle(gs):
+            pacer.wait(uicontroller.get_next_deadline())
+        else:
+            pacer.tick()
+
+    if DEBUG:
+        print pacer.report()
 
     # Post game: Congratulations screen and credits
     pygame.mouse.set_visible(0)
-    do_congrats(screen, clock, gameData.winners, uicontroller.audioplayer)
+    do_congrats(screen, gameData.winners, uicontroller.audioplayer)
     do_credits(screen, clock, uicontroller.audioplayer, FPS_LIMIT)
     
 ###############################################################################
@@ -119,6 +154,9 @@ def handle_events(gameState, gameData, uicontroller):
             # Re-pass playerI, amount args
             gs.set(gs.ANSWER_INCORRECT, **gs.kwargs)
 
+        elif event.type == AUDIOEND and gs.state == gs.WAIT_CLUE_CLOSE:
+            gs.state = gs.CLOSE_CLUE
+
         elif event.type == AUDIOEND and gs.state == gs.WAIT_CLUE_READ:
             coords = gs.kwargs['coords']
             if uicontroller.clue_is_audioclue(coords):
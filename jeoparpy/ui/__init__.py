@@ -10,14 +10,37 @@ USAGE:
   During primary gameplay, main should directly interact with only a single 
   instance of the Controller class (see controller.py).
   
+  Drawings saved between runs are kept in 'renders' (see rendercache.py).
+
   Special sequences have do_* functions (see below) that main also may call
-  outside of the main game loop.
+  outside of the main game loop. Each sequence's module is imported the
+  first time its do_* function is called, so importing this package does
+  not pay for sequences that may never run (e.g. the intro when it is
+  skipped).
   
 CUSTOMIZATION:
   See instructions in config.py and resmaps.py.
 """
-from categoryscroll import do_scroll
-from congrats import do_congrats
 from controller import Controller
-from credits import do_credits
-from intro import do_intro
+from rendercache import renders
+
+###############################################################################
+def do_congrats(screen, winners, audioPlayer):
+    """See congrats.do_congrats."""
+    from congrats import do_congrats
+    return do_congrats(screen, winners, audioPlayer)
+
+def do_credits(*args, **kwargs):
+    """See credits.do_credits."""
+    from credits import do_credits
+    return do_credits(*args, **kwargs)
+
+def do_intro(*args, **kwargs):
+    """See intro.do_intro."""
+    from intro import do_intro
+    return do_intro(*args, **kwargs)
+
+def do_scroll(*args, **kwargs):
+    """See categoryscroll.do_scroll."""
+    from categoryscroll import do_scroll
+    return do_scroll(*args, **kwargs)
@@ -0,0 +1,136 @@
+"""
+assetloader.py
+
+DESCRIPTION:
+  Contains the load_assets function, which reads and decodes image and
+  sound files concurrently in a pool of worker threads, and
+  decode_sound_async, which decodes one sound file in the background.
+
+USAGE:
+  Call load_assets(imagePaths, soundPaths) to obtain dictionaries mapping
+  each path to a pygame.Surface or pygame.mixer.Sound. Returned images are
+  not yet converted to the display's pixel format; callers should call
+  convert() or convert_alpha() on them as needed.
+
+  The workers only produce raw pixel and sample buffers. The Surface and
+  Sound objects are built from those buffers on the calling thread, as
+  each file finishes, while the workers go on to the remaining files.
+
+  decode_sound_async(path) returns at once; call get() on its result for
+  the raw samples, then build the Sound with
+  pygame.mixer.Sound(buffer=samples).
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+from multiprocessing.pool import ThreadPool
+
+import pygame
+from pygame.locals import SRCALPHA
+
+from config import ASSET_LOAD_THREADS
+from pcmcache import pcm
+
+_IMAGE = 'image'
+_SOUND = 'sound'
+
+_backgroundPool = None  # Created on first use by decode_sound_async
+
+###############################################################################
+def decode_sound_async(path):
+    """
+    Start decoding the sound at 'path' on a background thread, and return
+    a multiprocessing.pool.AsyncResult whose get() returns its raw samples
+    (or raises any error from decoding).
+    """
+    global _backgroundPool
+
+    if _backgroundPool is None:
+        _backgroundPool = ThreadPool(1)
+
+    return _backgroundPool.apply_async(_decode_sound, (path, ))
+
+def load_assets(imagePaths=(), soundPaths=(), numThreads=ASSET_LOAD_THREADS):
+    """
+    Return 2-tuple of dictionaries, (images, sounds), mapping each distinct
+    path in 'imagePaths' to an unconverted pygame.Surface and each distinct
+    path in 'soundPaths' to a pygame.mixer.Sound.
+
+    Files are decoded in a pool of 'numThreads' threads. If 'numThreads'
+    is 1 or less, or there is only one file, they are decoded in turn on
+    the calling thread instead.
+    """
+    jobs = ([(_IMAGE, p) for p in set(imagePaths)] +
+            [(_SOUND, p) for p in set(soundPaths)])
+    # Sounds generally take longest to decode, so start them first
+    jobs.reverse()
+    results = {_IMAGE: {}, _SOUND: {}}
+
+    if numThreads <= 1 or len(jobs) <= 1:
+        decoded = (_decode(job) for job in jobs)
+        _build_all(decoded, results)
+    else:
+        pool = ThreadPool(min(numThreads, len(jobs)))
+        try:
+            _build_all(pool.imap_unordered(_decode, jobs), results)
+        finally:
+            pool.close()
+            pool.join()
+
+    return results[_IMAGE], results[_SOUND]
+
+###############################################################################
+def _build_all(decoded, results):
+    """
+    Build a Surface or Sound from each item yielded by 'decoded' (see
+    _decode) and store it in 'results' by kind and path.
+    """
+    for kind, path, data in decoded:
+        if kind == _IMAGE:
+            results[kind][path] = _build_image(*data)
+        else:
+            results[kind][path] = pygame.mixer.Sound(buffer=data)
+
+def _build_image(buf, size, fmt, colorkey):
+    img = pygame.image.fromstring(buf, size, fmt)
+
+    if colorkey is not None:
+        img.set_colorkey(colorkey)
+
+    return img
+
+def _decode(job):
+    """
+    Run in worker threads. Return 3-tuple (kind, path, data) where 'data'
+    holds what is needed to build the asset on the main thread.
+    """
+    kind, path = job
+
+    if kind == _IMAGE:
+        return kind, path, _decode_image(path)
+    else:
+        return kind, path, _decode_sound(path)
+
+def _decode_image(path):
+    """
+    Return 4-tuple (pixel string, size, string format, colorkey) for the
+    image at 'path,' as accepted by _build_image.
+    """
+    img = pygame.image.load(path)
+    fmt = 'RGBA' if img.get_flags() & SRCALPHA else 'RGB'
+
+    return (pygame.image.tostring(img, fmt), img.get_size(), fmt,
+            img.get_colorkey())
+
+def _decode_sound(path):
+    """
+    Return raw samples of the sound at 'path' in the mixer's format,
+    from the PCM cache if they were saved by an earlier run.
+    """
+    return pcm.get_samples(path)
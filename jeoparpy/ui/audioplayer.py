@@ -1,103 +1,421 @@
+import os
+
 import pygame
 
+from assetloader import decode_sound_async, load_assets
+from config import SOUND_CACHE_BYTES, STREAM_AUDIO_BYTES
+from pcmcache import pcm
 from resmaps import SOUNDS, CLUE_READS
+from ..config import MIXER_PROFILE, MIXER_PROFILES
+from ..util import LRUCache
 
 ###############################################################################
 class AudioPlayer(object):
     """
-    Inits and holds a dictionary of pygame.mixer.Sound objects,
+    Inits and holds a SoundMap of pygame.mixer.Sound objects,
     and provides basic functionality (play, stop, fadeout, etc.)
     by providing aliases to pygame.mixer functions.
 
+    play() returns a SoundHandle. If it is passed an 'endEvent,' the sound
+    is played on one of a few mixer channels reserved by this class, and
+    that event is posted to the pygame event queue when the sound ends,
+    so callers never need to poll the mixer or wait for it.
+
+    Long sounds may instead be streamed from disk through
+    pygame.mixer.music as they play (see __init__), so they are never
+    decoded whole. Only one streamed sound plays at a time; playing
+    another stops the first. Streamed sounds are not in self.sounds, so
+    use 'name in player' to check whether a sound exists.
+
     ATTRIBUTES:
       * sounds
 
     METHODS:
       * fadeout
       * play
+      * prefetch
       * set_volume
       * stop
       * stop_all
-      * wait_until_sound_end
     """
-    def __init__(self, namePathMap={}):
+    def __init__(self, namePathMap={}, numReserved=2,
+                 maxBytes=SOUND_CACHE_BYTES, streamable=(),
+                 streamMinBytes=STREAM_AUDIO_BYTES, dedicated=()):
         """
         namePathMap expects key, value pairs of a descriptive
         name and a full path to a sound file. self.sounds
         will be built automatically from this, if provided.
 
-        By default, creates one Sound object for each ditinct path.
-        Thus, names pointing to the same path in namePathMap
-        will result in names in self.sounds pointing to the same
+        By default, self.sounds is a SoundMap, which decodes each sound
+        when first used and keeps at most 'maxBytes' of decoded sounds.
+        Names pointing to the same path in namePathMap share one Sound
         object.
 
         Users or Subclasses can alter how self.sounds is filled or
         its type, as long as it is indexable and its values are
         pygame.mixer.Sound objects.
+
+        'numReserved' mixer channels are reserved for sounds played with
+        an end event. Each sound named in 'dedicated' also gets a reserved
+        channel that only it plays on, so it always starts at once.
+
+        Names in 'streamable' whose files are at least 'streamMinBytes'
+        on disk are streamed rather than decoded.
         """
-        self.sounds = {}
+        namePathMap = dict(namePathMap or {})
+        self._streams = {}  # name -> path of each streamed sound
+        self._stream = None # StreamHandle of last streamed sound played
+
+        for name in streamable:
+            path = namePathMap.get(name)
+            if path and os.path.getsize(path) >= streamMinBytes:
+                self._streams[name] = namePathMap.pop(name)
+
+        self.sounds = SoundMap(namePathMap, maxBytes)
+        self._padded = {}   # (name, ms) -> Sound, see _get_padded_sound
+        pygame.mixer.set_reserved(numReserved + len(dedicated))
+        if pygame.mixer.get_num_channels() < numReserved + len(dedicated):
+            pygame.mixer.set_num_channels(numReserved + len(dedicated))
 
-        if namePathMap is not None:
-            self._soundset = {}
-            for path in set(namePathMap.values()):
-                self._soundset[path] = pygame.mixer.Sound(path)
+        self._reserved = tuple(pygame.mixer.Channel(i)
+                               for i in xrange(numReserved))
+        self._dedicated = dict(
+            (name, pygame.mixer.Channel(numReserved + i))
+            for i, name in enumerate(dedicated))
+        self._nextReserved = 0
 
-            for name, path in namePathMap.items():
-                self.sounds[name] = self._soundset[path]
+    def __contains__(self, name):
+        return name in self.sounds or name in self._streams
 
     def fadeout(self, ms, name=None):
         """
         If 'name' provided, fades out that specific sound.
         Otherwise, fades out all sounds (alias to pygame.mixer.fadeout).
         """
-        if name:
-            try:
-                self.sounds[name].fadeout(ms)
-            except KeyError:
-                raise MissingSoundError(name)
+        if name in self._streams:
+            if self._is_streaming(name):
+                self._stream.fadeout(ms)
+        elif name:
+            sound = self._get_loaded_sound(name)
+            if sound:
+                sound.fadeout(ms)
         else:
-            pygame.mixer.fadeout(ms)
+            self.fadeout_all(ms)
 
     def fadeout_all(self, ms):
         pygame.mixer.fadeout(ms)
+        pygame.mixer.music.fadeout(ms)
+
+    def play(self, name, loops=0, maxtime=0, fade_ms=0, endEvent=None,
+             endDelay=0):
+        """
+        Play sound 'name' and return a SoundHandle for it.
+
+        If 'endEvent' (a pygame event type) is given, an event of that type
+        is posted when the sound ends, 'endDelay' ms after the end of its
+        audio if provided. Note stopping the sound also posts the event.
+
+        For streamed sounds, a StreamHandle is returned instead, and
+        'maxtime,' 'fade_ms' and 'endDelay' are not supported.
+        """
+        if name in self._streams:
+            return self._play_stream(name, loops, maxtime, fade_ms, endEvent,
+                                     endDelay)
 
-    def play(self, name, loops=0, maxtime=0, fade_ms=0):
         try:
-            self.sounds[name].play(loops, maxtime, fade_ms)
+            sound = self.sounds[name]
         except KeyError:
             raise MissingSoundError(name)
 
+        channel = self._dedicated.get(name)
+
+        if endEvent is None:
+            if channel is None:
+                return SoundHandle(sound.play(loops, maxtime, fade_ms), sound)
+
+            channel.set_endevent()
+            channel.play(sound, loops, maxtime, fade_ms)
+            return SoundHandle(channel, sound)
+
+        if endDelay > 0:
+            sound = self._get_padded_sound(name, endDelay)
+
+        if channel is None:
+            channel = self._get_reserved_channel()
+        else:
+            channel.set_endevent()
+
+        channel.play(sound, loops, maxtime, fade_ms)
+        channel.set_endevent(endEvent)
+
+        return SoundHandle(channel, sound)
+
+    def prefetch(self, *names):
+        """
+        Start decoding sounds 'names' in the background, ahead of being
+        played (see SoundMap.prefetch). Streamed and unknown names are
+        ignored.
+        """
+        self.sounds.prefetch(*names)
+
     def set_volume(self, name, vol):
-        
+        if name in self._streams:
+            if self._is_streaming(name):
+                pygame.mixer.music.set_volume(vol)
+            return
+
         try:
             self.sounds[name].set_volume(vol)
         except KeyError:
             raise MissingSoundError(name)
 
     def stop(self, name):
-        try:
-            self.sounds[name].stop()
-        except KeyError:
-            raise MissingSoundError(name)
+        if name in self._streams:
+            if self._is_streaming(name):
+                self._stream.stop()
+            return
+
+        sound = self._get_loaded_sound(name)
+        if sound:
+            sound.stop()
 
     def stop_all(self):
-        """Alias to pygame.mixer.stop()"""
+        """Stop all sounds, including any streamed sound."""
         pygame.mixer.stop()
+        if self._stream:
+            self._stream.stop()
+
+    def _get_loaded_sound(self, name):
+        """
+        Return Sound 'name' if it is loaded, or None if it is not (and so
+        is not playing). Unlike self.sounds[name], never decodes a file.
+        """
+        if name not in self.sounds:
+            raise MissingSoundError(name)
+
+        try:
+            return self.sounds.get_loaded(name)
+        except AttributeError:
+            # self.sounds replaced by a plain mapping
+            return self.sounds[name]
+
+    def _is_streaming(self, name):
+        """Return True if streamed sound 'name' was the last played."""
+        return self._stream is not None and self._stream.name == name
+
+    def _play_stream(self, name, loops, maxtime, fade_ms, endEvent,
+                     endDelay):
+        if maxtime or fade_ms or endDelay:
+            raise ValueError('maxtime, fade_ms and endDelay are not '
+                             'supported for streamed sound %r' % (name, ))
+
+        music = pygame.mixer.music
+        # Clear end event before load, which stops any current stream
+        music.set_endevent()
+        music.load(self._streams[name])
+        music.set_volume(1.0)
+        music.play(loops)
+        if endEvent is not None:
+            music.set_endevent(endEvent)
+
+        self._stream = StreamHandle(self, name, endEvent)
+
+        return self._stream
+
+    def _get_padded_sound(self, name, ms):
+        """
+        Return a copy of sound 'name' followed by 'ms' of silence, so an
+        end event posted for it arrives 'ms' after the audio ends.
+        """
+        key = (name, ms)
+
+        if key not in self._padded:
+            freq, size, channels = pygame.mixer.get_init()
+            numBytes = int(freq * ms / 1000.0) * channels * (abs(size) / 8)
+            silence = '\x80' if size == 8 else '\0'  # 8-bit is unsigned
+            raw = self.sounds[name].get_raw() + numBytes * silence
+            self._padded[key] = pygame.mixer.Sound(buffer=raw)
+
+        return self._padded[key]
+
+    def _get_reserved_channel(self):
+        """
+        Return the next reserved channel, cycling through them, with any
+        end event from its last use cleared.
+        """
+        channel = self._reserved[self._nextReserved]
+        self._nextReserved = (self._nextReserved + 1) % len(self._reserved)
+        channel.set_endevent()
+
+        return channel
+
+###############################################################################
+class SoundMap(object):
+    """
+    A read-only mapping of names to pygame.mixer.Sound objects, built from
+    a mapping of names to sound file paths.
+
+    A sound file is only decoded when its name is first looked up, and
+    decoded sounds are kept in an LRU cache holding at most 'maxBytes' of
+    samples. A sound is never evicted while it is playing. Names that
+    share a path share one Sound object while it is cached.
+
+    'in' checks and len() use only the names given, so never decode.
+
+    ATTRIBUTES:
+      * cache (read-only)
 
-    # TODO find a better way to accomplish this.
-    # This version is very inconsistent
-    def wait_until_sound_end(self, extraDelay=0):
+    METHODS:
+      * get_loaded
+      * prefetch
+      * warm
+    """
+    def __init__(self, namePathMap, maxBytes):
+        self._paths = dict(namePathMap)
+        self._cache = LRUCache(maxBytes, _get_sound_bytes,
+                               lambda sound: not _is_playing(sound))
+        self._pending = {}  # path -> AsyncResult, see prefetch
+
+    def __contains__(self, name):
+        return name in self._paths
+
+    def __getitem__(self, name):
+        path = self._paths[name]
+        sound = self._cache.get(path)
+
+        if sound is None:
+            pending = self._pending.pop(path, None)
+            if pending:
+                sound = pygame.mixer.Sound(buffer=pending.get())
+            else:
+                sound = pygame.mixer.Sound(buffer=pcm.get_samples(path))
+
+            self._cache.put(path, sound)
+
+        return sound
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def get_loaded(self, name):
+        """
+        Return Sound 'name' if it is currently decoded, otherwise None.
+        Raise KeyError if 'name' is unknown.
         """
-        Return control when pygame.mixer.get_busy returns False.
+        path = self._paths[name]
 
-        If extraDelay given, pygame.time.wait will be called with
-        extraDelay as the argument.
+        return self._cache.get(path) if path in self._cache else None
+
+    def prefetch(self, *names):
+        """
+        Start decoding each sound in 'names' not already decoded on a
+        background thread, so a later lookup only waits for the rest of
+        the decoding. Unknown names are ignored.
         """
-        while pygame.mixer.get_busy():
-            pass
+        for name in names:
+            path = self._paths.get(name)
+
+            if (path is not None and path not in self._cache and
+                    path not in self._pending):
+                self._pending[path] = decode_sound_async(path)
 
-        if extraDelay > 0:
-            pygame.time.wait(extraDelay)
+    def warm(self, names):
+        """Decode each sound in 'names' not already decoded, concurrently."""
+        paths = set(self._paths[n] for n in names)
+        missing = [p for p in paths
+                   if p not in self._cache and p not in self._pending]
+
+        for path, sound in load_assets((), missing)[1].iteritems():
+            self._cache.put(path, sound)
+
+    @property
+    def cache(self):
+        """The underlying LRUCache, keyed by path."""
+        return self._cache
+
+###############################################################################
+class SoundHandle(object):
+    """
+    Refers to one play of a sound, as returned by AudioPlayer.play.
+
+    'channel' is the pygame.mixer.Channel the sound plays on; it is None if
+    no channel was free, in which case the sound is not playing and the
+    methods below do nothing.
+
+    ATTRIBUTES:
+      * channel
+      * sound
+
+    METHODS:
+      * fadeout
+      * get_busy
+      * stop
+    """
+    def __init__(self, channel, sound):
+        self.channel = channel
+        self.sound = sound
+
+    def fadeout(self, ms):
+        if self._is_current():
+            self.channel.fadeout(ms)
+
+    def get_busy(self):
+        """Return True if this sound is still playing."""
+        return self._is_current() and self.channel.get_busy()
+
+    def stop(self):
+        if self._is_current():
+            self.channel.stop()
+
+    def _is_current(self):
+        """Return True if the channel has not moved on to another sound."""
+        return (self.channel is not None and
+                self.channel.get_sound() is self.sound)
+
+###############################################################################
+class StreamHandle(object):
+    """
+    Refers to one play of a streamed sound, as returned by AudioPlayer.play.
+    Provides the same methods as SoundHandle; they do nothing once
+    another streamed sound has been played.
+
+    pygame.mixer.music only posts its end event when a sound finishes or
+    fades out, so stop() posts 'endEvent' itself, as a stopped channel
+    would.
+
+    ATTRIBUTES:
+      * endEvent
+      * name
+
+    METHODS:
+      * fadeout
+      * get_busy
+      * stop
+    """
+    def __init__(self, player, name, endEvent=None):
+        self.endEvent = endEvent
+        self.name = name
+        self._player = player
+
+    def fadeout(self, ms):
+        if self._is_current():
+            pygame.mixer.music.fadeout(ms)
+
+    def get_busy(self):
+        """Return True if this sound is still playing."""
+        return self._is_current() and pygame.mixer.music.get_busy()
+
+    def stop(self):
+        if self.get_busy():
+            pygame.mixer.music.stop()
+            if self.endEvent is not None:
+                pygame.event.post(pygame.event.Event(self.endEvent))
+
+    def _is_current(self):
+        return self._player._stream is self
 
 ###############################################################################
 class JeopAudioPlayer(AudioPlayer):
@@ -108,7 +426,36 @@ class JeopAudioPlayer(AudioPlayer):
             key = pos + ('cr', )
             reads[key] = path
             
-        super(JeopAudioPlayer, self).__init__(dict(SOUNDS, **reads))
+        # Audio clues (keyed by coordinates) may be streamed if long
+        streamable = [k for k in SOUNDS if not isinstance(k, basestring)]
+
+        super(JeopAudioPlayer, self).__init__(
+            dict(SOUNDS, **reads), streamable=streamable,
+            dedicated=MIXER_PROFILES[MIXER_PROFILE]['reserved'])
+
+        # Game sounds are decoded up front; clue readings and audio clues
+        # only once their clue is chosen (see SoundMap.prefetch).
+        self.sounds.warm(n for n in SOUNDS if isinstance(n, basestring))
+
+###############################################################################
+def _get_sound_bytes(sound):
+    """Return size in bytes of the samples in 'sound.'"""
+    freq, size, channels = pygame.mixer.get_init()
+
+    return int(round(sound.get_length() * freq)) * channels * abs(size) / 8
+
+def _is_playing(sound):
+    """
+    Return True if 'sound' is playing on any mixer channel.
+    Sound.get_num_channels is not used, as it still counts channels
+    on which the sound was stopped.
+    """
+    for i in xrange(pygame.mixer.get_num_channels()):
+        channel = pygame.mixer.Channel(i)
+        if channel.get_busy() and channel.get_sound() is sound:
+            return True
+
+    return False
 
 ###############################################################################
 class MissingSoundError(Exception):
@@ -20,13 +20,12 @@ of source code from this file.
 
 import pygame
 
-from config import CATEGORY_HOLD_TIME
+from config import CATEGORY_HOLD_TIME, CATEGORY_SCROLL_TIME
 from constants import JEOP_BLUE
 from resmaps import FONTS
 from util import (autofit_text, BorderedBox, draw_centered_textblock,
-                  get_anim_data, shadow_text)
+                  ease_in_out)
 from ..config import FPS_LIMIT
-from ..util import chunker
 
 ###############################################################################
 def do_scroll(screen, clock, categories):
@@ -37,50 +36,69 @@ def do_scroll(screen, clock, categories):
 
     'categories' expects container of category name strings.
     'screen' must be the primary pygame display surface.
+
+    Each box after the first is built while the box before it is held,
+    so the hold only waits out whatever time building did not use.
     """
     scrSize = screen.get_size()
-    boxes = tuple(_build_box(scrSize, c) for c in categories)
-    numFrames, step, fpsLimit = get_anim_data(1.0, scrSize[0], FPS_LIMIT)
+    box = _build_box(scrSize, categories[0])
 
-    #Hold on each box, then scroll
-    for box, nextBox in chunker(boxes, 2, True):
+    #Hold on each box while building the next, then scroll
+    for category in categories[1:]:
         _blit_to_screen_and_update(screen, box)
-        pygame.time.delay(CATEGORY_HOLD_TIME)
-        _animate_scroll(screen, scrSize, clock, box, nextBox, step, fpsLimit)
+        holdEnd = pygame.time.get_ticks() + CATEGORY_HOLD_TIME
+        nextBox = _build_box(scrSize, category)
+        _delay_until(holdEnd)
+        _animate_scroll(screen, clock, box, nextBox, CATEGORY_SCROLL_TIME)
+        box = nextBox
 
     #Draw final box and hold
-    _blit_to_screen_and_update(screen, boxes[-1])
+    _blit_to_screen_and_update(screen, box)
     pygame.time.delay(CATEGORY_HOLD_TIME)
                         
 ###############################################################################
-def _animate_scroll(screen, scrSize, clock, box1, box2, step, fpsLimit):
-    """
-    Scrolls box to the left, filling in space with box2 until
-    box2 fills the screen. The boxes must be surfaces.
-    'step' is the amount in pixels to shift the boxes on
-    each animation step.
+def _animate_scroll(screen, clock, box1, box2, time):
     """
-    w, h = scrSize
-    offset = step
-
-    while offset <= w:
-        #Update showing areas
-        area1 = pygame.Rect(offset, 0, w - offset, h)
-        area2 = pygame.Rect(0, 0, offset, h)
-
-        #Blit and update
-        screen.blit(box1, (0, 0), area1)
-        screen.blit(box2, (w - offset, 0), area2)
-        pygame.display.update()
+    Scrolls box1, assumed to be on screen, to the left, filling in space
+    with box2 until box2 fills the screen, over 'time' seconds. The boxes
+    must be BorderedBox objects with equal borders.
 
-        #Increment offset and tick clock/fps limiter
-        offset += step
-        clock.tick_busy_loop(fpsLimit) 
+    On each frame, the screen's contents are shifted with Surface.scroll
+    and only the newly exposed strip of box2 is blitted. The solid top and
+    bottom borders never change, so they are left out of display updates.
+    """
+    w, h = screen.get_size()
+    top, right, bottom, left = box2.borderWidths
+    updateRect = pygame.Rect(0, top, w, h - top - bottom)
+    ms = int(1000 * time)
+    start = pygame.time.get_ticks()
+    offset = 0
+
+    while offset < w:
+        t = min(1.0, float(pygame.time.get_ticks() - start) / ms)
+        newOffset = int(round(w * ease_in_out(t)))
+        shift = newOffset - offset
+
+        if shift:
+            screen.scroll(-shift)
+            screen.blit(box2, (w - shift, 0),
+                        pygame.Rect(offset, 0, shift, h))
+            pygame.display.update(updateRect)
+            offset = newOffset
+
+        clock.tick(FPS_LIMIT)
 
 def _blit_to_screen_and_update(screen, sfc):
     screen.blit(sfc, (0, 0))
     pygame.display.update()
 
+def _delay_until(ticks):
+    """Wait until pygame.time.get_ticks() reaches 'ticks.'"""
+    remaining = ticks - pygame.time.get_ticks()
+
+    if remaining > 0:
+        pygame.time.delay(remaining)
+
 def _build_box(size, category):
     """
     Return surface containing centered category text and a black border.
@@ -19,3 +19,75 @@ of source code from this file.
 # category name during the category scroll at the start of the game.
 CATEGORY_HOLD_TIME = 2500
 
+# This is the time, in seconds, taken to scroll from one category name to
+# the next during the category scroll.
+CATEGORY_SCROLL_TIME = 1.0
+
+# This is the maximum number of fonts (each a distinct font file and size)
+# kept loaded at once. Fitting text to a box tries several sizes, so this
+# should be comfortably larger than the number of fonts used in the game.
+FONT_CACHE_SIZE = 128
+
+# This is the memory, in bytes, that may be used to keep rendered text
+# (scores, dollar amounts, names, etc.) so it need not be rendered again.
+TEXT_CACHE_BYTES = 16 * 1024 * 1024
+
+# This is the memory, in bytes, that may be used to keep decoded and
+# resized images (e.g. clue images) so they need not be loaded again.
+# Large photos take roughly 4 bytes per pixel once decoded.
+IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# This is the memory, in bytes, that may be used to keep decoded sounds.
+# Game sounds are decoded at startup; clue readings and audio clues are
+# decoded when their clue is chosen, and the least recently played are
+# dropped (never while playing) once this limit is reached. At the
+# required 22050 Hz, a minute of 16-bit stereo audio takes about 5 MB.
+SOUND_CACHE_BYTES = 128 * 1024 * 1024
+
+# Audio clue files at least this large, in bytes on disk, are streamed
+# from disk as they play instead of being decoded whole first, so they
+# take little memory however long they are.
+STREAM_AUDIO_BYTES = 1024 * 1024
+
+# This is the directory, relative to the JeoparPy root directory, in which
+# decoded sounds are saved so later runs need not decode them again.
+# Files in it can safely be deleted. Set to None to disable saving.
+AUDIO_CACHE_DIR = 'cache/audio'
+
+# This is the directory, relative to the JeoparPy root directory, in which
+# images resized to the screen and the drawn game board are saved so later
+# runs need not draw them again. Set to None to disable saving.
+RENDER_CACHE_DIR = 'cache/render'
+
+# This is the most disk space, in bytes, that RENDER_CACHE_DIR may use.
+# Drawings for other screen sizes or older games are removed, least
+# recently used first, to stay within it.
+RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+# This is the directory, relative to the JeoparPy root directory, into
+# which clue images and sounds are extracted from game packs. Files in it
+# can safely be deleted; they are extracted again when needed.
+PACK_MEDIA_DIR = 'cache/packs'
+
+# This is the number of threads used to read and decode image and sound
+# files at startup. Set to 1 to load them one at a time.
+ASSET_LOAD_THREADS = 4
+
+# If True and NumPy is installed, fades and dissolves blend whole pixel
+# arrays with NumPy instead of using surface alpha blits. Alpha blits are
+# faster on most machines (about 4.5 ms against 9 ms per 1280x720 frame),
+# so this is off by default.
+TRANSITION_NUMPY = False
+
+# This is the time, in seconds, that a clue takes to grow from its box on
+# the board to fill the board when clicked.
+CLUE_OPEN_TIME = 0.5
+
+# If True, the clue's text is revealed as its box grows when it is opened.
+# If False, a blank box grows and the text appears once it fills the board.
+CLUE_OPEN_REVEAL = False
+
+# This is the time, in seconds, over which the dollar amounts appear on the
+# board at the start of the game. If None, the length of the 'fill' sound
+# is used.
+BOARD_FILL_TIME = None
@@ -20,26 +20,28 @@ of source code from this file..
 import pygame
 
 from constants import JEOP_BLUE
+from fontregistry import get_font
 from resmaps import FONTS
-from util import scale
+from transition import fade
+from util import render_text, scale, wait_for_event
+from ..constants import AUDIOEND
 
-def do_congrats(screen, clock, winners, audioPlayer):
+def do_congrats(screen, winners, audioPlayer):
     """
     Fade out the last image on the screen, draw a congratulatory message,
     then draw the names of the winning players.
     """
-    lastScreen = screen.copy()
-    w, h = size = lastScreen.get_size()
-    sfc = pygame.Surface(size)
+    sfc = pygame.Surface(screen.get_size())
+    sfc.fill(JEOP_BLUE)
 
-    _fade_in_sfc(screen, sfc, clock, 2.0)
-    audioPlayer.play('applause')
+    fade(screen, sfc, 2.0)
+    audioPlayer.play('applause', endEvent=AUDIOEND, endDelay=1000)
     congratsBottom = _animate_congrats(screen, sfc)
     winnersRect = _draw_winners(sfc, congratsBottom + 20, winners)
 
     screen.blit(sfc, (0, 0))
     pygame.display.update(winnersRect)
-    audioPlayer.wait_until_sound_end(1000)
+    wait_for_event(AUDIOEND)
     
 def _animate_congrats(screen, sfc):
     """
@@ -50,14 +52,14 @@ def _animate_congrats(screen, sfc):
     """
     word = 'CONGRATULATIONS!'
     sfcRect = sfc.get_rect()
-    font = pygame.font.Font(FONTS['congrats'], scale(150, sfcRect.h, 768))
+    font = get_font(FONTS['congrats'], scale(150, sfcRect.h, 768))
     rect = pygame.Rect((0, 0), font.size(word))
     rect.centerx = sfcRect.centerx
     rect.y = sfcRect.y + int(.20*sfcRect.h)
     x, y = rect.topleft
 
     for c in word:
-        char = font.render(c, 1, (255, 255, 255), JEOP_BLUE)
+        char = render_text(font, c, (255, 255, 255), 1, JEOP_BLUE)
         sfc.blit(char, (x, y))
 
         screen.blit(sfc, (0, 0))
@@ -82,8 +84,8 @@ def _draw_winners(sfc, startY, winners):
 
     for i, name in winners:
         fName = 'team' + str(i + 1)
-        font = pygame.font.Font(FONTS[fName], scale(120, sfcRect.h, 768))
-        text = font.render(name, 1, (255, 255, 255), JEOP_BLUE)
+        font = get_font(FONTS[fName], scale(120, sfcRect.h, 768))
+        text = render_text(font, name, (255, 255, 255), 1, JEOP_BLUE)
         tRect = text.get_rect()
         tRect.centerx = rect.centerx
         tRect.y = y
@@ -92,21 +94,3 @@ def _draw_winners(sfc, startY, winners):
         y += tRect.h + 5
 
     return rect
-
-# TODO Abstract into generic function
-def _fade_in_sfc(screen, sfc, clock, time):
-    """
-    Fade in 'sfc' over 'time' (in seconds), essentially fading out
-    the last image on 'screen.'
-    """
-    lastScreen = screen.copy()
-    fpsGoal = int(255.0 / time) # frames to draw / time to spend in secs
-    sfc.fill(JEOP_BLUE)
-    
-    for alpha in xrange(256):
-        sfc.set_alpha(alpha)
-        screen.blit(lastScreen, (0, 0))
-        screen.blit(sfc, (0, 0))
-        
-        pygame.display.update()
-        clock.tick_busy_loop(fpsGoal)
@@ -18,11 +18,7 @@ of source code from this file.
 from os import path
 
 from ..constants import ROOT_PATH
-from ..util import get_first_textline, get_stripped_nonempty_file_lines
-
-_rulesPath = path.join(ROOT_PATH, 'res', 'text', 'rules.txt')
-_subPath = path.join(ROOT_PATH, 'res', 'text', 'subtitle.txt')
 
 JEOP_BLUE = (16, 26, 124) # RGB color
-SUBTITLE = get_first_textline(_subPath)
-RULES = get_stripped_nonempty_file_lines(_rulesPath)
+RULES_PATH = path.join(ROOT_PATH, 'res', 'text', 'rules.txt')
+SUBTITLE_PATH = path.join(ROOT_PATH, 'res', 'text', 'subtitle.txt')
@@ -13,12 +13,18 @@ viewable at http://opensource.org/licenses/GPL-3.0
 This copyright notice must be retained with any use
 of source code from this file.
 """
+import os
+
 import pygame
 
 from audioplayer import JeopAudioPlayer
+from config import (BOARD_FILL_TIME, CLUE_OPEN_REVEAL, CLUE_OPEN_TIME,
+                    PACK_MEDIA_DIR)
 from maingame import Clue, GameBoard, OpenClueAnimation, PodiaPanel
+from resmaps import use_game_media, use_pack_media
+from util import blit_areas, merge_rects
 from ..config import DEBUG
-from ..constants import AUDIOEND
+from ..constants import AUDIOEND, ROOT_PATH
 
 ###############################################################################
 class Controller(object):
@@ -35,33 +41,56 @@ class Controller(object):
       * clue_is_audioclue
       * draw
       * get_clicked_clue
+      * get_next_deadline
+      * is_idle
       * update
     """
-    def __init__(self, screen, gameData, fpsLimit):
+    def __init__(self, screen, gameData):
         w, h  = size = screen.get_size()
+
+        # Clue media of a game pack or bank must be in place before it
+        # is loaded
+        if gameData.pack is not None:
+            use_pack_media(gameData.pack,
+                           os.path.join(ROOT_PATH, PACK_MEDIA_DIR))
+        elif gameData.media is not None:
+            use_game_media(gameData.media)
+
+        self.audioplayer = JeopAudioPlayer()
+
+        # Cells are revealed over the length of the fill sound by default
+        fillTime = (BOARD_FILL_TIME or
+                    self.audioplayer.sounds['fill'].get_length())
         
-        board = GameBoard((.75*w, h), gameData)
+        board = GameBoard((.75*w, h), gameData, int(1000 * fillTime))
         board.dirty = True
         podia = PodiaPanel((.25*w, h), gameData)
         podia.dirty = True
         podia.rect.left = .75*w
         clue = Clue((.75*w, h))
 
-        spr = OpenClueAnimation(board.boxSize, board.rect.copy(), fpsLimit)
+        spr = OpenClueAnimation(board.boxSize, board.rect.copy(),
+                                CLUE_OPEN_TIME)
 
         # NOTE Order of self._sfcs is draw order
         self._sfcs = (board, podia, spr, clue) 
-        self.audioplayer = JeopAudioPlayer()
+        self._clue = clue
+        self._clueAnimation = spr
+        self._cardsReady = False
 
     def clue_has_audio_reading(self, coords):
-        return coords + ('cr', ) in self.audioplayer.sounds
+        return coords + ('cr', ) in self.audioplayer
 
     def clue_is_audioclue(self, coords):
-        return coords in self.audioplayer.sounds
+        return coords in self.audioplayer
 
     def draw(self, screen):
         """
         Redraw any surface which requires it, and update the screen.
+
+        Only the areas a surface lists in its 'dirtyRects' attribute (if
+        it has one) are redrawn; overlapping areas are merged first.
+        A dirty surface that lists no areas is redrawn entirely.
         """
         dirtyRects = []
 
@@ -71,15 +100,23 @@ class Controller(object):
                     print 'draw %s' % type(sfc).__name__
 
                 if isinstance(sfc, pygame.sprite.Sprite):
-                    screen.blit(sfc.image, sfc.rect)
+                    img = sfc.image
                 else:
                     #Case: sfc is pygame.Surface
-                    screen.blit(sfc, sfc.rect)
+                    img = sfc
+
+                areas = getattr(sfc, 'dirtyRects', None)
+                if areas:
+                    dirtyRects.extend(blit_areas(screen, img, sfc.rect.topleft,
+                                                 merge_rects(areas)))
+                    del areas[:]
+                else:
+                    screen.blit(img, sfc.rect)
+                    dirtyRects.append(sfc.rect)
 
-                dirtyRects.append(sfc.rect)
                 sfc.dirty = False
 
-        pygame.display.update(dirtyRects)
+        pygame.display.update(merge_rects(dirtyRects))
 
     def get_clicked_clue(self, clickPos):
         """
@@ -88,6 +125,30 @@ class Controller(object):
         otherwise return None.
         """
         return self._sfcs[0].get_clicked_clue(clickPos)
+
+    def get_next_deadline(self):
+        """
+        Return time (via pygame.time.get_ticks()) at which a running timer
+        will next need to be updated, or None if no timer is running.
+        """
+        return self._clue.timerEndTime
+
+    def is_idle(self, gameState):
+        """
+        Return True if nothing on screen will change until an event
+        arrives or the time given by get_next_deadline() passes, so main
+        need not run another frame until then.
+        """
+        gs = gameState
+        idleStates = (gs.WAIT_CHOOSE_CLUE, gs.WAIT_TRIGGER_AUDIO,
+                      gs.WAIT_CLUE_READ, gs.WAIT_BUZZ_IN, gs.WAIT_CLUE_CLOSE)
+
+        if gs.state not in idleStates:
+            return False
+        if gs.state == gs.WAIT_CHOOSE_CLUE and not self._cardsReady:
+            return False
+
+        return not any(sfc.dirty for sfc in self._sfcs)
         
     def update(self, gameState, gameData):
         """Update the ui modules based on game state and data."""
@@ -95,11 +156,15 @@ class Controller(object):
 
         if gs.state == gs.CLICK_CLUE:
             pygame.mouse.set_visible(0)
-        elif gs.state in (gs.ANSWER_CORRECT, gs.ANSWER_NONE,
-                          gs.ANSWER_TIMEOUT):
+            # Start decoding any audio for the clue while it opens
+            coords = gs.kwargs['coords']
+            self.audioplayer.prefetch(coords, coords + ('cr', ))
+        elif gs.state in (gs.ANSWER_CORRECT, gs.CLOSE_CLUE):
             pygame.mouse.set_visible(1)
-        elif gs.state == gs.WAIT_CLUE_READ and not pygame.mixer.get_busy():
-            pygame.event.post(pygame.event.Event(AUDIOEND))
+
+        if gs.state == gs.CLICK_CLUE and CLUE_OPEN_REVEAL:
+            card = self._clue.get_card(gs.kwargs['coords'], gameData)
+            self._clueAnimation.set_card(*card)
         
         # Update all game surfaces
         # Note these surface's update() method is responsible for updating
@@ -107,28 +172,41 @@ class Controller(object):
         for sfc in self._sfcs:
             sfc.update(gs, gameData)
 
-        self._play_update_sounds(gameState)
+        # Render clue cards ahead of time, one per frame, while the game
+        # is otherwise waiting on the host.
+        if gs.state in (gs.WAIT_BOARD_FILL, gs.WAIT_CHOOSE_CLUE):
+            self._cardsReady = not self._clue.prepare_next_card(gameData)
+
+        self._play_update_sounds(gameState, gameData)
 
-    def _play_update_sounds(self, gameState):
+    def _play_update_sounds(self, gameState, gameData):
+        """
+        Play any sound called for by the game state. Sounds whose end the
+        game must wait on (clue readings, and the sounds that close a clue
+        no one answered) post AUDIOEND when they finish.
+        """
         gs = gameState
 
         if gs.state == gs.BOARD_FILL:
             self.audioplayer.play('fill')
         elif gs.state == gs.CLUE_OPEN:
             key = gs.kwargs['coords'] + ('cr', )
-            if key in self.audioplayer.sounds:
-                self.audioplayer.play(key)
+            if key in self.audioplayer:
+                self.audioplayer.play(key, endEvent=AUDIOEND)
         elif gs.state == gs.PLAY_CLUE_AUDIO:
             coords = gs.kwargs['coords']
-            if coords in self.audioplayer.sounds:
+            if coords in self.audioplayer:
                 self.audioplayer.play(coords)
         elif gs.state == gs.BUZZ_IN:
             self.audioplayer.stop_all()
             self.audioplayer.play('buzz')
         elif gs.state == gs.ANSWER_INCORRECT:
-            self.audioplayer.play('wrong')
+            if gameData.allPlayersAnswered:
+                # Clue closes (via ANSWER_NONE) once this sound ends
+                self.audioplayer.play('wrong', endEvent=AUDIOEND,
+                                      endDelay=350)
+            else:
+                self.audioplayer.play('wrong')
         elif gs.state == gs.ANSWER_TIMEOUT:
-            self.audioplayer.play('outoftime')
-            self.audioplayer.wait_until_sound_end(200)
-        elif gs.state == gs.ANSWER_NONE:
-            self.audioplayer.wait_until_sound_end(350)
+            self.audioplayer.play('outoftime', endEvent=AUDIOEND,
+                                  endDelay=200)
@@ -7,7 +7,9 @@ DESCRIPTION:
   and SimpleCreditLine.
 
 USAGE:
-  Main should call only do_credits.
+  Main should call only do_credits. The credits are drawn once, when
+  do_credits is called, onto a single tall surface that is then scrolled
+  up the screen.
   
 
 Copyright (C) 2013 Adam Beagle - All Rights Reserved
@@ -24,13 +26,17 @@ import pygame
 from pygame.locals import QUIT, KEYDOWN, K_q
 
 from constants import JEOP_BLUE
+from fontregistry import get_font
+from imagecache import images
 from resmaps import FONTS, IMAGES
-from util import get_anim_data, scale, shadow_text
+from util import render_text, scale, shadow_text
 
 ###############################################################################
 class CreditLine(pygame.sprite.DirtySprite):
     """
     Defines a DirtySprite for a line of text in a credit sequence.
+    Lines are drawn once, at their rect, onto the credits strip by
+    _build_strip; the strip, not each line, is scrolled.
     
     Should be used as a base class; if not, caller must initialize
     'image' and 'rect' attributes.
@@ -39,9 +45,6 @@ class CreditLine(pygame.sprite.DirtySprite):
       * dirty
       * image
       * rect
-
-    METHODS:
-      * update
     """
     def __init__(self, *groups):
         super(CreditLine, self).__init__(*groups)
@@ -49,21 +52,6 @@ class CreditLine(pygame.sprite.DirtySprite):
         self.image = None
         self.rect = None
 
-    def update(self, step, scrH):
-        """
-        Move line in y by step. A positive step will move line
-        down, a negative will move it up.
-
-        The height of the screen, 'scrH' is used to set the dirty
-        attribute; if the sprite is outside the bounds of the screen,
-        it will not be drawn.
-        """
-        self.dirty = 0
-        self.rect.y += step
-
-        if self.rect.y <= scrH and self.rect.bottom >= 0:
-            self.dirty = 1
-
 ###############################################################################
 class CreditImage(CreditLine):
     """
@@ -85,8 +73,8 @@ class MultiCreditLine(CreditLine):
       Position    Name 1               Multi-    Name
                   Name 2        Line Position
 
-    Usage: After initialization, set 'rect' to start position then
-      call update() on every frame.
+    Usage: After initialization, set 'rect.y' to the line's position in
+      the credits; _build_strip draws it there once.
     """
     def __init__(self, width, font, position, name, *groups):
         """
@@ -113,9 +101,9 @@ class MultiCreditLine(CreditLine):
         spacer.centerx = int(width / 2)
         lineH = font.get_linesize()
 
-        position = [(font.render(s, 1, (200, 200, 200)), s)
+        position = [(render_text(font, s, (200, 200, 200)), s)
                     for s in position]
-        name = [(font.render(s, 1, (255, 255, 255)), s)
+        name = [(render_text(font, s, (255, 255, 255)), s)
                 for s in name]
 
         position = [(s, s.get_rect(), text) for s, text in position]
@@ -146,8 +134,8 @@ class SimpleCreditLine(CreditLine):
     Defines a line of text in a credits sequence that is a single
     string, all of the same font.
     
-    Usage: After initialization, set 'rect' to start position then
-      call update() on every frame.
+    Usage: After initialization, set 'rect.y' to the line's position in
+      the credits; _build_strip draws it there once.
     """
     def __init__(self, font, text, color, bgColor, shadowOffset, *groups):
         """If shadowOffset is 0 or None, no shadow will be drawn."""
@@ -158,13 +146,13 @@ class SimpleCreditLine(CreditLine):
             size[1] += shadowOffset
             self.image = pygame.Surface(size)
             self.image.fill(bgColor)
-            line = font.render(text, 1, color)
+            line = render_text(font, text, color)
             rect = line.get_rect()
             shadow, shadRect = shadow_text(text, rect, font, shadowOffset)
             self.image.blit(shadow, shadRect)
             self.image.blit(line, (0, 0))
         else:                        
-            self.image = font.render(text, 1, color, bgColor)
+            self.image = render_text(font, text, color, 1, bgColor)
             
         self.rect = self.image.get_rect()
 
@@ -197,6 +185,7 @@ names = ('Adam Beagle',
          "Presley 'Chadwick' Madill"
          )
 
+# Keys of IMAGES entries are drawn as images; all else as text
 final = ('Catering by',
          'Mancinos of Alpena, MI',
          '',
@@ -204,29 +193,27 @@ final = ('Catering by',
          '',
          'Brought to you by',
          'Lamonster Solutions',
-         pygame.image.load(IMAGES['lamonster']),
+         'lamonster',
          )
 
+# Time, in seconds, for credits to scroll by (length of 'end' sound)
+SCROLL_TIME = 33.2
+
 def do_credits(screen, clock, audioPlayer, fpsLimit):
     """Main should call this function to initiate the credit scroll."""
     scrRect = screen.get_rect()
     lineW = int(.75*scrRect.w)
-    font = pygame.font.Font(FONTS['credits'], scale(30, lineW, 1024))
-    lines = pygame.sprite.Group()
-    startY = scrRect.h + 1
+    font = get_font(FONTS['credits'], scale(30, lineW, 1024))
+    lines = []
     spacer = scale(50, lineW, 1024) #Y-space between lines
 
-    startY = _build_multi_lines(lines, font, startY, spacer, lineW, scrRect)
-    finalLineBottom = _build_final_lines(lines, font,
-                                         startY + scale(100, lineW, 1024),
-                                         lineW,scrRect)
-    
-    numFrames, step, fpsLimit = get_anim_data(33.2, -1*finalLineBottom,
-                                              fpsLimit)
-    
+    startY = _build_multi_lines(lines, font, 0, spacer, lineW)
+    _build_final_lines(lines, font, startY + scale(100, lineW, 1024), lineW)
+    strip = _build_strip(lines)
+
     pygame.event.clear()
     audioPlayer.play('end')
-    _scroll_credits(screen, scrRect, clock, lines, numFrames, step, fpsLimit)
+    _scroll_credits(screen, scrRect, clock, strip, SCROLL_TIME, fpsLimit)
 
     _blit_thanks(screen, 'Thanks for playing!', font, scrRect, lineW)
     pygame.time.delay(5000)
@@ -234,7 +221,7 @@ def do_credits(screen, clock, audioPlayer, fpsLimit):
     exit()
 
 def _blit_thanks(screen, text, font, scrRect, lineW):
-    thanks = font.render(text, 1, (255, 255, 255))
+    thanks = render_text(font, text, (255, 255, 255))
     rect = thanks.get_rect()
     rect.center = scrRect.center
     shadow, shadRect = shadow_text(text, rect, font, scale(3, lineW, 1024))
@@ -243,51 +230,91 @@ def _blit_thanks(screen, text, font, scrRect, lineW):
     screen.blit(thanks, rect)
     pygame.display.update()
 
-def _build_final_lines(group, font, startY, lineW, scrRect):
+def _build_final_lines(lines, font, startY, lineW):
     """
-    Build final line sprites and adds them to 'group.'
+    Build final line sprites and append them to 'lines.'
     Return final line's rect.bottom.
     """
     for s in final:
-        if isinstance(s, pygame.Surface):
-            line = CreditImage(s, group)
+        if s in IMAGES:
+            line = CreditImage(images.load(IMAGES[s]))
         else:
             line = SimpleCreditLine(font, s, (255, 255, 255),
-                                      JEOP_BLUE, scale(4, lineW, 1024), group)
+                                      JEOP_BLUE, scale(4, lineW, 1024))
 
         line.rect.y = startY
-        line.rect.centerx = scrRect.centerx
+        lines.append(line)
         finalLineBottom = line.rect.bottom
         startY = line.rect.bottom + scale(5, lineW, 1024)
 
     return finalLineBottom
     
-def _build_multi_lines(group, font, startY, spacer, lineW, scrRect):
+def _build_multi_lines(lines, font, startY, spacer, lineW):
     """
-    Build credit line sprites (from position and name), and add them to 
-    'group.'
+    Build credit line sprites (from position and name), and append them
+    to 'lines.'
 
     Return y-value at which to start placing any further lines.
     """
     for pos, name in zip(positions, names):
-        line = MultiCreditLine(lineW, font, pos, name, group)
+        line = MultiCreditLine(lineW, font, pos, name)
         line.rect.y = startY
-        line.rect.centerx = scrRect.centerx
+        lines.append(line)
 
         startY = line.rect.bottom + spacer
 
     return startY
 
-def _scroll_credits(screen, scrRect, clock, lines, numFrames, step, fpsLimit):
+def _build_strip(lines):
+    """
+    Return surface just large enough to hold every line in 'lines,'
+    with each line drawn on it horizontally centered at its rect.y.
+    """
+    w = max(line.rect.w for line in lines)
+    h = max(line.rect.bottom for line in lines)
+    strip = pygame.Surface((w, h))
+    strip.fill(JEOP_BLUE)
+
+    for line in lines:
+        line.rect.centerx = w / 2
+        strip.blit(line.image, line.rect)
+
+    return strip
+
+def _scroll_credits(screen, scrRect, clock, strip, time, fpsLimit):
+    """
+    Scroll 'strip' up from just below the bottom of the screen until its
+    bottom reaches the top, over 'time' seconds. The position is based on
+    time elapsed, so dropped frames do not slow the scroll.
+
+    Each frame, only the visible part of the strip is blitted, plus any
+    row uncovered below it, and only the strip's column is updated.
+    """
+    column = strip.get_rect(centerx=scrRect.centerx, y=scrRect.h + 1)
+    distance = column.bottom
+    startY = column.y
+    ms = int(1000 * time)
+    start = pygame.time.get_ticks()
+    lastBottom = column.bottom
+    updateRect = pygame.Rect(column.x, 0, column.w, scrRect.h)
+    t = 0.0
+
     screen.fill(JEOP_BLUE)
-    bg = screen.copy()
-    
-    for frame in xrange(numFrames):
-        lines.update(step, scrRect.h)
-        lines.clear(screen, bg)
-        lines.draw(screen)
-        pygame.display.update()
-        clock.tick_busy_loop(fpsLimit)
+    pygame.display.update()
+
+    while t < 1:
+        t = min(1.0, float(pygame.time.get_ticks() - start) / ms)
+        column.y = startY - int(round(distance * t))
+        visible = column.clip(scrRect)
+
+        screen.blit(strip, visible, visible.move(-column.x, -column.y))
+        if lastBottom > column.bottom:
+            screen.fill(JEOP_BLUE, (column.x, column.bottom, column.w,
+                                    lastBottom - column.bottom))
+        lastBottom = column.bottom
+
+        pygame.display.update(updateRect)
+        clock.tick(fpsLimit)
 
         for event in pygame.event.get():
             if event.type == QUIT or (event.type == KEYDOWN and
@@ -0,0 +1,90 @@
+"""
+fontregistry.py
+
+DESCRIPTION:
+  Contains the FontRegistry class, described below, and the process-wide
+  registry through which all ui modules obtain pygame.font.Font objects.
+
+USAGE:
+  Call get_font(path, size) anywhere pygame.font.Font(path, size) would
+  otherwise be used. Returned fonts are shared, so callers must not
+  change their state (e.g. with set_bold) without restoring it.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+from io import BytesIO
+
+import pygame
+
+from config import FONT_CACHE_SIZE
+from ..util import LRUCache
+
+###############################################################################
+class FontRegistry(object):
+    """
+    Creates and holds pygame.font.Font objects keyed by (path, size).
+
+    The contents of each font file are read from disk once and kept in
+    memory; Font objects are built from those bytes and held in a bounded
+    LRU cache, so a font is only constructed again after being evicted.
+
+    ATTRIBUTES:
+      * hits (read-only)
+      * misses (read-only)
+
+    METHODS:
+      * clear
+      * get_font
+    """
+    def __init__(self, maxFonts):
+        self._fileData = {}
+        self._fonts = LRUCache(maxFonts)
+
+    def clear(self):
+        """Drop all cached fonts and font file contents."""
+        self._fileData.clear()
+        self._fonts.clear()
+
+    def get_font(self, path, size):
+        """Return pygame.font.Font for the font file at 'path' in 'size.'"""
+        key = (path, size)
+        font = self._fonts.get(key)
+
+        if font is None:
+            # Each Font reads lazily from its own file object, so they
+            # must not share one.
+            font = pygame.font.Font(BytesIO(self._get_file_data(path)), size)
+            self._fonts.put(key, font)
+
+        return font
+
+    def _get_file_data(self, path):
+        try:
+            return self._fileData[path]
+        except KeyError:
+            with open(path, 'rb') as f:
+                data = self._fileData[path] = f.read()
+
+            return data
+
+    @property
+    def hits(self):
+        return self._fonts.hits
+
+    @property
+    def misses(self):
+        return self._fonts.misses
+
+###############################################################################
+registry = FontRegistry(FONT_CACHE_SIZE)
+
+def get_font(path, size):
+    """Return font at 'path' in 'size' from the shared registry."""
+    return registry.get_font(path, size)
@@ -0,0 +1,177 @@
+"""
+imagecache.py
+
+DESCRIPTION:
+  Contains the ImageCache class, described below, and the process-wide
+  cache through which ui modules load and resize images.
+
+USAGE:
+  Use images.get_fitted(path, bounds, scalar) to obtain an image file
+  scaled by 'scalar' and then shrunk to fit 'bounds,' images.get_resized
+  (path, size) for it stretched to 'size,' or images.load(path) for the
+  image as-is. Returned surfaces are shared and must not be altered; copy
+  them first if needed.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import pygame
+
+from assetloader import load_assets
+from config import IMAGE_CACHE_BYTES
+from rendercache import renders
+from ..util import LRUCache
+
+###############################################################################
+class ImageCache(object):
+    """
+    Loads image files and keeps both the decoded images and their resized
+    versions in one LRU cache bounded by 'maxBytes.'
+
+    Decoded images are keyed by path (and whether they have per-pixel
+    alpha), so a file used by several clues is only read and decoded
+    once. Resized images are keyed by path and the requested size, and
+    are also saved in the render cache (see rendercache.py), so later runs
+    need neither decode nor resize them. All keys include the display's
+    pixel format, since all surfaces are converted to that format.
+
+    ATTRIBUTES:
+      * cache (read-only)
+
+    METHODS:
+      * clear
+      * get_fitted
+      * get_resized
+      * load
+      * warm
+    """
+    def __init__(self, maxBytes):
+        self._cache = LRUCache(maxBytes,
+                               lambda sfc: sfc.get_pitch() * sfc.get_height())
+
+    def clear(self):
+        self._cache.clear()
+
+    def get_fitted(self, path, bounds=None, scalar=1.0, alpha=False):
+        """
+        Return image at 'path' with each dimension scaled by 'scalar,'
+        then shrunk, if necessary, to fit within size given by 'bounds'
+        (if provided) while keeping its aspect ratio. Only one smoothscale
+        is done to produce the result, and the result is cached.
+        """
+        def get_size(src):
+            return _get_fitted_size(src.get_size(), bounds, scalar)
+
+        return self._get_scaled(path, alpha, ('fitted', bounds, scalar),
+                                get_size)
+
+    def get_resized(self, path, size, alpha=False):
+        """
+        Return image at 'path' smoothscaled to exactly 'size.' The result
+        is cached.
+        """
+        size = tuple(int(x) for x in size)
+
+        return self._get_scaled(path, alpha, ('resized', size),
+                                lambda src: size)
+
+    def load(self, path, alpha=False):
+        """
+        Return image at 'path' converted to the display's pixel format,
+        with per-pixel alpha if 'alpha' is set.
+        """
+        key = ('source', path, alpha, _get_display_format())
+        img = self._cache.get(key)
+
+        if img is None:
+            img = self._add(path, alpha, pygame.image.load(path))
+
+        return img
+
+    def warm(self, paths, alpha=False):
+        """
+        Load each distinct image in 'paths' not already cached into the
+        cache, decoding the files concurrently (see assetloader).
+        """
+        format_ = _get_display_format()
+        missing = [p for p in set(paths)
+                   if ('source', p, alpha, format_) not in self._cache]
+
+        for path, img in load_assets(missing)[0].iteritems():
+            self._add(path, alpha, img)
+
+    def _add(self, path, alpha, img):
+        """Convert freshly loaded 'img,' cache it, and return it."""
+        img = _convert(img, alpha)
+        self._cache.put(('source', path, alpha, _get_display_format()), img)
+
+        return img
+
+    def _get_scaled(self, path, alpha, request, get_size):
+        """
+        Return image at 'path' resized as described by tuple 'request,'
+        from memory, the render cache, or by resizing the loaded image to
+        the size 'get_size' returns when called with it.
+        """
+        key = ('scaled', path, alpha) + request + (_get_display_format(), )
+        img = self._cache.get(key)
+
+        if img is not None:
+            return img
+
+        renderKey = ('image', renders.hash_file(path), alpha) + request
+        img = renders.get(renderKey)
+
+        if img is not None:
+            img = _convert(img, alpha)
+        else:
+            src = self.load(path, alpha)
+            size = get_size(src)
+
+            if size == src.get_size():
+                return src
+
+            img = pygame.transform.smoothscale(src, size)
+            renders.put(renderKey, img)
+
+        self._cache.put(key, img)
+
+        return img
+
+    @property
+    def cache(self):
+        """The underlying LRUCache; useful for its hit/miss counts."""
+        return self._cache
+
+###############################################################################
+def _convert(img, alpha):
+    return img.convert_alpha() if alpha else img.convert()
+
+def _get_display_format():
+    sfc = pygame.display.get_surface()
+
+    return (sfc.get_bitsize(), sfc.get_masks()) if sfc else None
+
+def _get_fitted_size(size, bounds, scalar):
+    """
+    Return 'size' scaled by 'scalar,' then shrunk to fit within 'bounds'
+    (if not None) keeping its aspect ratio.
+    """
+    w, h = (int(scalar*x) for x in size)
+
+    if bounds is not None:
+        fit = min(float(bounds[0]) / w, float(bounds[1]) / h)
+
+        if fit < 1:
+            w, h = int(fit*w), int(fit*h)
+
+    return (w, h)
+
+###############################################################################
+images = ImageCache(IMAGE_CACHE_BYTES)
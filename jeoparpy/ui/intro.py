@@ -22,10 +22,14 @@ of source code from this file..
 import pygame
 from pygame.locals import KEYDOWN, QUIT
 
-from constants import JEOP_BLUE, RULES, SUBTITLE
+from constants import JEOP_BLUE, RULES_PATH, SUBTITLE_PATH
+from fontregistry import get_font
+from imagecache import images
 from resmaps import FONTS, IMAGES
-from util import (draw_centered_textblock, draw_textline, restrict_fontsize,
-                  scale, shadow_text, wait_for_keypress)
+from transition import cross_dissolve
+from util import (draw_centered_textblock, draw_textline, render_text,
+                  restrict_fontsize, scale, shadow_text, wait_for_keypress)
+from ..util import get_first_textline, get_stripped_nonempty_file_lines
 
 ###############################################################################
 def do_intro(screen, clock, audioplayer):
@@ -40,7 +44,8 @@ def do_intro(screen, clock, audioplayer):
 
     background, bgRect = _build_background(scrSize)
     background.blit(*_build_banner(bgRect, bannerColor))
-    rules, rulesRect = _build_rules(bgRect)
+    rules, rulesRect = _build_rules(
+        bgRect, get_stripped_nonempty_file_lines(RULES_PATH))
     title, titleRect = _build_title_text(bgRect, bannerColor)
 
     # Start intro sequence
@@ -50,10 +55,11 @@ def do_intro(screen, clock, audioplayer):
     music.play()
 
     # Fade in title (control passed to function)
-    _fade_in_title(screen, background, title, titleRect, bannerColor, clock)
+    _fade_in_title(screen, background, title, titleRect)
 
     # Draw subtitle and wait for keypress
-    _blit_subtitle(background, bgRect, titleRect)
+    _blit_subtitle(background, bgRect, titleRect,
+                   get_first_textline(SUBTITLE_PATH))
     pygame.event.set_allowed([KEYDOWN, QUIT])
     _update_and_wait_for_keypress(screen, background)
     
@@ -71,17 +77,17 @@ def _update_and_wait_for_keypress(screen, background):
     pygame.display.update()
     wait_for_keypress()
     
-def _blit_subtitle(background, scrRect, titleRect):
+def _blit_subtitle(background, scrRect, titleRect, subtitle):
     """
-    Creates subtitle and its shadow, then blits both onto background.
+    Creates 'subtitle' text and its shadow, then blits both onto background.
     'scrRect' is Rect the size of entire screen.
     'titleRect' is Rect of title text.
     """
     # Render subtitle text
     size = int(52 * (scrRect.h / 768.0))
     offset = int(20 * (scrRect.h / 768.0))
-    font = pygame.font.Font(FONTS['subtitle'], size)
-    text = font.render(SUBTITLE, 1, (255, 255, 255))
+    font = get_font(FONTS['subtitle'], size)
+    text = render_text(font, subtitle, (255, 255, 255))
 
     # Position subtitle
     rect = text.get_rect()
@@ -89,15 +95,14 @@ def _blit_subtitle(background, scrRect, titleRect):
     rect.y = titleRect.bottom + offset
 
     # Create shadow
-    shadow, shadRect = shadow_text(SUBTITLE, rect, font, 2)
+    shadow, shadRect = shadow_text(subtitle, rect, font, 2)
 
     # Blit both to background
     background.blit(shadow, shadRect)
     background.blit(text, rect)
 
 def _build_background(scrSize):
-    background = pygame.image.load(IMAGES['introBG']).convert()
-    background = pygame.transform.smoothscale(background, scrSize)
+    background = images.get_resized(IMAGES['introBG'], scrSize).copy()
 
     return background, background.get_rect()
 
@@ -118,14 +123,17 @@ def _build_banner(scrRect, color):
 
     return (banner, rect)
 
-def _build_rules(scrRect):
-    """Return tuple of fully drawn rules surface and its rect."""
+def _build_rules(scrRect, rules):
+    """
+    Return tuple of fully drawn rules surface and its rect.
+    'rules' is sequence of lines of rules text.
+    """
     header = '--RULES--'
     offset = scale(50, scrRect.h, 768)
     rect = scrRect.copy()
     rect.inflate_ip(-offset, -offset)
     sfc = pygame.Surface(rect.size)
-    font = pygame.font.Font(FONTS['rules'], scale(80, scrRect.h, 768))
+    font = get_font(FONTS['rules'], scale(80, scrRect.h, 768))
 
     # Draw header
     sfc.fill(JEOP_BLUE)
@@ -137,9 +145,9 @@ def _build_rules(scrRect):
     # Draw rules
     bounds = tuple(.9*x for x in scrRect.size)
     fsize = restrict_fontsize(FONTS['rules'], scale(50, scrRect.h, 768),
-                              RULES, bounds)
-    font = pygame.font.Font(FONTS['rules'], fsize)
-    draw_centered_textblock(sfc, RULES, font, (255, 255, 255), 0,
+                              rules, bounds)
+    font = get_font(FONTS['rules'], fsize)
+    draw_centered_textblock(sfc, rules, font, (255, 255, 255), 0,
                             scale(4, scrRect.h, 768), False)
     sfc.set_alpha(240)
 
@@ -154,28 +162,22 @@ def _build_title_text(scrRect, bgColor):
     and the background color of the text.
     """
     size = int(150 * (scrRect.h / 768.0))
-    font = pygame.font.Font(FONTS['title'], size)
-    
-    # Note: bgColor required so set_alpha can be called on text.
-    text = font.render("JeoparPy!", 1, (230, 230, 230), bgColor)
+    font = get_font(FONTS['title'], size)
+    text = render_text(font, "JeoparPy!", (230, 230, 230), 1, bgColor)
 
     rect = text.get_rect()
     rect.center = scrRect.center
 
     return (text, rect)
 
-def _fade_in_title(screen, background, text, textRect, bannerColor, clock):
-    fpsGoal = int(255 / 7.8) #frames to draw / time to spend in secs
+def _fade_in_title(screen, background, text, textRect):
+    """Blit title text onto background, fading it in on screen."""
+    banner = background.subsurface(textRect).copy()
+    background.blit(text, textRect)
 
     pygame.time.delay(2000)
-    for alpha in xrange(256):
-        background.fill(bannerColor, textRect)
-        text.set_alpha(alpha)
-        background.blit(text, textRect)
-        screen.blit(background, textRect, textRect)
-
-        pygame.display.update(textRect)
-        clock.tick_busy_loop(fpsGoal)
+    cross_dissolve(screen, banner, background.subsurface(textRect), 8.0,
+                   textRect.topleft)
 
 ###############################################################################
 if __name__ == '__main__':
@@ -18,9 +18,11 @@ import pygame
 from jeopgamesfc import JeopGameSurface
 from util import Timer
 from ..constants import JEOP_BLUE
+from ..fontregistry import get_font
+from ..imagecache import images
 from ..resmaps import FONTS, IMAGES
 from ..util import (autofit_text, draw_centered_textblock, draw_textblock,
-                    fit_image, get_size_textblock, restrict_fontsize, scale)
+                    get_size_textblock, restrict_fontsize, scale)
 from ...config import CLUE_TIMEOUT_MS
 from ...constants import ANSWER_TIMEOUT
 
@@ -49,35 +51,72 @@ class ClueTimer(Timer):
 class Clue(JeopGameSurface):
     """
     Defines a surface containing a written JeoparPy clue.
+
+    The text and image of each clue are laid out and rendered into a
+    "card" ahead of time by prepare_next_card, which the controller calls
+    on idle frames, so opening a clue only blits its card. A clue opened
+    before its card is ready is rendered on the spot.
     
     ATTRIBUTES:
       * dirty
+      * timerEndTime (read-only)
 
     METHODS:
       * draw_clue
+      * get_card
+      * prepare_next_card
       * update
     """
     def __init__(self, size):
         super(Clue, self).__init__(size)
         self._maxFontSize = scale(51, size[1], 720)
-        self._defaultFont = pygame.font.Font(FONTS['clue'], self._maxFontSize)
+        self._defaultFont = get_font(FONTS['clue'], self._maxFontSize)
         self.dirty = False
+        self._cards = {}
+        self._pendingCards = None  # See prepare_next_card
+
+        # Decode clue images now so preparing cards only has to resize them
+        images.warm(path for key, path in IMAGES.items()
+                    if isinstance(key, tuple))
         
         # Timer will be None if CLUE_TIMEOUT_MS None or <= 0
         self._timer = ClueTimer() if CLUE_TIMEOUT_MS > 0 else None
         
-    def draw_clue(self, clueLines, img=None):
-        self.fill(JEOP_BLUE)
-
-        if img:
-            textBounds = tuple(s*x for s, x in zip((.9, .66), self.size))
-            text = self._draw_clue_text(clueLines, textBounds)
-            self._draw_clue_and_image(text, img)
-        else:
-            text = self._draw_clue_text(clueLines)
-            textrect = text.get_rect()
-            textrect.center = self.rect.center
-            self.blit(text, textrect)
+    def draw_clue(self, clueLines, imgPath=None):
+        self._draw_card(self._build_card(clueLines, imgPath))
+
+    def get_card(self, coords, gameData):
+        """
+        Return 2-tuple of the card surface for clue at 'coords' and its
+        Rect relative to this surface, rendering it first if necessary.
+        """
+        try:
+            return self._cards[coords]
+        except KeyError:
+            cat, clue = coords
+            card = self._cards[coords] = self._build_card(
+                gameData.clues[cat][clue], IMAGES.get(coords))
+            
+            return card
+
+    def prepare_next_card(self, gameData):
+        """
+        Render the card of one clue that does not yet have one.
+        Return False if all cards were already prepared, otherwise True.
+        """
+        if self._pendingCards is None:
+            self._pendingCards = [(c, r)
+                                  for c in xrange(len(gameData.clues))
+                                  for r in xrange(len(gameData.clues[c]))]
+            self._pendingCards.reverse()
+
+        while self._pendingCards:
+            coords = self._pendingCards.pop()
+            if coords not in self._cards:
+                self.get_card(coords, gameData)
+                return True
+
+        return False
             
     def update(self, gameState, gameData):
         gs = gameState
@@ -86,30 +125,61 @@ class Clue(JeopGameSurface):
             self._timer.update(gameState)
 
         if gs.state == gs.CLUE_OPEN:
-            cat, clue = gs.kwargs['coords']
-            img = self._get_media((cat, clue))
-            self.draw_clue(gameData.clues[cat][clue], img)
-            self.dirty = True
+            self._draw_card(self.get_card(gs.kwargs['coords'], gameData))
+            self.mark_dirty()
+
+    @property
+    def timerEndTime(self):
+        """
+        Time (via pygame.time.get_ticks()) at which the clue will time out,
+        or None if its timer is not running.
+        """
+        return self._timer.endTime if self._timer is not None else None
+
+    def _build_card(self, clueLines, imgPath=None):
+        """
+        Return 2-tuple of a surface with the clue's text (and image at
+        'imgPath,' if provided) drawn on it, and its Rect positioned
+        relative to this surface.
+        """
+        if imgPath:
+            textBounds = tuple(s*x for s, x in zip((.9, .66), self.size))
+            text = self._draw_clue_text(clueLines, textBounds)
+            return self._build_clue_and_image(text, imgPath)
+        
+        text = self._draw_clue_text(clueLines)
+        textrect = text.get_rect()
+        textrect.center = self.rect.center
 
-    def _draw_clue_and_image(self, textsfc, img):
+        return text, textrect
+
+    def _build_clue_and_image(self, textsfc, imgPath):
         textrect = textsfc.get_rect()
         spacer = scale(10, self.size[1], 720)
         imgBounds = (.98*self.size[0], self.size[1] - (3*spacer + textrect.h))
-        img = fit_image(img, imgBounds)
+        img = images.get_fitted(imgPath, imgBounds, self.size[1] / 720.0)
         imgrect = img.get_rect()
 
         allrect = pygame.Rect(0, 0, self.rect.w,
                               3*spacer + textrect.h + imgrect.h)
         allrect.center = self.rect.center
 
-        textrect.centerx = self.rect.centerx
-        textrect.y = spacer + allrect.y
+        textrect.centerx = allrect.w / 2
+        textrect.y = spacer
+
+        imgrect.centerx = allrect.w / 2
+        imgrect.y = 2*spacer + textrect.h
 
-        imgrect.centerx = self.rect.centerx
-        imgrect.y = allrect.y + 2*spacer + textrect.h
+        sfc = pygame.Surface(allrect.size)
+        sfc.fill(JEOP_BLUE)
+        sfc.blit(textsfc, textrect)
+        sfc.blit(img, imgrect)
+
+        return sfc, allrect
 
-        self.blit(textsfc, textrect)
-        self.blit(img, imgrect)
+    def _draw_card(self, card):
+        self.fill(JEOP_BLUE)
+        self.blit(*card)
                    
     def _draw_clue_text(self, clueLines, bounds=None):
         if len(clueLines) == 1:
@@ -122,7 +192,7 @@ class Clue(JeopGameSurface):
                 bounds = tuple(.95*x for x in self.size)
             fsize = restrict_fontsize(FONTS['clue'], self._maxFontSize,
                                       clueLines, bounds)
-            font = pygame.font.Font(FONTS['clue'], fsize)
+            font = get_font(FONTS['clue'], fsize)
 
         size = get_size_textblock(clueLines, font, 0)
         sfc = pygame.Surface(size)
@@ -132,13 +202,3 @@ class Clue(JeopGameSurface):
                                 scale(4, self.size[1], 720))
 
         return sfc
-        
-    def _get_media(self, coords):
-        if coords in IMAGES:
-            img = pygame.image.load(IMAGES[coords]).convert()
-            scaledSize = (scale(x, self.size[1], 720)
-                          for x in img.get_size())
-            return pygame.transform.smoothscale(img, tuple(scaledSize))
-
-        return None
-        
\ No newline at end of file
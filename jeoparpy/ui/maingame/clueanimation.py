@@ -16,6 +16,7 @@ of source code from this file.
 import pygame
 
 from ..constants import JEOP_BLUE
+from ..util import ease_linear
 from ...constants import ANIMATIONEND
 
 ###############################################################################
@@ -23,34 +24,55 @@ class OpenClueAnimation(pygame.sprite.DirtySprite):
     """
     A sprite that animates a clue box filling up the screen.
 
+    The animation runs for a set length of time regardless of frame rate.
+    Every frame's image is a subsurface of one surface the size of the
+    final box, prepared once, so nothing is scaled or allocated per frame.
+    By default the box is solid blue; if set_card is called before the
+    animation begins, the clue's card is revealed from its center as the
+    box grows instead.
+
     ATTRIBUTES:
       * dirty
       * image
       * rect
 
     METHODS:
+      * set_card
       * update
     """
-    def __init__(self, startSize, endRect, fps):
+    def __init__(self, startSize, endRect, time=0.5, easing=ease_linear):
         """
-        'eventcode' is pygame event type value for an event
-        that signals this sprites animation has concluded.
+        'time' is the length of the animation in seconds. 'easing' is one
+        of the ease_* functions in ui.util, or any function taking and
+        returning a float in [0, 1].
         """
         super(OpenClueAnimation, self).__init__()
         self.rect = pygame.Rect((0, 0), startSize) # Positioned in _init_rects
         self.dirty = 0
+
+        self._canvas = pygame.Surface(endRect.size)
+        self._canvas.fill(JEOP_BLUE)
+        self._showCard = False
+        self.image = self._canvas.subsurface(self.rect)
         
-        size = self.rect.size
-        self.image = pygame.Surface(size)
-        self.image.fill(JEOP_BLUE)
-        
-        self._startSize = size
+        self._startSize = self.rect.size
         self._startRect = None  # See _init_rects()
         self._moveAmts = None   # See _init_rects()
         self._endRect = endRect
         self._eventCode = ANIMATIONEND
-        self._frameGoal = self._get_frame_goal(fps, 0.5)
-        self._frame = 0
+        self._easing = easing
+        self._length = int(1000 * time)
+        self._startTime = None
+        self._progress = 0.0
+
+    def set_card(self, card, cardRect):
+        """
+        Reveal surface 'card,' positioned at 'cardRect' relative to the
+        final box, during the next animation instead of a plain box.
+        """
+        self._canvas.fill(JEOP_BLUE)
+        self._canvas.blit(card, cardRect)
+        self._showCard = True
 
     def update(self, gameState, gameData):
         """Update the sprite based on the current game state/data"""
@@ -60,6 +82,9 @@ class OpenClueAnimation(pygame.sprite.DirtySprite):
             self._init_rects(gs.kwargs['coords'])
             
         if gs.state == gs.WAIT_CLUE_OPEN:
+            if self._startTime is None:
+                self._startTime = pygame.time.get_ticks()
+
             if self._is_animation_done():
                 self._reset()
                 pygame.event.post(pygame.event.Event(self._eventCode))
@@ -67,23 +92,12 @@ class OpenClueAnimation(pygame.sprite.DirtySprite):
                 self._step_animation()
                 self.dirty = True
 
-    def _get_completion_percent(self):
-        """Return percent of animation complete as float"""
-        return float(self._frame) / self._frameGoal
-            
-    def _get_frame_goal(self, fps, goalTime):
-        """
-        Return number of frames necesary to accomplish animation in
-        'goalTime' seconds based on fps.
-        """
-        return int(fps * goalTime)
-
     def _init_rects(self, clueCoords):
         """
         Initialize three attributes:
           self.rect, from clue coordinates and known start size
           self._startRect, a copy of self.rect in its initial state
-          self._dii
+          self._moveAmts, the distance each value of self.rect must move
         """
         sw, sh = self._startSize
         x = 0
@@ -99,21 +113,33 @@ class OpenClueAnimation(pygame.sprite.DirtySprite):
                                for i in xrange(4))
 
     def _is_animation_done(self):
-        return self._frame == self._frameGoal
+        return self._progress >= 1
 
     def _reset(self):
         """Reset sprite to prepare for next clue opened."""
-        self._frame = 0
+        self._progress = 0.0
+        self._startTime = None
         self._startRect = None
         self.rect = None
         self._moveAmts = None
 
+        if self._showCard:
+            self._canvas.fill(JEOP_BLUE)
+            self._showCard = False
+
     def _step_animation(self):
         """Do one step of opening animation."""
-        self._frame += 1
-        perc = self._get_completion_percent()
+        elapsed = pygame.time.get_ticks() - self._startTime
+        self._progress = min(float(elapsed) / self._length, 1.0)
+        perc = self._easing(self._progress)
         
-        for i, c in enumerate(self.rect):
+        for i in xrange(4):
             self.rect[i] = int(self._startRect[i] + perc * self._moveAmts[i])
+
+        # Blank box grows from the top left of the canvas; a card is
+        # revealed from its center.
+        window = pygame.Rect((0, 0), self.rect.size)
+        if self._showCard:
+            window.center = self._canvas.get_rect().center
                     
-        self.image = pygame.transform.scale(self.image, self.rect.size)
+        self.image = self._canvas.subsurface(window)
@@ -19,6 +19,8 @@ import pygame
 
 from jeopgamesfc import JeopGameSurface
 from ..constants import JEOP_BLUE
+from ..fontregistry import get_font
+from ..rendercache import renders
 from ..resmaps import FONTS
 from ..util import (autofit_text, BorderedBox, draw_centered_textblock,
                     draw_centered_textline, scale)
@@ -28,21 +30,44 @@ from ...constants import ANIMATIONEND
 class GameBoard(JeopGameSurface):
     """
     The primary JeoparPy game board: categories and clue amounts on a grid.
+
+    When the board fills, each clue amount is given a time at which it
+    appears, spread evenly over 'fillTime' ms, and update() reveals those
+    that are due. The main loop is never blocked.
+
+    The empty board (category names and blank boxes) is saved in the
+    render cache, keyed by its size, categories, and category font.
+
+    ATTRIBUTES:
+        * fillTime
     
     INHERITED ATTRIBUTES:
         * baseImg
         * dirty
         * rect
     """
-    def __init__(self, size, gameData):
+    def __init__(self, size, gameData, fillTime=3500):
+        """'fillTime' is the time in ms over which the board fills."""
         super(GameBoard, self).__init__(size)
         self.fill((0, 0, 0))
+        self.fillTime = fillTime
+        self._fillStart = None  # See update, BOARD_FILL state
+        self._fillStep = None
+        self._numFilled = 0
 
         self._boxes = self._init_boxes(len(gameData.categories),
                                          len(gameData.amounts) + 1)
 
-        self._blit_categories(gameData.categories)
-        self._draw_all_boxes()
+        key = ('board', self.size, tuple(gameData.categories),
+               len(gameData.amounts), renders.hash_file(FONTS['category']))
+        img = renders.get(key)
+
+        if img is not None:
+            self.blit(img, (0, 0))
+        else:
+            self._blit_categories(gameData.categories)
+            self._draw_all_boxes()
+            renders.put(key, self)
         
         self.baseImg = self.copy()
 
@@ -62,20 +87,17 @@ class GameBoard(JeopGameSurface):
         gs = gameState
 
         if gs.state == gs.BOARD_FILL:
-            self._amtFont = pygame.font.Font(FONTS['amount'], self._scale(48))
+            self._amtFont = get_font(FONTS['amount'], self._scale(48))
             self._coordsStack = [(c, r) for c in xrange(len(self._boxes))
                                 for r in xrange(len(self._boxes[0]) - 1)]
             shuffle(self._coordsStack)
+            self._fillStart = pygame.time.get_ticks()
+            self._fillStep = float(self.fillTime) / len(self._coordsStack)
+            self._numFilled = 0
             
         elif gs.state == gs.WAIT_BOARD_FILL:
             if self._coordsStack:
-                c, r = self._coordsStack.pop()
-                box = self._boxes[c][r + 1]
-                
-                self._blit_amount(box, gameData.amounts[r])
-                self.blit(box, box.rect)
-                self.dirty = True
-                pygame.time.wait(135)
+                self._fill_due_boxes(gameData)
             else:
                 pygame.event.post(pygame.event.Event(ANIMATIONEND))
 
@@ -85,8 +107,8 @@ class GameBoard(JeopGameSurface):
             box.redraw()
             self.blit(box, box.rect)
             
-        elif gs.state in (gs.DELAY, gs.ANSWER_TIMEOUT, gs.ANSWER_NONE):
-            self.dirty = True
+        elif gs.state in (gs.DELAY, gs.CLOSE_CLUE):
+            self.mark_dirty()
 
     def _blit_amount(self, box, amount):
         bounds = tuple(.8*x for x in box.size)
@@ -107,6 +129,24 @@ class GameBoard(JeopGameSurface):
             draw_centered_textblock(self._boxes[i][0], lines, font,
                                     (255, 255, 255), 0, shadowOffset)
 
+    def _fill_due_boxes(self, gameData):
+        """
+        Reveal the amount of every box whose time to appear has passed.
+        The first box is due immediately, the last 'fillStep' ms before
+        fillTime has elapsed.
+        """
+        elapsed = pygame.time.get_ticks() - self._fillStart
+        
+        while (self._coordsStack and
+               self._numFilled * self._fillStep <= elapsed):
+            c, r = self._coordsStack.pop()
+            box = self._boxes[c][r + 1]
+            
+            self._blit_amount(box, gameData.amounts[r])
+            self.blit(box, box.rect)
+            self.mark_dirty(box.rect)
+            self._numFilled += 1
+
     def _draw_all_boxes(self):
         for col in self._boxes:
             for box in col:
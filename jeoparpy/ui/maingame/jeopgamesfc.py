@@ -13,7 +13,7 @@ viewable at http://opensource.org/licenses/GPL-3.0
 This copyright notice must be retained with any use
 of source code from this file.
 """
-from pygame import Surface
+from pygame import Rect, Surface
 
 
 class JeopGameSurface(Surface):
@@ -24,12 +24,15 @@ class JeopGameSurface(Surface):
     GameData object will automatically update the surface as needed.
     
     Methods:
-      *update
+      * mark_dirty
+      * update
 
     Attributes:
       * baseSfc             - "Blank" surface to use to clear text, etc.
       * dirty               - When set, controller should redraw the panel.
-      * dirtyRects          - List of rects that need to be updated on screen.
+      * dirtyRects          - List of rects that need to be updated on screen,
+                              relative to the surface. If empty while
+                              'dirty' is set, the whole surface is redrawn.
       * rect
       * size (read-only)
     """
@@ -42,6 +45,19 @@ class JeopGameSurface(Surface):
         self.dirtyRects = []
         self.baseSfc = None
 
+    def mark_dirty(self, rect=None):
+        """
+        Flag the surface to be redrawn. If 'rect' is given (relative to
+        the surface), only that area is redrawn, unless the whole surface
+        is already flagged. Otherwise, the whole surface is redrawn.
+        """
+        if rect is None:
+            del self.dirtyRects[:]
+        elif not self.dirty or self.dirtyRects:
+            self.dirtyRects.append(Rect(rect))
+
+        self.dirty = True
+
     def update(self, gameState, gameData):
         """Update surface accordingly from current state of game."""
         
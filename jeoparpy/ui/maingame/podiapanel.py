@@ -18,7 +18,9 @@ import pygame
 
 from jeopgamesfc import JeopGameSurface
 from podium import Podium
+from ..imagecache import images
 from ..resmaps import FONTS, IMAGES
+from ..util import blit_areas, merge_rects
 
 
 class PodiaPanel(JeopGameSurface):
@@ -57,30 +59,33 @@ class PodiaPanel(JeopGameSurface):
     def update(self, gameState, gameData):
         """
         Update all visuals on the surface. If any changes were made,
-        set 'dirty' to True. This method should be called once per frame.
+        set 'dirty' to True and add the changed areas to 'dirtyRects.'
+        This method should be called once per frame.
         """
         self._podia.update(gameState, gameData)
         for p in self._podia:
             if p.dirty:
-                self.blit(p.image, p.rect)
+                areas = merge_rects(p.dirtyRects or [p.image.get_rect()])
+                for rect in blit_areas(self, p.image, p.rect.topleft, areas):
+                    self.mark_dirty(rect)
+
+                del p.dirtyRects[:]
                 p.dirty = 0
-                self.dirty = 1
 
         if gameState.state == gameState.DELAY:
             pygame.time.wait(500)
             
 
     def _init_background(self):
-        img = pygame.image.load(IMAGES['rPanelBG']).convert()
+        img = images.load(IMAGES['rPanelBG'])
         sizeScalar = float(self.size[1]) / img.get_size()[1]
-        img = pygame.transform.smoothscale(img, self.size)
-        self.blit(img, (0, 0))
+        self.blit(images.get_resized(IMAGES['rPanelBG'], self.size), (0, 0))
 
         return sizeScalar
 
     def _init_podia(self, gameData, scalar):
         podia = pygame.sprite.OrderedUpdates()
-        img = pygame.image.load(IMAGES['podium']).convert_alpha()
+        img = images.get_fitted(IMAGES['podium'], scalar=scalar, alpha=True)
         nameBounds = pygame.Rect(90, 107, 102, 105)
         fonts = (('team1', 42), ('team2', 33), ('team3', 40))
         fonts = tuple((FONTS[n], s) for n,s in fonts)
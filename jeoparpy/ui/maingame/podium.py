@@ -19,8 +19,10 @@ import pygame
 from jeopgamesfc import JeopGameSurface
 from util import Timer
 from ..constants import JEOP_BLUE
+from ..fontregistry import get_font
+from ..imagecache import images
 from ..resmaps import FONTS, IMAGES
-from ..util import (autofit_text, draw_centered_textblock,
+from ..util import (autofit_text, blit_areas, draw_centered_textblock,
                     draw_centered_textline, shadow_text)
 from ...config import ANSWER_TIME_MS
 from ...constants import ANSWER_TIMEOUT
@@ -38,6 +40,7 @@ class Podium(pygame.sprite.DirtySprite):
 
     ATTRIBUTES:
       * dirty
+      * dirtyRects (rects of image that changed; if empty, all of it did)
       * image
       * rect
 
@@ -48,15 +51,16 @@ class Podium(pygame.sprite.DirtySprite):
                  *groups):
         """
         Upon initialization, name and a score of '$0' will be drawn. 
+        'img' is the podium image, already scaled by 'scalar.'
         'nameOffset' is the y-offset of a name on the original podium image.
         'nameFont' is 2-tuple (fontPath, fontSize).
         """
-        scaledSize = tuple(int(scalar*x) for x in img.get_size())
-        img = pygame.transform.smoothscale(img, scaledSize)
+        scaledSize = img.get_size()
         self.image = img.copy()
         self.rect = self.image.get_rect()
         super(Podium, self).__init__(*groups)
 
+        self.dirtyRects = []
         self._id = id_
         self._baseImg = None
         self._highlight = pygame.sprite.GroupSingle(Highlight(scaledSize))
@@ -78,6 +82,7 @@ class Podium(pygame.sprite.DirtySprite):
         if gs.state == gs.BUZZ_IN and gs.kwargs['playerI'] == self._id:
             self._timer.start()
             self._draw_highlight()
+            del self.dirtyRects[:]
             self.dirty = 1
 
         elif gs.state in gs.ANSWER and gs.kwargs['playerI'] == self._id:
@@ -87,13 +92,18 @@ class Podium(pygame.sprite.DirtySprite):
             
             self._clear_highlight()
             self.image.blit(self._score, self._score.rect)
+            del self.dirtyRects[:]
             self.dirty = 1
 
         self._timer.update(gameState)
         if self._timer.dirty:
-            self.image.blit(self._timer, self._timer.rect)
-            self._timer.dirty = 0
-            self.dirty = 1
+            t = self._timer
+            areas = t.dirtyRects or [t.get_rect()]
+            for rect in blit_areas(self.image, t, t.rect.topleft, areas):
+                self._mark_dirty(rect)
+
+            del t.dirtyRects[:]
+            t.dirty = 0
             
     def _clear_highlight(self):
         self._highlight.clear(self.image, self._baseImg)
@@ -112,11 +122,21 @@ class Podium(pygame.sprite.DirtySprite):
         
         self.image.blit(sfc, nameBoundsRect)
 
+    def _mark_dirty(self, rect):
+        """
+        Add 'rect' to dirtyRects, unless the whole podium is already dirty.
+        """
+        if not self.dirty or self.dirtyRects:
+            self.dirtyRects.append(rect)
+
+        self.dirty = 1
+
     def _init_timer(self, scalar):
         pos = tuple(int(scalar*x) for x in (80, 3))
         timer = AnswerTimer(
-                    pygame.image.load(IMAGES['podtimer']).convert_alpha(),
-                    scalar, ANSWER_TIME_MS)
+                    images.get_fitted(IMAGES['podtimer'], scalar=scalar,
+                                      alpha=True),
+                    ANSWER_TIME_MS)
 
         timer.rect.topleft = pos
         self.image.blit(timer, timer.rect)
@@ -140,17 +160,17 @@ class AnswerTimer(Timer, JeopGameSurface):
       * start
       * update
     """
-    def __init__(self, img, scalar, time, onColor=(230, 0, 0),
+    def __init__(self, img, time, onColor=(230, 0, 0),
                  offColor=(30, 30, 30)):
-        """'time' in ms."""
-        size = tuple(int(scalar*x) for x in img.get_size())
+        """'img' is the timer's frame, drawn over it. 'time' in ms."""
         Timer.__init__(self, time, ANSWER_TIMEOUT)
-        JeopGameSurface.__init__(self, size)
+        JeopGameSurface.__init__(self, img.get_size())
         
-        self._front = pygame.transform.smoothscale(img, size)
+        self._front = img
         self.offColor = offColor
         self.onColor = onColor
         self.dirty = 0
+        self._barW = 0  # Width of each "on" block as last drawn
 
         self._draw_off()
     
@@ -183,28 +203,34 @@ class AnswerTimer(Timer, JeopGameSurface):
             self.reset()
         
     def _draw(self, currentTime):
+        """
+        Redraw the timer for 'currentTime.' Only the strips between the
+        previous and current ends of the two blocks are redrawn, and
+        they are added to dirtyRects.
+        """
         centerx = self.rect.w / 2
         percDone = (self.endTime - currentTime) / float(self.length)
+        barW = max(int(percDone * centerx), 0) if percDone < 1 else 0
 
-        self.fill(self.offColor)
+        if barW == self._barW:
+            return
 
-        if percDone < 1:
-            size = (centerx, self.rect.h)
-            rect = pygame.Rect((0, 0), size)
-            rect.w = int(percDone * rect.w)
+        lo, hi = sorted((barW, self._barW))
+        color = self.onColor if barW > self._barW else self.offColor
 
-            rect.right = centerx
-            self.fill(self.onColor, rect)
-            rect.left = centerx
-            self.fill(self.onColor, rect)
+        for x in (centerx - hi, centerx + lo):
+            rect = pygame.Rect(x, 0, hi - lo, self.rect.h)
+            self.fill(color, rect)
+            self.blit(self._front, rect, rect)
+            self.mark_dirty(rect)
 
-        self.blit(self._front, (0, 0))
-        self.dirty = 1
+        self._barW = barW
         
     def _draw_off(self):
         self.fill(self.offColor)
         self.blit(self._front, (0, 0))
-        self.dirty = 1
+        self._barW = 0
+        self.mark_dirty()
 
 ###############################################################################
 class Highlight(pygame.sprite.Sprite):
@@ -213,8 +239,7 @@ class Highlight(pygame.sprite.Sprite):
     """
     def __init__(self, size):
         super(Highlight, self).__init__()
-        img = pygame.image.load(IMAGES['highlight']).convert_alpha()
-        self.image = pygame.transform.smoothscale(img, size)
+        self.image = images.get_resized(IMAGES['highlight'], size, True)
         
         self.rect = self.image.get_rect()
 
@@ -260,7 +285,7 @@ class JeopScore(Score):
     """
     def __init__(self, podiumRect, scalar):
         bgColor = JEOP_BLUE
-        font = pygame.font.Font(FONTS['score'], int(scalar*32))
+        font = get_font(FONTS['score'], int(scalar*32))
         pos = tuple(int(scalar*x) for x in (64, 30))
         size = tuple(int(scalar*x) for x in (154, 47))
         shadowOffset = max(1, int(scalar*3))
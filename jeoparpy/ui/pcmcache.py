@@ -0,0 +1,175 @@
+"""
+pcmcache.py
+
+DESCRIPTION:
+  Contains the PCMCache class, described below, and the process-wide
+  cache through which sound files are decoded.
+
+USAGE:
+  Call pcm.get_samples(path) for the raw samples of a sound file in the
+  mixer's current format, suitable for pygame.mixer.Sound(buffer=...).
+  The first call for a file decodes it and saves the samples to disk;
+  later calls, in this or any later run, read the saved samples instead.
+
+  To decode every sound in resmaps ahead of time, run this module from
+  the JeoparPy root directory:
+    python -m jeoparpy.ui.pcmcache
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+
+import pygame
+
+from config import AUDIO_CACHE_DIR
+from ..config import MIXER_PROFILE, MIXER_PROFILES
+from ..constants import ROOT_PATH
+
+###############################################################################
+class PCMCache(object):
+    """
+    Keeps decoded sound samples in files under 'directory,' named by the
+    SHA-1 of the source file's contents and the mixer format (frequency,
+    sample size, channels) they were decoded to. SDL_mixer converts and
+    resamples to the mixer format while decoding, so a file is decoded
+    again only if its contents or the mixer format change.
+
+    Saved samples are memory-mapped read-only, so several game processes
+    on one host read them from the same pages of the OS file cache.
+    If 'directory' is None, nothing is saved and files are always decoded.
+
+    ATTRIBUTES:
+      * directory
+
+    METHODS:
+      * compile
+      * get_cache_path
+      * get_samples
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self._fileHashes = {}  # path -> (mtime, size, SHA-1)
+
+    def compile(self, paths):
+        """
+        Decode and save each sound file in 'paths' not already saved.
+        Return number of files decoded.
+        """
+        numDecoded = 0
+
+        if self.directory is None:
+            return numDecoded
+
+        for path in set(paths):
+            if not os.path.exists(self.get_cache_path(path)):
+                self._decode_and_save(path)
+                numDecoded += 1
+
+        return numDecoded
+
+    def get_cache_path(self, path):
+        """
+        Return path of the file holding samples for sound file 'path' in
+        the mixer's current format. The file may not exist yet.
+        """
+        digest = self._hash_file(path)
+        freq, size, channels = pygame.mixer.get_init()
+        name = '{0}-{1}-{2}-{3}.pcm'.format(digest, freq, size, channels)
+
+        return os.path.join(self.directory, name)
+
+    def get_samples(self, path):
+        """
+        Return raw samples of sound file 'path' in the mixer's current
+        format, as a read-only mmap of the saved samples if they exist,
+        or else a string (saving the samples for next time).
+        """
+        if self.directory is None:
+            return _decode(path)
+
+        cachePath = self.get_cache_path(path)
+
+        try:
+            with open(cachePath, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ''
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError):
+            return self._decode_and_save(path, cachePath)
+
+    def _decode_and_save(self, path, cachePath=None):
+        """
+        Decode sound file 'path,' save its samples, and return them.
+        Failure to save is ignored; the samples are still returned.
+        """
+        samples = _decode(path)
+        cachePath = cachePath or self.get_cache_path(path)
+
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+
+            # Write to a temporary file first, so other processes never
+            # see a partly written cache file.
+            fd, tmpPath = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(samples)
+            os.chmod(tmpPath, 0644)
+
+            try:
+                os.rename(tmpPath, cachePath)
+            except OSError:
+                # On Windows, another process may have saved it first
+                os.remove(tmpPath)
+        except (IOError, OSError):
+            pass
+
+        return samples
+
+    def _hash_file(self, path):
+        """
+        Return hex SHA-1 of the contents of file at 'path.' A file is read
+        again only if its modification time or size has changed.
+        """
+        st = os.stat(path)
+        cached = self._fileHashes.get(path)
+
+        if cached is None or cached[:2] != (st.st_mtime, st.st_size):
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+            cached = self._fileHashes[path] = (st.st_mtime, st.st_size,
+                                               digest)
+
+        return cached[2]
+
+###############################################################################
+def _decode(path):
+    """
+    Return raw samples of sound file 'path' in the mixer's format.
+    pygame can only decode a file into a Sound, so one is made and
+    discarded here.
+    """
+    return pygame.mixer.Sound(path).get_raw()
+
+###############################################################################
+pcm = PCMCache(AUDIO_CACHE_DIR and os.path.join(ROOT_PATH, AUDIO_CACHE_DIR))
+
+if __name__ == '__main__':
+    # Decode all game sounds into the cache
+    from resmaps import CLUE_READS, SOUNDS
+
+    # Decode to the format the game's mixer will use
+    profile = MIXER_PROFILES[MIXER_PROFILE]
+    pygame.mixer.init(profile['frequency'], -16, 2, profile['buffer'])
+    n = pcm.compile(SOUNDS.values() + CLUE_READS.values())
+    print '%d sound file(s) decoded into %s' % (n, pcm.directory)
@@ -0,0 +1,214 @@
+"""
+rendercache.py
+
+DESCRIPTION:
+  Contains the RenderCache class, described below, and the process-wide
+  cache in which resized images and other expensive, unchanging drawings
+  are saved between runs.
+
+USAGE:
+  Build a key from everything a drawing depends on (using hash_file for
+  any file it is drawn from), then call renders.get(key). If it returns
+  None, draw the surface and save it with renders.put(key, surface).
+  Surfaces returned by get() are not yet converted to the display's pixel
+  format; callers should call convert() or convert_alpha() on them.
+
+  Start the game with --rebuild-cache to discard all saved drawings.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import hashlib
+import os
+import tempfile
+
+import pygame
+from pygame.locals import SRCALPHA
+
+from config import RENDER_CACHE_BYTES, RENDER_CACHE_DIR
+from ..constants import ROOT_PATH
+
+# Part of every key. Increase this whenever a change to the drawing code
+# would make previously saved drawings wrong.
+RENDER_VERSION = 1
+
+# When the cache grows past its limit, files are removed until it holds
+# no more than this fraction of the limit, so it is not pruned again at
+# every put.
+_PRUNE_TO = 0.75
+
+###############################################################################
+class RenderCache(object):
+    """
+    Keeps drawn surfaces in files under 'directory,' named by the SHA-1 of
+    their key, with their pixels stored as by pygame.image.tostring.
+
+    A saved surface is found again only if every part of its key is
+    unchanged: keys should include the contents' hashes (see hash_file) of
+    the files it was drawn from and every size, string, or setting it
+    depends on. Stale files are never found, and are removed as the least
+    recently used once the directory holds more than 'maxBytes.' The
+    directory's size is found once, at the first put, and then kept up to
+    date as files are saved, so a put does not read the whole directory.
+
+    If 'directory' is None, nothing is saved and get() always returns None.
+
+    ATTRIBUTES:
+      * directory
+      * maxBytes
+
+    METHODS:
+      * clear
+      * get
+      * hash_file
+      * put
+    """
+    def __init__(self, directory, maxBytes):
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self._fileHashes = {}
+        self._totalBytes = None  # Size of directory, once known
+
+    def clear(self):
+        """Delete every saved surface."""
+        for path in self._get_files():
+            _remove(path)
+
+        self._totalBytes = 0
+
+    def get(self, key):
+        """
+        Return unconverted surface saved under 'key,' or None if there
+        is none.
+        """
+        if self.directory is None:
+            return None
+
+        path = self._get_path(key)
+
+        try:
+            with open(path, 'rb') as f:
+                w, h, fmt = f.readline().split()
+                img = pygame.image.fromstring(f.read(), (int(w), int(h)), fmt)
+
+            # Mark as recently used, for pruning
+            os.utime(path, None)
+        except (IOError, OSError, ValueError, pygame.error):
+            return None
+
+        return img
+
+    def hash_file(self, path):
+        """
+        Return hex SHA-1 of the contents of file at 'path,' for use in keys.
+        Each file is read once per run.
+        """
+        if path not in self._fileHashes:
+            with open(path, 'rb') as f:
+                self._fileHashes[path] = hashlib.sha1(f.read()).hexdigest()
+
+        return self._fileHashes[path]
+
+    def put(self, key, sfc):
+        """
+        Save surface 'sfc' under 'key,' keeping its per-pixel alpha if
+        it has any. Failure to save is ignored.
+        """
+        if self.directory is None:
+            return
+
+        fmt = 'RGBA' if sfc.get_flags() & SRCALPHA else 'RGB'
+        path = self._get_path(key)
+
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+
+            # Write to a temporary file first, so other processes never
+            # see a partly written cache file.
+            fd, tmpPath = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write('{0} {1} {2}\n'.format(sfc.get_width(),
+                                               sfc.get_height(), fmt))
+                f.write(pygame.image.tostring(sfc, fmt))
+                size = f.tell()
+            os.chmod(tmpPath, 0644)
+
+            replaced = _get_size(path)
+            try:
+                os.rename(tmpPath, path)
+            except OSError:
+                # On Windows, another process may have saved it first
+                os.remove(tmpPath)
+                return
+        except (IOError, OSError):
+            return
+
+        if self._totalBytes is None:
+            self._totalBytes = sum(_get_size(p) for p in self._get_files())
+        else:
+            self._totalBytes += size - replaced
+
+        if self._totalBytes > self.maxBytes:
+            self._prune()
+
+    def _get_files(self):
+        """Return list of paths of all files in the cache directory."""
+        if self.directory is None or not os.path.isdir(self.directory):
+            return []
+
+        return [os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)]
+
+    def _get_path(self, key):
+        digest = hashlib.sha1(repr((RENDER_VERSION, ) + key)).hexdigest()
+
+        return os.path.join(self.directory, digest + '.img')
+
+    def _prune(self):
+        """
+        Remove least recently used files until the directory holds no
+        more than _PRUNE_TO of 'maxBytes.'
+        """
+        files = []
+        for path in self._get_files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in sorted(files):
+            if total <= _PRUNE_TO * self.maxBytes:
+                break
+            _remove(path)
+            total -= size
+
+        self._totalBytes = total
+
+###############################################################################
+def _get_size(path):
+    """Return size of file at 'path,' or 0 if there is none."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+###############################################################################
+renders = RenderCache(
+    RENDER_CACHE_DIR and os.path.join(ROOT_PATH, RENDER_CACHE_DIR),
+    RENDER_CACHE_BYTES)
@@ -161,3 +161,24 @@ SOUNDS.update({'intro'     : _sndPath + 'intro.ogg',
           'end'       : _sndPath + 'end.ogg',
           'applause'  : _sndPath + 'applause.wav'
           })
+
+###############################################################################
+def use_game_media(media):
+    """
+    Replace the clue media in IMAGES, SOUNDS, and CLUE_READS with those in
+    'media,' a dict mapping each of those names to a dict of
+    (column, row) -> path. Named resources (e.g. 'intro') are kept.
+    """
+    for kind, resMap in (('IMAGES', IMAGES), ('SOUNDS', SOUNDS),
+                         ('CLUE_READS', CLUE_READS)):
+        for key in [k for k in resMap if isinstance(k, tuple)]:
+            del resMap[key]
+
+        resMap.update(media[kind])
+
+def use_pack_media(pack, directory):
+    """
+    Replace the clue media in IMAGES, SOUNDS, and CLUE_READS with those of
+    game pack 'pack' (see game/gamepack.py), extracted to 'directory.'
+    """
+    use_game_media(pack.extract_media(directory))
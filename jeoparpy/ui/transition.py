@@ -0,0 +1,188 @@
+"""
+transition.py
+
+DESCRIPTION:
+  Functions implementing full- or part-screen transitions from one image
+  to another: fade, cross_dissolve, dip_to_color, and wipe.
+
+  Each transition takes 'time' in seconds and runs for that long no matter
+  the frame rate, and only the area of the screen being transitioned is
+  updated. Blending is done with surface alpha blits, or, if
+  TRANSITION_NUMPY is set in config.py and NumPy is available, on whole
+  pixel arrays with pygame.surfarray.
+
+USAGE:
+  Like the other scene functions, each transition takes control of the
+  application until it finishes. Surfaces passed in are not altered.
+
+
+Copyright (C) 2013 Adam Beagle - All Rights Reserved
+You may use, distribute, and modify this code under
+the terms of the GNU General Public License,
+viewable at http://opensource.org/licenses/GPL-3.0
+
+This copyright notice must be retained with any use
+of source code from this file.
+"""
+import pygame
+from pygame.locals import SRCALPHA
+
+from config import TRANSITION_NUMPY
+from util import ease_linear
+from ..config import FPS_LIMIT
+
+numpy = None
+if TRANSITION_NUMPY:
+    try:
+        import numpy
+        from pygame import surfarray
+    except ImportError:
+        pass
+
+###############################################################################
+def cross_dissolve(screen, src, dst, time, pos=(0, 0), easing=ease_linear):
+    """
+    Blend from 'src' to 'dst' over 'time' seconds, drawing both at 'pos'
+    on 'screen.' The surfaces must be the same size.
+    """
+    rect = pygame.Rect(pos, dst.get_size())
+    target = screen.subsurface(rect)
+    blender = _Blender(src, dst)
+
+    def draw_frame(progress):
+        blender.draw(target, progress)
+        return rect
+
+    _run(time, easing, draw_frame)
+
+def dip_to_color(screen, dst, color, time, pos=(0, 0), easing=ease_linear):
+    """
+    Fade the area of 'screen' at 'pos' the size of 'dst' to a solid
+    'color,' then fade from that color to 'dst.' Each half takes half
+    of 'time' seconds.
+    """
+    mid = pygame.Surface(dst.get_size())
+    mid.fill(color)
+
+    fade(screen, mid, time / 2.0, pos, easing)
+    cross_dissolve(screen, mid, dst, time / 2.0, pos, easing)
+
+def fade(screen, sfc, time, pos=(0, 0), easing=ease_linear):
+    """
+    Fade in 'sfc' at 'pos' over whatever is currently on 'screen' there,
+    over 'time' seconds.
+    """
+    rect = pygame.Rect(pos, sfc.get_size())
+    src = screen.subsurface(rect).copy()
+
+    cross_dissolve(screen, src, sfc, time, pos, easing)
+
+def wipe(screen, dst, time, direction='right', pos=(0, 0),
+         easing=ease_linear):
+    """
+    Reveal 'dst' at 'pos' on 'screen' over 'time' seconds behind an edge
+    moving in 'direction': 'left,' 'right,' 'up,' or 'down.' Only the
+    newly revealed strip is drawn and updated each frame.
+    """
+    w, h = dst.get_size()
+    # Returns area of dst revealed from its leading edge up to 'n' pixels
+    areas = {
+        'right': lambda n: pygame.Rect(0, 0, n, h),
+        'left': lambda n: pygame.Rect(w - n, 0, n, h),
+        'down': lambda n: pygame.Rect(0, 0, w, n),
+        'up': lambda n: pygame.Rect(0, h - n, w, n),
+    }
+    try:
+        get_area = areas[direction]
+    except KeyError:
+        raise ValueError("direction must be one of " + ', '.join(areas))
+
+    length = w if direction in ('left', 'right') else h
+    revealed = [get_area(0)]
+
+    def draw_frame(progress):
+        area = get_area(int(round(progress * length)))
+        strip = _get_new_strip(revealed[0], area)
+        revealed[0] = area
+
+        if not strip.w or not strip.h:
+            return []
+
+        screen.blit(dst, strip.move(pos), strip)
+        return strip.move(pos)
+
+    _run(time, easing, draw_frame)
+
+###############################################################################
+class _Blender(object):
+    """
+    Draws a blend of two same-sized surfaces onto a target surface.
+    Per-pixel alpha of 'dst' is respected by first compositing it over
+    'src.'
+    """
+    def __init__(self, src, dst):
+        if src.get_size() != dst.get_size():
+            raise ValueError('src and dst must be the same size')
+
+        if dst.get_flags() & SRCALPHA:
+            flat = src.copy()
+            flat.blit(dst, (0, 0))
+            dst = flat
+
+        if numpy:
+            self._src = surfarray.array3d(src).astype(numpy.int32)
+            self._diff = surfarray.array3d(dst).astype(numpy.int32)
+            self._diff -= self._src
+            # Each frame is blended in these, so no arrays are allocated
+            self._work = numpy.empty_like(self._diff)
+            self._out = numpy.empty(self._diff.shape, numpy.uint8)
+        else:
+            self._src = src
+            self._dst = dst.copy()
+
+    def draw(self, target, progress):
+        """Draw blend that is fraction 'progress' of the way to dst."""
+        alpha = int(round(256 * progress))
+
+        if numpy:
+            numpy.multiply(self._diff, alpha, out=self._work)
+            self._work >>= 8
+            self._work += self._src
+            self._out[...] = self._work
+            surfarray.blit_array(target, self._out)
+        else:
+            target.blit(self._src, (0, 0))
+            self._dst.set_alpha(min(alpha, 255))
+            target.blit(self._dst, (0, 0))
+
+###############################################################################
+def _get_new_strip(old, new):
+    """
+    Return Rect of the part of Rect 'new' not covered by Rect 'old,'
+    where both share the edge a wipe starts from and 'new' contains 'old.'
+    """
+    if new.w != old.w:
+        x = old.right if new.x == old.x else new.x
+        return pygame.Rect(x, new.y, new.w - old.w, new.h)
+    else:
+        y = old.bottom if new.y == old.y else new.y
+        return pygame.Rect(new.x, y, new.w, new.h - old.h)
+
+def _run(time, easing, draw_frame):
+    """
+    Call 'draw_frame' once per frame with progress through 'time' seconds,
+    passed through 'easing,' until progress reaches 1. 'draw_frame'
+    returns the area(s) of the screen to update.
+    """
+    clock = pygame.time.Clock()
+    ms = int(1000 * time)
+    start = pygame.time.get_ticks()
+    t = 0.0
+
+    while t < 1:
+        elapsed = pygame.time.get_ticks() - start
+        t = min(1.0, float(elapsed) / ms) if ms > 0 else 1.0
+
+        pygame.display.update(draw_frame(easing(t)))
+        pygame.event.pump()
+        clock.tick(FPS_LIMIT)
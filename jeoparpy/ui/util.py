@@ -17,7 +17,17 @@ import sys
 import pygame
 from pygame.locals import *
 
-from ..util import to_numeric
+from config import TEXT_CACHE_BYTES
+from fontregistry import get_font
+from ..util import LRUCache, to_numeric
+
+# Rendered width of words, keyed by (fontPath, size, word)
+_wordWidths = LRUCache(8192)
+
+# Rendered text surfaces, keyed by (font, text, color, antialias, background)
+# See render_text.
+textCache = LRUCache(TEXT_CACHE_BYTES,
+                     lambda sfc: sfc.get_pitch() * sfc.get_height())
 
 ###############################################################################
 class _Size(tuple):
@@ -68,33 +78,47 @@ def autofit_text(fontPath, fontSize, text, bounds, spacing=0):
     """
     Fit a length of text into a block whose size is defined by 'bounds'.
     Lines of text will contain as many words as will fit the width of
-    'bounds' when rendered with font defined by fontPath and fontSize.
-    The font size of the entire block is then scaled to guarantee the block's
-    height fits within that of bounds.
+    'bounds' when rendered with font defined by fontPath. The largest
+    font size <= fontSize at which the wrapped block fits within bounds
+    is found by binary search, rewrapping the words at each size tried.
 
     Return lines of text to render and the pygame.font.Font object with
     which to render them. It is recommended to then call one of the
     draw_textblock functions in this module with the returned values.
     """
-    lines = []
     words = text.split(' ')
-    font = pygame.font.Font(fontPath, fontSize)
+    bounds = _Size(bounds)
+    wrapped = {}
 
-    # Create lines; lines contain as many words as will fit within width
-    # of bounds.
-    while words:
-        line = words.pop(0)
-        while (words and
-               font.size(line)[0] + font.size(' ' + words[0])[0] <= bounds[0]):
-            line += ' ' + words.pop(0)
-            
-        lines.append(line)
+    def fits(size):
+        font = get_font(fontPath, size)
+        lines = wrapped[size] = _wrap_words(words,
+                                            _get_word_widths(fontPath, size,
+                                                             words),
+                                            font.size(' ')[0], bounds[0])
 
-    # Call restrict_fontsize again to guarantee height of textblock defined
-    # by lines does not exceed height of bounds.
-    fontSize = restrict_fontsize(fontPath, fontSize, lines, bounds, spacing)
+        return _Size(get_size_textblock(lines, font, spacing)) < bounds
 
-    return (lines, pygame.font.Font(fontPath, fontSize))
+    fontSize = _get_largest_fitting_size(fits, fontSize)
+    if fontSize not in wrapped:
+        fits(fontSize)
+
+    return (wrapped[fontSize], get_font(fontPath, fontSize))
+
+def blit_areas(dst, src, pos, areas):
+    """
+    Blit only the given 'areas' of surface 'src' (Rects relative to src)
+    onto 'dst,' with src's top left at 'pos.'
+    Return list of the Rects drawn, relative to dst.
+    """
+    drawn = []
+
+    for area in areas:
+        rect = pygame.Rect(area).move(pos)
+        dst.blit(src, rect, area)
+        drawn.append(rect)
+
+    return drawn
 
 def draw_centered_textblock(sfc, lines, font, color, spacing=0,
                             shadowOffset=None, textAlignCenter=True):
@@ -145,15 +169,27 @@ def draw_textline(sfc, text, font, color, rect, shadowOffset=None):
     Blit text in 'text' onto surface 'sfc.'
     Use position of 'rect' (top left) to position blit.
     """
-    s = text
-    doShadow = shadowOffset is not None
-    text = font.render(s, 1, color)
-
-    if doShadow:
-        shadow, shadRect = shadow_text(s, rect, font, shadowOffset)
+    if shadowOffset is not None:
+        shadow, shadRect = shadow_text(text, rect, font, shadowOffset)
         sfc.blit(shadow, shadRect)
 
-    sfc.blit(text, rect)
+    sfc.blit(render_text(font, text, color), rect)
+
+def ease_in_out(t):
+    """
+    Easing function; starts and ends slowly. 't' is the fraction of an
+    animation's time elapsed, in [0, 1], and the fraction of its distance
+    to have covered is returned (as with all ease_* functions).
+    """
+    return t * t * (3 - 2*t)
+
+def ease_linear(t):
+    """Easing function; constant speed. See ease_in_out."""
+    return t
+
+def ease_out(t):
+    """Easing function; starts quickly and slows to a stop. See ease_in_out."""
+    return 1 - (1 - t)**2
 
 def fit_image(img, bounds):
     """
@@ -220,12 +256,52 @@ def restrict_fontsize(fontPath, size, lines, bounds, spacing=0):
     'spacing' is the amount of space in pixels between each line.
     """
     bounds = _Size(bounds)
-    while not _Size(get_size_textblock(lines,
-                                       pygame.font.Font(fontPath, size),
-                                       spacing)) < bounds:
-        size -= 1
 
-    return size
+    def fits(size):
+        return _Size(get_size_textblock(lines, get_font(fontPath, size),
+                                        spacing)) < bounds
+
+    return _get_largest_fitting_size(fits, size)
+
+def merge_rects(rects):
+    """
+    Return list of pygame.Rects covering the same area as 'rects,' in
+    which every group of overlapping rects is replaced by their union.
+    """
+    merged = []
+
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+
+        merged.append(rect)
+
+    return merged
+
+def render_text(font, text, color, antialias=1, background=None):
+    """
+    Return surface of 'text' rendered with 'font,' as font.render would.
+
+    Rendered surfaces are cached in textCache, so repeated text costs only
+    a lookup. The returned surface is shared and must not be altered
+    (e.g. with set_alpha or by blitting onto it); copy it first if needed.
+    """
+    key = (font, text, tuple(color), antialias,
+           background if background is None else tuple(background))
+    rendered = textCache.get(key)
+
+    if rendered is None:
+        if background is None:
+            rendered = font.render(text, antialias, color)
+        else:
+            rendered = font.render(text, antialias, color, background)
+        textCache.put(key, rendered)
+
+    return rendered
 
 def scale(n, rel, comp):
     return int(n * (rel / float(comp)))
@@ -235,8 +311,11 @@ def shadow_text(msg, srcRect, font, offset, color=(0, 0, 0)):
     Return surface and rect of shadowed text.
     Shadow is positioned 'offset' pixels right and down from srcRect.
     'msg' is string to shadow.
+
+    The returned surface is shared (see render_text) and must not be
+    altered.
     """
-    shadText = font.render(msg, 1, color)
+    shadText = render_text(font, msg, color)
     rect = shadText.get_rect()
 
     rect.x = srcRect.x + offset
@@ -244,6 +323,20 @@ def shadow_text(msg, srcRect, font, offset, color=(0, 0, 0)):
     
     return shadText, rect
 
+def wait_for_event(eventType):
+    """
+    Return control when an event of 'eventType' is received, sleeping
+    until then. Other events received meanwhile are discarded, except
+    QUIT, which exits.
+    """
+    while True:
+        event = pygame.event.wait()
+
+        if event.type == eventType:
+            return
+        elif event.type == QUIT:
+            sys.exit()
+
 def wait_for_keypress(key=None):
     """
     By default, return control when any key is pressed.
@@ -265,6 +358,70 @@ def wait_for_keypress(key=None):
                 sys.exit()
 
         pygame.event.pump()
+
+def _get_largest_fitting_size(fits, maxSize):
+    """
+    Return largest font size in range [1, maxSize] for which fits(size)
+    returns True, assuming any size smaller than a fitting size also fits.
+    Return 1 if no size fits.
+    """
+    if fits(maxSize):
+        return maxSize
+    
+    low, high = 1, maxSize - 1
+    while low < high:
+        mid = (low + high + 1) / 2
+        if fits(mid):
+            low = mid
+        else:
+            high = mid - 1
+
+    return low
+
+def _get_word_widths(fontPath, size, words):
+    """
+    Return list of the rendered widths of 'words' in font given by
+    fontPath and size. Each word is measured once per font and size;
+    later calls are answered from _wordWidths.
+    """
+    font = None
+    widths = []
+
+    for word in words:
+        key = (fontPath, size, word)
+        w = _wordWidths.get(key)
+
+        if w is None:
+            if font is None:
+                font = get_font(fontPath, size)
+            w = font.size(word)[0]
+            _wordWidths.put(key, w)
+
+        widths.append(w)
+
+    return widths
+
+def _wrap_words(words, widths, spaceW, maxW):
+    """
+    Return list of lines built from 'words,' each containing as many
+    words as fit within 'maxW.' 'widths' are the words' rendered widths
+    and 'spaceW' is the width of a space, in the same font.
+    """
+    lines = []
+    start = 0
+    lineW = widths[0]
+
+    for i in xrange(1, len(words)):
+        if lineW + spaceW + widths[i] <= maxW:
+            lineW += spaceW + widths[i]
+        else:
+            lines.append(' '.join(words[start:i]))
+            start = i
+            lineW = widths[i]
+
+    lines.append(' '.join(words[start:]))
+
+    return lines
         
 ###############################################################################
 class BorderedBox(pygame.Surface):
@@ -16,8 +16,136 @@ viewable at http://opensource.org/licenses/GPL-3.0
 This copyright notice must be retained with any use
 of source code from this file.
 """
+from collections import OrderedDict
 from decimal import Decimal
 
+###############################################################################
+class LRUCache(object):
+    """
+    A dictionary-like cache holding at most 'capacity' units of data.
+    When an insertion exceeds the capacity, the least recently used
+    entries are discarded until the cache fits again.
+
+    By default each entry counts as one unit. If 'sizeof' is provided,
+    it is called with each stored value and must return that value's
+    size in whatever unit 'capacity' is measured in (e.g. bytes).
+
+    If 'canEvict' is provided, it is called with a stored value before
+    that value is evicted, and the entry is kept if it returns False. The
+    cache may then hold more than 'capacity' until such entries can be
+    evicted, which is checked again on the next put().
+
+    Lookups made with get() are counted as hits or misses; 'in' checks
+    are not counted and do not affect recency.
+
+    ATTRIBUTES:
+      * capacity
+      * hitRate (read-only)
+      * hits (read-only)
+      * misses (read-only)
+      * size (read-only)
+
+    METHODS:
+      * clear
+      * discard
+      * get
+      * put
+    """
+    def __init__(self, capacity, sizeof=None, canEvict=None):
+        self.capacity = capacity
+        self._sizeof = sizeof if sizeof else (lambda val: 1)
+        self._canEvict = canEvict
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries. Hit and miss counts are kept."""
+        self._entries.clear()
+        self._size = 0
+
+    def discard(self, key):
+        """Remove entry 'key' if it exists."""
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[1]
+
+    def get(self, key, default=None):
+        """
+        Return value stored at 'key' and mark it most recently used,
+        or return 'default' if 'key' is not in the cache.
+        """
+        try:
+            entry = self._entries.pop(key)
+        except KeyError:
+            self._misses += 1
+            return default
+
+        self._entries[key] = entry
+        self._hits += 1
+
+        return entry[0]
+
+    def put(self, key, value):
+        """
+        Store 'value' at 'key' as the most recently used entry, evicting
+        older entries as needed. A value larger than the entire capacity
+        is not stored.
+        """
+        self.discard(key)
+        size = self._sizeof(value)
+
+        if size > self.capacity:
+            return
+
+        self._entries[key] = (value, size)
+        self._size += size
+        
+        if self._canEvict is None:
+            while self._size > self.capacity:
+                self._size -= self._entries.popitem(last=False)[1][1]
+        elif self._size > self.capacity:
+            self._evict_allowed(key)
+
+    def _evict_allowed(self, newKey):
+        """
+        Evict least recently used entries that 'canEvict' allows, other
+        than 'newKey,' until the cache fits within capacity.
+        """
+        for key, (value, size) in self._entries.items():
+            if self._size <= self.capacity:
+                break
+            if key != newKey and self._canEvict(value):
+                del self._entries[key]
+                self._size -= size
+
+    @property
+    def hitRate(self):
+        """Fraction of get() calls that were hits; 0.0 if none made."""
+        total = self._hits + self._misses
+        
+        return float(self._hits) / total if total else 0.0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def size(self):
+        return self._size
+
+###############################################################################
+
 
 def chunker(sequence, size, overlap=False):
     """
@@ -10,6 +10,9 @@ USAGE:
   To invoke the game with an option defined below, for example -w and
   --debug, use `python start.py -w --debug'
 
+  To play a game pack (see jeoparpy/game/gamepack.py), pass its path,
+  e.g. `python start.py -f mygame.jpk'
+
   To define a new option:
     1) Create a new constant in constants.py. Best practice is to 
        incrememnt the value by 1 for each new flag. 
@@ -29,21 +32,25 @@ viewable at http://opensource.org/licenses/GPL-3.0
 This copyright notice must be retained with any use
 of source code from this file.
 """
+from os import path
 from sys import argv
 
 from jeoparpy import config
-from jeoparpy.constants import (DEBUG_FLAG, FULLSCREEN_FLAG, SKIP_INTRO_FLAG, 
-    WINDOWED_FLAG)
+from jeoparpy.constants import (DEBUG_FLAG, FULLSCREEN_FLAG,
+    REBUILD_CACHE_FLAG, SKIP_INTRO_FLAG, TIME_STARTUP_FLAG, WINDOWED_FLAG)
 
 optionsMap = {
-    '-d'           : DEBUG_FLAG,
-    '--debug'      : DEBUG_FLAG,
-    '-f'           : FULLSCREEN_FLAG,
-    '--fullscreen' : FULLSCREEN_FLAG,
-    '-s'           : SKIP_INTRO_FLAG,
-    '--skip-intro' : SKIP_INTRO_FLAG,
-    '-w'           : WINDOWED_FLAG,
-    '--windowed'   : WINDOWED_FLAG,
+    '-d'              : DEBUG_FLAG,
+    '--debug'         : DEBUG_FLAG,
+    '-f'              : FULLSCREEN_FLAG,
+    '--fullscreen'    : FULLSCREEN_FLAG,
+    '--rebuild-cache' : REBUILD_CACHE_FLAG,
+    '-s'              : SKIP_INTRO_FLAG,
+    '--skip-intro'    : SKIP_INTRO_FLAG,
+    '-t'              : TIME_STARTUP_FLAG,
+    '--time-startup'  : TIME_STARTUP_FLAG,
+    '-w'              : WINDOWED_FLAG,
+    '--windowed'      : WINDOWED_FLAG,
 }
 
 if __name__ == '__main__':
@@ -56,6 +63,11 @@ if __name__ == '__main__':
         config.FULLSCREEN = 0
     if DEBUG_FLAG in flags:
         config.DEBUG = 1
+
+    # Game pack, if given (extension as in game/gamepack.py)
+    for arg in argv[1:]:
+        if arg.endswith('.jpk'):
+            config.GAME_PACK = path.abspath(arg)
     
     # main MUST be imported here, or config options may be imported
     # (via 'from config import X') prior to being overridden by argv 
@@ -0,0 +1,114 @@
+import pytest
+
+from jeoparpy.game import GameData
+from jeoparpy.game.cluebank import ClueBank, ClueBankError
+
+@pytest.fixture
+def bank(tmpdir):
+    """ClueBank with 2 clues per difficulty in 3 categories, and a board"""
+    bank = ClueBank(str(tmpdir.join('bank.db')))
+    bank.add_clues((cat, d, ('%s %d %d' % (cat, d, n), 'line 2'))
+                   for cat in ('A', 'B', 'C')
+                   for d in (1, 2)
+                   for n in (0, 1))
+    bank.add_clues([('B', 1, ('B with image', ), 'img.png')])
+    bank.add_board('AB', ('A', 'B'), (100, 200))
+    yield bank
+    bank.close()
+
+def test_build_board(bank, tmpdir):
+    categories, clues, amounts, media = bank.build_board('AB')
+    assert categories == ('A', 'B')
+    assert amounts == (100, 200)
+    assert clues[0] == (('A 1 0', 'line 2'), ('A 2 0', 'line 2'))
+    assert clues[1][1] == ('B 2 0', 'line 2')
+    assert media['IMAGES'] == {}
+
+def test_least_recently_used(bank, tmpdir):
+    first = bank.build_board('AB')[1]
+    second = bank.build_board('AB')[1]
+    assert second[0] == (('A 1 1', 'line 2'), ('A 2 1', 'line 2'))
+
+    # A's clues have all been used, so its least recently used come back.
+    # The clue with an image is the last unused one of B, difficulty 1.
+    third = bank.build_board('AB')
+    assert third[1][0] == first[0]
+    assert third[1][1][0] == ('B with image', )
+    assert third[3]['IMAGES'] == {(1, 0): str(tmpdir.join('img.png'))}
+
+def test_errors(bank):
+    with pytest.raises(ClueBankError):
+        bank.build_board('missing')
+    with pytest.raises(ClueBankError):
+        bank.add_board('bad', ('A', 'Z'), (100, ))
+
+    bank.add_board('deep', ('A', ), (100, 200, 300))
+    with pytest.raises(ClueBankError):
+        bank.build_board('deep')
+
+def test_rollback(bank):
+    def clues():
+        yield ('New', 1, ('New clue', ))
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        bank.add_clues(clues())
+    with pytest.raises(ClueBankError):
+        bank.add_board('new', ('New', ), (100, ))
+
+    bank.add_clues([('New', 1, ('New clue', ))])
+    bank.add_board('new', ('New', ), (100, ))
+    assert bank.build_board('new')[:2] == (('New', ), ((('New clue', ), ), ))
+
+def test_gamedata(bank):
+    gameData = GameData(bankPath=bank.path, board='AB')
+    assert gameData.categories == ('A', 'B')
+    assert gameData.amounts == (100, 200)
+    assert len(gameData.clues[1]) == 2
+    assert gameData.pack is None
+    assert len(gameData.players) == 3
+
+def test_generate_board(bank):
+    categories, clues, amounts, media = bank.generate_board(
+        3, (100, 200), seed=1, markUsed=False)
+    assert sorted(categories) == ['A', 'B', 'C']
+    assert amounts == (100, 200)
+    for name, column in zip(categories, clues):
+        assert column[0][0].startswith(name + ' 1')
+        assert column[1][0].startswith(name + ' 2')
+
+    # Same seed, same board
+    assert bank.generate_board(3, (100, 200), seed=1)[:2] == (categories,
+                                                              clues)
+
+def test_generate_board_sessions(bank):
+    first = bank.generate_board(3, (100, 200), seed=2, sessions=1)
+    second = bank.generate_board(3, (100, 200), seed=2, sessions=1)
+    firstClues = set(c for column in first[1] for c in column)
+    secondClues = set(c for column in second[1] for c in column)
+    assert not firstClues & secondClues
+
+    # Only B has a clue (of difficulty 1) not used in the last 2 sessions
+    with pytest.raises(ClueBankError):
+        bank.generate_board(1, (100, 200), sessions=2)
+    categories, clues = bank.generate_board(1, (100, ), sessions=2)[:2]
+    assert categories == ('B', )
+    assert clues[0][0] not in firstClues | secondClues
+
+def test_gamedata_generated(tmpdir):
+    path = str(tmpdir.join('bank.db'))
+    bank = ClueBank(path)
+    bank.add_clues((str(c), d, ('clue', )) for c in xrange(8)
+                   for d in xrange(1, 6))
+    bank.close()
+
+    gameData = GameData(bankPath=path, seed=3)
+    assert len(gameData.categories) == 5
+    assert len(set(gameData.categories)) == 5
+    assert len(gameData.clues[0]) == len(gameData.amounts)
+
+def test_gamedata_no_bank(tmpdir):
+    path = tmpdir.join('missing.db')
+    with pytest.raises(ClueBankError):
+        GameData(bankPath=str(path))
+    assert not path.check()
@@ -0,0 +1,44 @@
+import pytest
+
+from jeoparpy.game.cluefile import ClueFile, ClueFileError
+
+TEXT = ('FIRST CLUE\n'
+        '\n'
+        '  SECOND CLUE  \r\n'
+        'ON TWO LINES\n'
+        ' \t\n'
+        '\n'
+        'THIRD CLUE\n'
+        '\n'
+        'FOURTH CLUE')
+
+@pytest.fixture
+def clues(tmpdir):
+    path = tmpdir.join('clues.txt')
+    path.write(TEXT)
+    return ClueFile(str(path))
+
+def test_read(clues):
+    assert len(clues) == 4
+    assert clues[0] == ('FIRST CLUE', )
+    assert clues[1] == ('SECOND CLUE', 'ON TWO LINES')
+    assert clues[-1] == ('FOURTH CLUE', )
+    assert list(clues)[2] == ('THIRD CLUE', )
+
+    with pytest.raises(IndexError):
+        clues[4]
+
+def test_get_board(clues):
+    board = clues.get_board(2)
+    assert len(board) == 2
+    assert [len(c) for c in board] == [2, 2]
+    assert board[1][0] == ('THIRD CLUE', )
+    assert list(board[0]) == [clues[0], clues[1]]
+
+def test_ragged(clues):
+    with pytest.raises(ClueFileError) as err:
+        clues.get_board(3)
+    assert 'multiple of 3 (e.g. 3 or 6)' in str(err.value)
+
+    with pytest.raises(ClueFileError):
+        clues.get_board(5)
@@ -0,0 +1,120 @@
+import sqlite3
+
+import pytest
+
+from jeoparpy.game.cluebank import ClueBank
+from jeoparpy.game.clueimport import ClueImportError, import_clues
+
+CSV = ('Air Date,Round,Category,Value,Clue,Answer\n'
+       '2010-05-03,Jeopardy!,"PLACES, ETC.",$200,"A ""quoted""\n'
+       'clue",an answer\n'
+       '2010-05-03,Double Jeopardy!,SCIENCE,"$1,200",Clue 2,answer\n'
+       '2010-05-03,Double Jeopardy!,SCIENCE,"$1,300",Daily double,answer\n'
+       '2010-05-03,Final Jeopardy!,SCIENCE,,Final clue,answer\n'
+       '1999-01-01,Jeopardy!,PLACES,$500,Old clue,answer\n')
+
+TSV = ('1\tHISTORY\t400\tClue a\tanswer\t2012-01-01\n'
+       '2\tHISTORY\t2000\tClue b\tanswer\t2012-01-01\n'
+       '3\tHISTORY\t\tClue c\tanswer\t2012-01-01\n'
+       '1\tPOETRY\t200\tA "poem"\tanswer\t2012-01-01\n')
+
+def get_clues(bank):
+    conn = sqlite3.connect(bank.path)
+    clues = conn.execute('SELECT c.name, difficulty, text FROM clues '
+                         'JOIN categories AS c ON c.id = category_id '
+                         'ORDER BY clues.id').fetchall()
+    conn.close()
+
+    return [tuple(str(x) if isinstance(x, unicode) else x for x in c)
+            for c in clues]
+
+@pytest.fixture
+def bank(tmpdir):
+    bank = ClueBank(str(tmpdir.join('bank.db')))
+    yield bank
+    bank.close()
+
+def test_csv(bank, tmpdir):
+    dump = tmpdir.join('dump.csv')
+    dump.write(CSV)
+
+    assert import_clues(str(dump), bank, jobs=1) == (3, 2)
+    assert get_clues(bank) == [('PLACES, ETC.', 1, 'A "quoted" clue'),
+                               ('SCIENCE', 3, 'Clue 2'),
+                               ('PLACES', 5, 'Old clue')]
+
+def test_tsv_pool(bank, tmpdir):
+    dump = tmpdir.join('dump.tsv')
+    dump.write(TSV)
+
+    assert import_clues(str(dump), bank, jobs=2, batchSize=1) == (3, 1)
+    assert get_clues(bank) == [('HISTORY', 2, 'Clue a'),
+                               ('HISTORY', 5, 'Clue b'),
+                               ('POETRY', 1, 'A "poem"')]
+
+def test_bad_record(bank, tmpdir):
+    dump = tmpdir.join('dump.tsv')
+    lines = TSV.splitlines(True)
+    dump.write(lines[0] + '1\tHISTORY\t200\tNUL \0 byte\tanswer\n' +
+               ''.join(lines[1:]))
+
+    # Only the bad record is lost, not the rest of its batch
+    assert import_clues(str(dump), bank, jobs=1) == (3, 2)
+    assert len(get_clues(bank)) == 3
+
+def test_stray_quote(bank, tmpdir):
+    dump = tmpdir.join('dump.csv')
+    dump.write('Jeopardy!,TECH,$200,A 5" floppy disk,answer,2010-01-01\n' +
+               ''.join('Jeopardy!,TECH,$400,Clue %d,answer,2010-01-01\n' % i
+                       for i in xrange(1000)))
+    batches = []
+
+    def count_batch(offset, size, added, skipped):
+        batches.append(offset)
+
+    # The stray quote does not join the records after it into one batch
+    assert import_clues(str(dump), bank, jobs=1, batchSize=10,
+                        progress=count_batch) == (1001, 0)
+    assert len(batches) == 101
+
+def test_resume(bank, tmpdir):
+    dump = tmpdir.join('dump.tsv')
+    dump.write(TSV)
+
+    def interrupt(offset, size, added, skipped):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        import_clues(str(dump), bank, jobs=1, batchSize=2,
+                     progress=interrupt)
+    assert len(get_clues(bank)) == 2
+
+    assert import_clues(str(dump), bank, jobs=1, batchSize=2) == (1, 1)
+    assert import_clues(str(dump), bank, jobs=1) == (0, 0)
+    assert len(get_clues(bank)) == 3
+
+    # A changed file is read again, adding only its new clues
+    dump.write(TSV + '1\tHISTORY\t600\tClue d\tanswer\t2012-01-01\n')
+    assert import_clues(str(dump), bank, jobs=1) == (1, 4)
+    assert len(get_clues(bank)) == 4
+    assert len(set(get_clues(bank))) == 4
+
+def test_missing_column(bank, tmpdir):
+    dump = tmpdir.join('dump.csv')
+    dump.write('round,category,clue\nJeopardy!,A,Clue\n')
+
+    with pytest.raises(ClueImportError):
+        import_clues(str(dump), bank, jobs=1)
+
+def test_batch_bytes(tmpdir):
+    from jeoparpy.game.clueimport import _read_chunks
+
+    line = 'Jeopardy!,TECH,$400,Clue,answer,2010-01-01\n'
+    dump = tmpdir.join('dump.csv')
+    dump.write(line * 100)
+
+    with open(str(dump), 'rb') as f:
+        chunks = list(_read_chunks(f, 1000, ',', maxBytes=10 * len(line)))
+    assert [end for _, end in chunks] == [10 * len(line) * (i + 1)
+                                          for i in xrange(10)]
+    assert ''.join(data for data, _ in chunks) == line * 100
@@ -0,0 +1,97 @@
+import pytest
+
+from jeoparpy.game import GameData
+from jeoparpy.game.gamepack import compile_pack, GamePack
+
+CLUES = ((('Clue 0 0', 'second line'), ('Clue 0 1', )),
+         (('Clue 1 0', ), ('Clue 1 1', )))
+
+@pytest.fixture
+def pack(tmpdir):
+    """Path to a 2x2 game pack whose clue (1, 0) has an image"""
+    img = tmpdir.join('img.png')
+    img.write('not really a png')
+    path = str(tmpdir.join('game.jpk'))
+
+    compile_pack(path, ('Cat A', 'Cat B'), CLUES, (100, 200),
+                 ('Ann', 'Bob', 'Cy'),
+                 {'IMAGES': {(1, 0): str(img)}, 'CLUE_READS': {}})
+    return path
+
+def test_read(pack):
+    p = GamePack(pack)
+    assert p.categories == ('Cat A', 'Cat B')
+    assert p.clues == CLUES
+    assert p.amounts == (100, 200)
+    assert p.players == ('Ann', 'Bob', 'Cy')
+    assert p.get_media('IMAGES', (1, 0)) == 'not really a png'
+    assert p.get_media('IMAGES', (0, 0)) is None
+    assert p.get_media_coords('IMAGES') == [(1, 0)]
+    p.close()
+
+def test_extract_media(pack, tmpdir):
+    p = GamePack(pack)
+    media = p.extract_media(str(tmpdir.join('media')))
+    assert media['SOUNDS'] == {}
+
+    path = media['IMAGES'][(1, 0)]
+    assert path.endswith('.png')
+    with open(path, 'rb') as f:
+        assert f.read() == 'not really a png'
+
+    assert p.extract_media(str(tmpdir.join('media'))) == media
+    p.close()
+
+def test_gamedata(pack):
+    gameData = GameData(pack)
+    assert gameData.categories == ('Cat A', 'Cat B')
+    assert gameData.clues == CLUES
+    assert [pl.name for pl in gameData.players] == ['Ann', 'Bob', 'Cy']
+    assert gameData.pack.path == pack
+
+def test_not_a_pack(tmpdir):
+    path = tmpdir.join('game.jpk')
+    path.write('JEOPARDY' + 'x' * 20)
+
+    with pytest.raises(ValueError):
+        GamePack(str(path))
+
+def rewrite_index(path, change):
+    """Rewrite the index of the pack at 'path' after calling change(index)"""
+    import json
+    from jeoparpy.game.gamepack import _header
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, indexLen = _header.unpack_from(data, 0)
+    start = _header.size
+    index = json.loads(data[start:start + indexLen])
+    change(index)
+    indexText = json.dumps(index)
+
+    with open(path, 'wb') as f:
+        f.write(_header.pack(magic, version, len(indexText)))
+        f.write(indexText + data[start + indexLen:])
+
+@pytest.mark.parametrize('change', [
+    lambda i: i['media'][0].update(sha1='x', ext='/../../escaped.txt'),
+    lambda i: i['media'][0].update(sha1='', ext='/tmp/escaped.txt'),
+    lambda i: i['media'][0].update(ext='.png/../../x'),
+    lambda i: i['media'][0]['span'].__setitem__(1, 10**6),
+    lambda i: i['clues'][0].__setitem__(0, -1),
+    lambda i: i.update(shape=[2, 0]),
+])
+def test_bad_index(pack, change):
+    rewrite_index(pack, change)
+
+    with pytest.raises(ValueError):
+        GamePack(pack)
+
+def test_bad_media_hash(pack, tmpdir):
+    rewrite_index(pack, lambda i: i['media'][0].update(sha1='0' * 40))
+    p = GamePack(pack)
+
+    with pytest.raises(ValueError):
+        p.extract_media(str(tmpdir.join('media')))
+    assert not tmpdir.join('media').listdir()
+    p.close()
@@ -0,0 +1,62 @@
+import os
+
+import pygame
+from pygame.locals import SRCALPHA
+
+from jeoparpy.ui.rendercache import RenderCache
+
+def make_sfc(color, size=(4, 3), flags=0):
+    sfc = pygame.Surface(size, flags, 32)
+    sfc.fill(color)
+    return sfc
+
+def test_get_put(tmpdir):
+    cache = RenderCache(str(tmpdir), 1024)
+    assert cache.get(('a', 1)) is None
+
+    cache.put(('a', 1), make_sfc((200, 100, 50)))
+    img = cache.get(('a', 1))
+    assert img.get_size() == (4, 3)
+    assert img.get_at((3, 2))[:3] == (200, 100, 50)
+    assert cache.get(('a', 2)) is None
+
+def test_keeps_alpha(tmpdir):
+    cache = RenderCache(str(tmpdir), 1024)
+    cache.put(('a', ), make_sfc((1, 2, 3, 40), flags=SRCALPHA))
+
+    img = cache.get(('a', ))
+    assert img.get_flags() & SRCALPHA
+    assert img.get_at((0, 0)) == (1, 2, 3, 40)
+
+def test_prune_and_clear(tmpdir):
+    # Each 4x3 RGB surface takes 36 bytes plus an 8-byte header. The third
+    # goes past the limit, so the oldest is removed to get under 3/4 of it.
+    cache = RenderCache(str(tmpdir), 120)
+    cache.put(('a', ), make_sfc((0, 0, 0)))
+    os.utime(cache._get_path(('a', )), (0, 0))
+    cache.put(('b', ), make_sfc((0, 0, 0)))
+    cache.put(('c', ), make_sfc((0, 0, 0)))
+
+    assert cache.get(('a', )) is None
+    assert cache.get(('b', )) is not None
+    assert cache.get(('c', )) is not None
+
+    cache.clear()
+    assert cache.get(('c', )) is None
+    assert not tmpdir.listdir()
+
+def test_put_lists_directory_once(tmpdir, monkeypatch):
+    cache = RenderCache(str(tmpdir), 1024 * 1024)
+    listings = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, 'listdir', lambda d: listings.append(d) or
+                        listdir(d))
+
+    for i in xrange(20):
+        cache.put(('a', i), make_sfc((0, 0, 0)))
+    assert len(listings) == 1
+
+def test_no_directory():
+    cache = RenderCache(None, 1024)
+    cache.put(('a', ), make_sfc((0, 0, 0)))
+    assert cache.get(('a', )) is None
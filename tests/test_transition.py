@@ -0,0 +1,56 @@
+import pygame
+import pytest
+
+from jeoparpy.ui import transition
+from jeoparpy.ui.transition import _Blender, _get_new_strip
+
+@pytest.fixture(params=['numpy', 'set_alpha'])
+def blend_path(request, monkeypatch):
+    """Run test with both the NumPy and fallback blending paths"""
+    if request.param == 'numpy':
+        numpy = pytest.importorskip('numpy')
+        from pygame import surfarray
+        monkeypatch.setattr(transition, 'numpy', numpy)
+        monkeypatch.setattr(transition, 'surfarray', surfarray, raising=False)
+    else:
+        monkeypatch.setattr(transition, 'numpy', None)
+
+def make_sfc(color, size=(4, 3)):
+    sfc = pygame.Surface(size, 0, 32)
+    sfc.fill(color)
+    return sfc
+
+def test_blend(blend_path):
+    src = make_sfc((0, 0, 0))
+    dst = make_sfc((200, 100, 50))
+    target = make_sfc((1, 2, 3))
+    blender = _Blender(src, dst)
+
+    blender.draw(target, 0)
+    assert target.get_at((0, 0))[:3] == (0, 0, 0)
+
+    blender.draw(target, 0.5)
+    for got, want in zip(target.get_at((3, 2))[:3], (100, 50, 25)):
+        assert abs(got - want) <= 1
+
+    blender.draw(target, 1)
+    assert target.get_at((0, 0))[:3] == (200, 100, 50)
+
+    # dst is left as it was
+    assert dst.get_alpha() is None
+
+def test_blend_size_mismatch():
+    with pytest.raises(ValueError):
+        _Blender(make_sfc((0, 0, 0)), make_sfc((0, 0, 0), (3, 3)))
+
+def test_new_strip():
+    R = pygame.Rect
+    # Wipe right, then left
+    assert _get_new_strip(R(0, 0, 2, 5), R(0, 0, 6, 5)) == R(2, 0, 4, 5)
+    assert _get_new_strip(R(8, 0, 2, 5), R(4, 0, 6, 5)) == R(4, 0, 4, 5)
+    # Wipe down, then up
+    assert _get_new_strip(R(0, 0, 5, 2), R(0, 0, 5, 6)) == R(0, 2, 5, 4)
+    assert _get_new_strip(R(0, 8, 5, 2), R(0, 4, 5, 6)) == R(0, 4, 5, 4)
+    # No progress
+    strip = _get_new_strip(R(0, 0, 2, 5), R(0, 0, 2, 5))
+    assert strip.w * strip.h == 0
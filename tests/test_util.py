@@ -0,0 +1,95 @@
+import pytest
+
+from jeoparpy.util import LRUCache
+
+@pytest.fixture
+def cache():
+    """LRUCache fixture holding 3 entries"""
+    return LRUCache(3)
+
+def test_get_put(cache):
+    assert cache.get('a') is None
+    assert cache.get('a', 5) == 5
+
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert 'a' in cache
+    assert len(cache) == 1
+
+    cache.put('a', 2)
+    assert cache.get('a') == 2
+    assert len(cache) == 1
+
+def test_eviction_order(cache):
+    for key in 'abc':
+        cache.put(key, key.upper())
+
+    # Touch 'a' so 'b' becomes least recently used
+    cache.get('a')
+    cache.put('d', 'D')
+
+    assert 'b' not in cache
+    assert 'a' in cache
+    assert 'c' in cache
+    assert 'd' in cache
+    assert len(cache) == 3
+
+def test_sizeof():
+    cache = LRUCache(10, len)
+    cache.put('a', 'xxxx')
+    cache.put('b', 'xxxx')
+    assert cache.size == 8
+
+    cache.put('c', 'xxxx')
+    assert 'a' not in cache
+    assert cache.size == 8
+
+    # Values larger than capacity are not stored
+    cache.put('d', 11*'x')
+    assert 'd' not in cache
+    assert cache.size == 8
+
+    cache.discard('b')
+    assert cache.size == 4
+
+    cache.clear()
+    assert cache.size == 0
+    assert len(cache) == 0
+
+def test_stats(cache):
+    assert cache.hitRate == 0.0
+
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    # Membership checks are not counted
+    'b' in cache
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert cache.hitRate == pytest.approx(2 / 3.0)
+
+def test_can_evict():
+    pinned = set(['a'])
+    cache = LRUCache(2, canEvict=lambda val: val not in pinned)
+    cache.put('a', 'a')
+    cache.put('b', 'b')
+    cache.put('c', 'c')
+
+    # 'a' is least recently used but pinned, so 'b' goes instead
+    assert 'a' in cache
+    assert 'b' not in cache
+
+    # With everything else pinned, cache grows past capacity
+    pinned.add('c')
+    cache.put('d', 'd')
+    assert len(cache) == 3
+
+    # Once unpinned, entries are evicted on the next put
+    pinned.clear()
+    cache.put('e', 'e')
+    assert len(cache) == 2
+    assert 'd' in cache
+    assert 'e' in cache